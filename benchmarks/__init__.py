@@ -0,0 +1,7 @@
+"""
+Offline benchmarks for The Herald.
+
+The benchmarks run the newsletter and event-reminder paths against local
+stand-ins for the Discord API, RSS feeds and DynamoDB, so hot paths can be
+measured and tracked for regressions without touching live services.
+"""
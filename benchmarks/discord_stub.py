@@ -0,0 +1,435 @@
+"""
+Local stand-in for the Discord REST API.
+
+Serves the channel, message, scheduled-event, user and DM endpoints used by
+DiscordService, and enforces per-route and global rate limits with the same
+X-RateLimit-* headers and 429 responses as Discord.
+"""
+
+import itertools
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlsplit
+
+_sleep = time.sleep
+
+API_PREFIX = "/api/v10"
+
+# Error returned by Discord when a user does not accept DMs from the bot
+CANNOT_DM_CODE = 50007
+
+
+class RateLimitWindow:
+    """Fixed-window request counter for one rate-limit bucket."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.started_at = 0.0
+        self.count = 0
+
+    def hit(self, now: float) -> Optional[float]:
+        """
+        Count a request against the window.
+
+        Args:
+            now: Current epoch time
+
+        Returns:
+            None if the request is allowed, otherwise seconds until the reset
+        """
+        if now - self.started_at >= self.window:
+            self.started_at = now
+            self.count = 0
+        if self.count >= self.limit:
+            return self.started_at + self.window - now
+        self.count += 1
+        return None
+
+    def reset_after(self, now: float) -> float:
+        """Seconds until the current window resets."""
+        return max(self.started_at + self.window - now, 0.0)
+
+
+class DiscordStub:
+    """
+    In-memory Discord guild served over HTTP.
+
+    Attributes:
+        guild_id: ID of the stub guild
+        channels: Channel objects by channel ID
+        messages: Messages by channel ID, newest first
+        events: Scheduled event objects
+        event_users: Scheduled event user objects by event ID
+        closed_dm_users: User IDs that reject DMs with error 50007
+        request_counts: Requests served, by route name
+        rate_limited_counts: 429 responses sent, by route name
+    """
+
+    def __init__(
+        self,
+        route_limit: int = 5,
+        route_window: float = 1.0,
+        global_limit: int = 50,
+        latency: float = 0.0,
+    ):
+        """
+        Initialize the stub.
+
+        Args:
+            route_limit: Requests allowed per route bucket per window
+            route_window: Length of a route bucket window in seconds
+            global_limit: Requests allowed per second across all routes
+            latency: Artificial delay in seconds added to every response
+        """
+        self._ids = itertools.count(100000000000000000)
+        self.guild_id = self.next_id()
+        self.channels: Dict[str, dict] = {}
+        self.messages: Dict[str, List[dict]] = {}
+        self.events: List[dict] = []
+        self.event_users: Dict[str, List[dict]] = {}
+        self.dm_channels: Dict[str, str] = {}
+        self.closed_dm_users: Set[str] = set()
+
+        self.route_limit = route_limit
+        self.route_window = route_window
+        self.global_window = RateLimitWindow(global_limit, 1.0)
+        self.latency = latency
+        self._buckets: Dict[str, RateLimitWindow] = {}
+
+        self.request_counts: Counter = Counter()
+        self.rate_limited_counts: Counter = Counter()
+        self.lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def next_id(self) -> str:
+        """Generate a snowflake-sized ID."""
+        return str(next(self._ids))
+
+    # ------------------------------------------------------------------
+    # Fixtures
+    # ------------------------------------------------------------------
+
+    def add_channel(self, name: str) -> str:
+        """Create a text channel and return its ID."""
+        channel_id = self.next_id()
+        self.channels[channel_id] = {
+            "id": channel_id,
+            "name": name,
+            "type": 0,
+            "guild_id": self.guild_id,
+            "last_message_id": None,
+        }
+        self.messages[channel_id] = []
+        return channel_id
+
+    def add_event(self, name: str, start_time: str, user_count: int) -> str:
+        """Create a scheduled event with user_count subscribers and return its ID."""
+        event_id = self.next_id()
+        self.events.append(
+            {
+                "id": event_id,
+                "guild_id": self.guild_id,
+                "name": name,
+                "scheduled_start_time": start_time,
+            }
+        )
+        self.event_users[event_id] = [
+            {
+                "guild_scheduled_event_id": event_id,
+                "user": {"id": user_id, "username": f"user{user_id}"},
+            }
+            for user_id in (self.next_id() for _ in range(user_count))
+        ]
+        return event_id
+
+    def reset_counters(self) -> None:
+        """Clear request and 429 counters."""
+        with self.lock:
+            self.request_counts.clear()
+            self.rate_limited_counts.clear()
+
+    # ------------------------------------------------------------------
+    # Server lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the stub API, equivalent to https://discord.com/api/v10."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "DiscordStub":
+        """Start serving on a free local port in a background thread."""
+        stub = self
+
+        class Handler(_DiscordRequestHandler):
+            state = stub
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+
+    def check_rate_limit(self, bucket_key: str, route_name: str):
+        """
+        Apply global and per-route rate limits to a request.
+
+        Args:
+            bucket_key: Route bucket (route name plus major parameter)
+            route_name: Route name used for counters
+
+        Returns:
+            Tuple of (status, headers, body) for a 429 response, or
+            (None, headers, None) with rate-limit headers if allowed
+        """
+        now = time.time()
+        with self.lock:
+            self.request_counts[route_name] += 1
+
+            global_wait = self.global_window.hit(now)
+            if global_wait is not None:
+                self.rate_limited_counts[route_name] += 1
+                return (
+                    429,
+                    {
+                        "Retry-After": f"{global_wait:.3f}",
+                        "X-RateLimit-Global": "true",
+                        "X-RateLimit-Scope": "global",
+                    },
+                    {
+                        "message": "You are being rate limited.",
+                        "retry_after": global_wait,
+                        "global": True,
+                    },
+                )
+
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                bucket = RateLimitWindow(self.route_limit, self.route_window)
+                self._buckets[bucket_key] = bucket
+
+            wait = bucket.hit(now)
+            headers = {
+                "X-RateLimit-Limit": str(bucket.limit),
+                "X-RateLimit-Remaining": str(max(bucket.limit - bucket.count, 0)),
+                "X-RateLimit-Reset": f"{bucket.started_at + bucket.window:.3f}",
+                "X-RateLimit-Reset-After": f"{bucket.reset_after(now):.3f}",
+                "X-RateLimit-Bucket": route_name,
+            }
+            if wait is not None:
+                self.rate_limited_counts[route_name] += 1
+                headers.update(
+                    {"Retry-After": f"{wait:.3f}", "X-RateLimit-Scope": "user"}
+                )
+                return (
+                    429,
+                    headers,
+                    {
+                        "message": "You are being rate limited.",
+                        "retry_after": wait,
+                        "global": False,
+                    },
+                )
+
+            return None, headers, None
+
+    # ------------------------------------------------------------------
+    # Routes
+    # ------------------------------------------------------------------
+
+    def route(self, method: str, path: str):
+        """
+        Find the endpoint for a request.
+
+        Returns:
+            Tuple of (route name, bucket key, handler, path parameters),
+            all None if no endpoint matches
+        """
+        for route_method, pattern, name, handler in ROUTES:
+            if method != route_method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                major = match.group(1)
+                return name, f"{name}:{major}", handler, match.groups()
+        return None, None, None, None
+
+    def list_guild_channels(self, guild_id, query, body):
+        return 200, list(self.channels.values())
+
+    def list_messages(self, channel_id, query, body):
+        if channel_id not in self.messages:
+            return 404, {"message": "Unknown Channel", "code": 10003}
+        limit = min(int(query.get("limit", ["50"])[0]), 100)
+        messages = self.messages[channel_id]
+        if "after" in query:
+            after = int(query["after"][0])
+            # Discord returns the messages closest to the cursor
+            newer = [m for m in messages if int(m["id"]) > after]
+            return 200, newer[-limit:]
+        return 200, messages[:limit]
+
+    def create_message(self, channel_id, query, body):
+        if channel_id not in self.messages:
+            return 404, {"message": "Unknown Channel", "code": 10003}
+        recipient = self.channels.get(channel_id, {}).get("recipient_id")
+        if recipient in self.closed_dm_users:
+            return 403, {
+                "message": "Cannot send messages to this user",
+                "code": CANNOT_DM_CODE,
+            }
+        message = {
+            "id": self.next_id(),
+            "channel_id": channel_id,
+            "content": (body or {}).get("content", ""),
+            "embeds": (body or {}).get("embeds", []),
+        }
+        with self.lock:
+            self.messages[channel_id].insert(0, message)
+            self.channels[channel_id]["last_message_id"] = message["id"]
+        return 200, message
+
+    def list_events(self, guild_id, query, body):
+        return 200, self.events
+
+    def list_event_users(self, guild_id, event_id, query, body):
+        users = self.event_users.get(event_id)
+        if users is None:
+            return 404, {"message": "Unknown Guild Scheduled Event", "code": 10070}
+        limit = min(int(query.get("limit", ["100"])[0]), 100)
+        if "after" in query:
+            after = int(query["after"][0])
+            users = [u for u in users if int(u["user"]["id"]) > after]
+        return 200, users[:limit]
+
+    def create_dm(self, _major, query, body):
+        recipient_id = str((body or {}).get("recipient_id", ""))
+        with self.lock:
+            channel_id = self.dm_channels.get(recipient_id)
+            if channel_id is None:
+                channel_id = self.next_id()
+                self.dm_channels[recipient_id] = channel_id
+                self.channels[channel_id] = {
+                    "id": channel_id,
+                    "type": 1,
+                    "recipient_id": recipient_id,
+                    "last_message_id": None,
+                }
+                self.messages[channel_id] = []
+        return 200, {"id": channel_id, "type": 1}
+
+
+ROUTES = [
+    (
+        "GET",
+        re.compile(r"/guilds/(\d+)/channels"),
+        "list_guild_channels",
+        DiscordStub.list_guild_channels,
+    ),
+    (
+        "GET",
+        re.compile(r"/channels/(\d+)/messages"),
+        "list_messages",
+        DiscordStub.list_messages,
+    ),
+    (
+        "POST",
+        re.compile(r"/channels/(\d+)/messages"),
+        "create_message",
+        DiscordStub.create_message,
+    ),
+    (
+        "GET",
+        re.compile(r"/guilds/(\d+)/scheduled-events"),
+        "list_events",
+        DiscordStub.list_events,
+    ),
+    (
+        "GET",
+        re.compile(r"/guilds/(\d+)/scheduled-events/(\d+)/users"),
+        "list_event_users",
+        DiscordStub.list_event_users,
+    ),
+    (
+        "POST",
+        re.compile(r"/users/(@me)/channels"),
+        "create_dm",
+        DiscordStub.create_dm,
+    ),
+]
+
+
+class _DiscordRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that forwards requests to a DiscordStub."""
+
+    state: DiscordStub = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging."""
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        path = parts.path
+        query = parse_qs(parts.query)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        if self.state.latency:
+            # Bound at import so benchmark sleep accounting does not count it
+            _sleep(self.state.latency)
+
+        if not path.startswith(API_PREFIX):
+            self._send(404, {}, {"message": "404: Not Found", "code": 0})
+            return
+        path = path[len(API_PREFIX) :]
+
+        route_name, bucket_key, handler, groups = self.state.route(method, path)
+        if handler is None:
+            self._send(404, {}, {"message": "404: Not Found", "code": 0})
+            return
+
+        if self.headers.get("Authorization", "").split(" ")[0] != "Bot":
+            self._send(401, {}, {"message": "401: Unauthorized", "code": 0})
+            return
+
+        status, headers, error = self.state.check_rate_limit(bucket_key, route_name)
+        if status is not None:
+            self._send(status, headers, error)
+            return
+
+        status, payload = handler(self.state, *groups, query, body)
+        self._send(status, headers, payload)
+
+    def _send(self, status: int, headers: dict, payload) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
@@ -0,0 +1,203 @@
+"""
+Local stand-in for the DynamoDB reminder table.
+
+Implements the subset of the low-level boto3 DynamoDB client API used by
+DynamoDBClient, and counts calls so benchmarks can report DynamoDB traffic.
+"""
+
+import operator
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+from clients.dynamodb import DynamoDBClient
+
+_COMPARISONS = {"=": operator.eq, "<": operator.lt, ">": operator.gt}
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _to_python(values: Optional[dict]) -> dict:
+    return {
+        name: _deserializer.deserialize(value) for name, value in (values or {}).items()
+    }
+
+
+def _to_dynamodb(item: dict) -> dict:
+    return {name: _serializer.serialize(value) for name, value in item.items()}
+
+
+def _condition_holds(
+    item: Optional[dict], expression: str, names: dict, values: dict
+) -> bool:
+    """
+    Evaluate the condition expressions DynamoDBClient writes: clauses of the
+    form attribute_not_exists(name) or "#name <op> :value", joined by OR.
+    """
+    for clause in expression.split(" OR "):
+        clause = clause.strip()
+        if clause.startswith("attribute_not_exists("):
+            name = clause[len("attribute_not_exists(") : -1]
+            if item is None or names.get(name, name) not in item:
+                return True
+            continue
+        name, op, value = clause.split()
+        attribute = names.get(name, name)
+        if item is not None and attribute in item:
+            if _COMPARISONS[op](item[attribute], values[value]):
+                return True
+    return False
+
+
+def _conditional_check_failed(operation: str) -> ClientError:
+    return ClientError(
+        {
+            "Error": {
+                "Code": "ConditionalCheckFailedException",
+                "Message": "The conditional request failed",
+            }
+        },
+        operation,
+    )
+
+
+# Items per Query page, far below DynamoDB's 1 MB page so paging is exercised
+QUERY_PAGE_SIZE = 100
+
+
+class InMemoryDynamoDB:
+    """
+    In-memory stand-in for the low-level DynamoDB client, serving the main
+    table keyed by reminder_key and, optionally, the partitioned reminders
+    table keyed by pk and sk.
+
+    Attributes:
+        tables: Stored items of each table by key, as Python values
+        call_counts: Calls made, by operation name
+    """
+
+    def __init__(self, table_name: str, reminders_table_name: str = None):
+        self.table_name = table_name
+        self.key_names: Dict[str, Tuple[str, ...]] = {table_name: ("reminder_key",)}
+        if reminders_table_name:
+            self.key_names[reminders_table_name] = ("pk", "sk")
+        self.tables: Dict[str, Dict[tuple, dict]] = {
+            name: {} for name in self.key_names
+        }
+        self.call_counts: Counter = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def items(self) -> Dict[tuple, dict]:
+        """Items of the main table."""
+        return self.tables[self.table_name]
+
+    def _item_key(self, table_name: str, item: dict) -> tuple:
+        return tuple(
+            (
+                _deserializer.deserialize(item[name])
+                if isinstance(item[name], dict)
+                else item[name]
+            )
+            for name in self.key_names[table_name]
+        )
+
+    def _check(self, table_name: str, key: tuple, operation: str, kwargs: dict) -> None:
+        expression = kwargs.get("ConditionExpression")
+        if expression and not _condition_holds(
+            self.tables[table_name].get(key),
+            expression,
+            kwargs.get("ExpressionAttributeNames") or {},
+            _to_python(kwargs.get("ExpressionAttributeValues")),
+        ):
+            raise _conditional_check_failed(operation)
+
+    def get_item(self, TableName: str, Key: dict) -> dict:
+        with self.lock:
+            self.call_counts["GetItem"] += 1
+            item = self.tables[TableName].get(self._item_key(TableName, Key))
+        return {"Item": _to_dynamodb(item)} if item else {}
+
+    def put_item(self, TableName: str, Item: dict, **kwargs) -> dict:
+        item = _to_python(Item)
+        key = self._item_key(TableName, item)
+        with self.lock:
+            self.call_counts["PutItem"] += 1
+            self._check(TableName, key, "PutItem", kwargs)
+            self.tables[TableName][key] = item
+        return {}
+
+    def delete_item(self, TableName: str, Key: dict, **kwargs) -> dict:
+        key = self._item_key(TableName, Key)
+        with self.lock:
+            self.call_counts["DeleteItem"] += 1
+            self._check(TableName, key, "DeleteItem", kwargs)
+            self.tables[TableName].pop(key, None)
+        return {}
+
+    def batch_get_item(self, RequestItems: dict) -> dict:
+        request = RequestItems[self.table_name]
+        with self.lock:
+            self.call_counts["BatchGetItem"] += 1
+            found = [
+                _to_dynamodb(self.items[self._item_key(self.table_name, key)])
+                for key in request["Keys"]
+                if self._item_key(self.table_name, key) in self.items
+            ]
+        return {"Responses": {self.table_name: found}, "UnprocessedKeys": {}}
+
+    def query(self, TableName: str, ExpressionAttributeValues: dict, **kwargs) -> dict:
+        """Read one partition (KeyConditionExpression "pk = :pk") in sk order."""
+        partition = _to_python(ExpressionAttributeValues)[":pk"]
+        after = kwargs.get("ExclusiveStartKey")
+        after = self._item_key(TableName, after) if after else None
+        with self.lock:
+            self.call_counts["Query"] += 1
+            keys = sorted(
+                key
+                for key in self.tables[TableName]
+                if key[0] == partition and (after is None or key > after)
+            )
+            page = [self.tables[TableName][key] for key in keys[:QUERY_PAGE_SIZE]]
+
+        response = {"Items": [_to_dynamodb(item) for item in page]}
+        if len(keys) > QUERY_PAGE_SIZE:
+            last = page[-1]
+            response["LastEvaluatedKey"] = _to_dynamodb(
+                {"pk": last["pk"], "sk": last["sk"]}
+            )
+        return response
+
+
+class InMemoryDynamoDBClient(DynamoDBClient):
+    """DynamoDBClient backed by InMemoryDynamoDB instead of AWS."""
+
+    def __init__(
+        self,
+        table_name: str = "herald-benchmark",
+        reminders_table_name: str = None,
+        legacy_reads: bool = True,
+    ):
+        """
+        Initialize the client without creating a boto3 client.
+
+        Args:
+            table_name: Name reported for the in-memory table
+            reminders_table_name: Name of an in-memory partitioned reminders
+                                  table (default: None, flat layout)
+            legacy_reads: Also check the main table for reminders missing from
+                          the partitioned table (default: True)
+        """
+        self.table_name = table_name
+        self.reminders_table_name = reminders_table_name
+        self.legacy_reads = legacy_reads
+        self.client = InMemoryDynamoDB(table_name, reminders_table_name)
+
+    @property
+    def call_counts(self) -> Counter:
+        """Calls made against the tables, by operation name."""
+        return self.client.call_counts
@@ -0,0 +1,142 @@
+"""
+Local stand-in for RSS feeds.
+
+Serves generated RSS 2.0 feeds whose items are all published today, so every
+item passes the newsletter's date filter.
+"""
+
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "breach patch ransomware exploit botnet phishing cloud kernel firmware "
+    "router zero-day malware supply-chain token leak vendor outage audit "
+    "browser update backdoor campaign wiper spyware credential api bug "
+    "payment crypto wallet market chip startup funding acquisition model"
+).split()
+
+
+class RssStub:
+    """
+    RSS feeds served over HTTP.
+
+    Attributes:
+        feed_count: Number of feeds served at /feeds/<index>.xml
+        articles_per_feed: Number of items in each feed
+        request_count: Feed requests served
+    """
+
+    def __init__(self, feed_count: int, articles_per_feed: int, seed: int = 42):
+        """
+        Initialize the stub.
+
+        Args:
+            feed_count: Number of feeds to serve
+            articles_per_feed: Number of items in each feed
+            seed: Seed for generated titles
+        """
+        self.feed_count = feed_count
+        self.articles_per_feed = articles_per_feed
+        self.seed = seed
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the stub server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_url(self, index: int) -> str:
+        """URL of the feed with the given index."""
+        return f"{self.base_url}/feeds/{index}.xml"
+
+    def start(self) -> "RssStub":
+        """Start serving on a free local port in a background thread."""
+        stub = self
+
+        class Handler(_RssRequestHandler):
+            state = stub
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def render_feed(self, index: int) -> str:
+        """
+        Render the RSS document for a feed.
+
+        Links carry utm_* parameters, as many real feeds do, so the
+        canonicalization path is exercised.
+        """
+        rng = random.Random(self.seed * 100003 + index)
+        # Publish a few minutes in the past so items stay on today's date
+        now = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
+        now += timedelta(minutes=min(index, 59))
+
+        items = []
+        for item in range(self.articles_per_feed):
+            title = " ".join(rng.sample(WORDS, 6)).capitalize()
+            link = (
+                f"{self.base_url}/articles/{index}/{item}"
+                f"?utm_source=rss&utm_medium=feed{index}"
+            )
+            published = (now + timedelta(seconds=item)).strftime(
+                "%a, %d %b %Y %H:%M:%S +0000"
+            )
+            items.append(
+                "<item>"
+                f"<title>{escape(title)}</title>"
+                f"<link>{escape(link)}</link>"
+                f"<pubDate>{published}</pubDate>"
+                f"<description>{escape(title)} - benchmark summary.</description>"
+                "</item>"
+            )
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            f"<title>Benchmark Feed {index}</title>"
+            f"<link>{self.base_url}/</link>"
+            "<description>Generated benchmark feed</description>"
+            f"{''.join(items)}"
+            "</channel></rss>"
+        )
+
+
+class _RssRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that renders feeds from an RssStub."""
+
+    state: RssStub = None
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging."""
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if not (path.startswith("/feeds/") and path.endswith(".xml")):
+            self.send_error(404)
+            return
+
+        index = int(path[len("/feeds/") : -len(".xml")])
+        with self.state.lock:
+            self.state.request_count += 1
+
+        data = self.state.render_feed(index).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
@@ -0,0 +1,278 @@
+"""
+Run the offline benchmarks.
+
+Starts the local Discord, RSS and DynamoDB stand-ins, runs the newsletter and
+event-reminder paths against them and reports wall time, request counts,
+rate-limit hits and time spent sleeping.
+
+Run from the repository root:
+    python -m benchmarks.run --feeds 100 --rsvps 1000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lambda" / "app"))
+
+# pylint: disable=wrong-import-position
+from models import ChannelConfig, Feed, FeedsConfig
+from services.discord import DiscordService
+from services.newsletter import NewsletterService
+
+from benchmarks.discord_stub import DiscordStub
+from benchmarks.dynamodb_stub import InMemoryDynamoDBClient
+from benchmarks.rss_stub import RssStub
+
+
+class StaticParameterStore:
+    """Parameter Store stand-in returning fixed Discord credentials."""
+
+    def __init__(self, guild_id: str):
+        self.guild_id = guild_id
+
+    def get_discord_token(self) -> str:
+        return "benchmark-token"
+
+    def get_guild_id(self) -> str:
+        return self.guild_id
+
+
+class SleepRecorder:
+    """
+    Wraps time.sleep and asyncio.sleep to total the time the code under test
+    spends sleeping. Sleeps of concurrent tasks are summed, so the total can
+    exceed the wall time.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.calls = 0
+        self._sleep = time.sleep
+        self._async_sleep = asyncio.sleep
+        self._lock = threading.Lock()
+
+    def _record(self, seconds: float) -> None:
+        with self._lock:
+            self.total += seconds
+            self.calls += 1
+
+    def __call__(self, seconds: float) -> None:
+        self._record(seconds)
+        self._sleep(seconds)
+
+    async def async_sleep(self, seconds: float, *args, **kwargs):
+        self._record(seconds)
+        return await self._async_sleep(seconds, *args, **kwargs)
+
+
+@contextmanager
+def discord_routed_to(stub: DiscordStub):
+    """Point every DiscordService created in the block at the local stub."""
+    with patch.dict(os.environ, {"DISCORD_API_BASE_URL": stub.base_url}):
+        yield
+
+
+@contextmanager
+def measure(name: str, discord: DiscordStub, dynamodb, rss: RssStub, results: list):
+    """Time a scenario and record the traffic it generated."""
+    discord.reset_counters()
+    dynamodb.call_counts.clear()
+    rss_before = rss.request_count
+    recorder = SleepRecorder()
+    extra = {}
+
+    start = time.perf_counter()
+    with patch("time.sleep", recorder), patch("asyncio.sleep", recorder.async_sleep):
+        yield extra
+    wall = time.perf_counter() - start
+
+    result = {
+        "scenario": name,
+        "wall_seconds": round(wall, 3),
+        "sleep_seconds": round(recorder.total, 3),
+        "sleep_calls": recorder.calls,
+        "discord_requests": sum(discord.request_counts.values()),
+        "discord_requests_by_route": dict(discord.request_counts),
+        "discord_429s": sum(discord.rate_limited_counts.values()),
+        "dynamodb_calls": dict(dynamodb.call_counts),
+        "rss_requests": rss.request_count - rss_before,
+    }
+    result.update(extra)
+    results.append(result)
+
+
+def build_feeds_config(rss: RssStub, channel_names: list, digest: bool) -> FeedsConfig:
+    """Spread the stub feeds evenly across the benchmark channels."""
+    feeds = [
+        Feed(
+            name=f"Benchmark Feed {index}",
+            url=rss.feed_url(index),
+            channel_name=channel_names[index % len(channel_names)],
+        )
+        for index in range(rss.feed_count)
+    ]
+    channels = [ChannelConfig(name=name, digest=digest) for name in channel_names]
+    return FeedsConfig(feeds=feeds, channels=channels)
+
+
+def run_newsletter(args, discord, dynamodb, rss, results) -> None:
+    """Publish every stub feed twice: once cold and once with nothing new."""
+    channel_names = [f"bench-{index}" for index in range(args.channels)]
+    for name in channel_names:
+        discord.add_channel(name)
+
+    service = NewsletterService(
+        parameter_store_client=StaticParameterStore(discord.guild_id),
+        dynamodb_client=dynamodb,
+        feeds_config=build_feeds_config(rss, channel_names, args.digest),
+    )
+
+    for name in ("newsletter_cold", "newsletter_repeat"):
+        with measure(name, discord, dynamodb, rss, results) as extra:
+            unsent = service.publish_latest_articles()
+            extra["unsent_articles"] = len(unsent)
+
+
+def run_reminders(args, discord, dynamodb, rss, results) -> None:
+    """Send 1-hour reminders for one event with args.rsvps subscribers."""
+    start_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    event_id = discord.add_event("Benchmark Event", start_time.isoformat(), args.rsvps)
+    users = discord.event_users[event_id]
+    for user in users[: int(len(users) * args.closed_dm_ratio)]:
+        discord.closed_dm_users.add(user["user"]["id"])
+
+    service = DiscordService(
+        parameter_store_client=StaticParameterStore(discord.guild_id),
+        dynamodb_client=dynamodb,
+    )
+
+    with measure("reminders", discord, dynamodb, rss, results) as extra:
+        unsent = service.list_scheduled_events_and_notify(
+            time_delta=timedelta(minutes=5)
+        )
+        extra["unsent_reminders"] = len(unsent)
+
+
+SCENARIOS = {"newsletter": run_newsletter, "reminders": run_reminders}
+
+
+def print_report(results: list) -> None:
+    """Print a summary table of the benchmark results."""
+    print()
+    print(
+        f"{'scenario':<20} {'wall s':>8} {'sleep s':>8} "
+        f"{'discord':>8} {'429s':>6} {'dynamodb':>9} {'rss':>5}"
+    )
+    for result in results:
+        print(
+            f"{result['scenario']:<20} {result['wall_seconds']:>8.2f} "
+            f"{result['sleep_seconds']:>8.2f} {result['discord_requests']:>8} "
+            f"{result['discord_429s']:>6} {sum(result['dynamodb_calls'].values()):>9} "
+            f"{result['rss_requests']:>5}"
+        )
+    print()
+    for result in results:
+        routes = ", ".join(
+            f"{route}={count}"
+            for route, count in sorted(result["discord_requests_by_route"].items())
+        )
+        print(f"  {result['scenario']}: {routes}")
+    print()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run The Herald offline benchmarks.")
+    parser.add_argument("--feeds", type=int, default=100, help="RSS feeds to serve")
+    parser.add_argument(
+        "--articles-per-feed", type=int, default=3, help="Items in each feed"
+    )
+    parser.add_argument(
+        "--channels", type=int, default=10, help="Channels the feeds are spread over"
+    )
+    parser.add_argument(
+        "--digest", action="store_true", help="Publish every channel in digest mode"
+    )
+    parser.add_argument(
+        "--rsvps", type=int, default=1000, help="Subscribers of the benchmark event"
+    )
+    parser.add_argument(
+        "--closed-dm-ratio",
+        type=float,
+        default=0.05,
+        help="Fraction of subscribers that reject DMs",
+    )
+    parser.add_argument(
+        "--route-limit", type=int, default=5, help="Requests per route bucket window"
+    )
+    parser.add_argument(
+        "--route-window", type=float, default=1.0, help="Route bucket window in seconds"
+    )
+    parser.add_argument(
+        "--global-limit", type=int, default=50, help="Requests per second, all routes"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Added response latency in seconds"
+    )
+    parser.add_argument(
+        "--partitioned-reminders",
+        action="store_true",
+        help="Store reminders in an event-partitioned table read with Query",
+    )
+    parser.add_argument(
+        "--only", choices=sorted(SCENARIOS), help="Run a single scenario group"
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Log level for the services under test"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> list:
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+
+    discord = DiscordStub(
+        route_limit=args.route_limit,
+        route_window=args.route_window,
+        global_limit=args.global_limit,
+        latency=args.latency,
+    ).start()
+    rss = RssStub(args.feeds, args.articles_per_feed).start()
+    dynamodb = InMemoryDynamoDBClient(
+        reminders_table_name=(
+            "herald-benchmark-reminders" if args.partitioned_reminders else None
+        ),
+        # The benchmark starts empty, so there are no flat records to migrate
+        legacy_reads=False,
+    )
+    results = []
+
+    try:
+        with discord_routed_to(discord):
+            for name, scenario in SCENARIOS.items():
+                if args.only in (None, name):
+                    scenario(args, discord, dynamodb, rss, results)
+    finally:
+        discord.stop()
+        rss.stop()
+
+    print_report(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.json}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
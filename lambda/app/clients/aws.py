@@ -0,0 +1,81 @@
+"""
+Shared factory for AWS service clients.
+
+Every client is created from one boto3 session, so credentials are resolved
+and endpoint and service model data are loaded once per execution context
+rather than once per client. Clients share a configuration tuned for short
+Lambda invocations: adaptive retries, TCP keepalive, tight connect and read
+timeouts, and a connection pool large enough for the concurrent senders.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Tuple
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Configuration applied to every client; a client may override parts of it
+DEFAULT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=2,
+    read_timeout=5,
+    max_pool_connections=50,
+    tcp_keepalive=True,
+)
+
+_session: boto3.session.Session = None
+_clients: Dict[Tuple[str, str], Any] = {}
+# Creating clients from one session is not thread-safe
+_lock = threading.Lock()
+
+
+def get_session() -> boto3.session.Session:
+    """
+    Get the session shared by every client, creating it on first use.
+
+    Returns:
+        Shared boto3 session
+    """
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        return _session
+
+
+def create_client(service_name: str, region_name: str = None, config: Config = None):
+    """
+    Get a client for an AWS service from the shared session.
+
+    Clients are cached by service and region, so every caller shares one
+    client and its connection pool. Low-level clients are thread-safe.
+
+    Args:
+        service_name: AWS service name (e.g., "ssm", "dynamodb")
+        region_name: AWS region name (default: None, uses AWS_REGION env var or boto3 default)
+        config: Settings merged over DEFAULT_CONFIG; clients created with a
+                config are not cached
+
+    Returns:
+        boto3 client for the service
+    """
+    session = get_session()
+    cache_key = (service_name, region_name)
+
+    with _lock:
+        if config is None and cache_key in _clients:
+            return _clients[cache_key]
+
+        client = session.client(
+            service_name,
+            region_name=region_name,
+            config=DEFAULT_CONFIG.merge(config) if config else DEFAULT_CONFIG,
+        )
+        if config is None:
+            _clients[cache_key] = client
+
+    logger.debug("Created %s client (region: %s)", service_name, region_name)
+    return client
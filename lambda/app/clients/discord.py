@@ -2,13 +2,21 @@
 Discord bot configuration module.
 This module defines the DiscordConfig class, which is responsible for configuring and running a Discord bot.
 It initializes the bot with the necessary token and guild ID, registers event handlers, and provides a method to run the bot.
+Given an EventIndex, the bot also acts as a gateway listener that keeps the index of scheduled events and their
+subscribers up to date. Index updates write through to DynamoDB, so they run on a worker thread instead of the
+event loop, where a slow write would delay gateway heartbeats.
 """
 
+import asyncio
 import os
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from discord.ext import commands
 from discord import Intents, Object
+from clients.dynamodb import LISTENER_HEARTBEAT_INTERVAL_SECONDS
+from services.event_index import EventIndex, GATEWAY_EVENT_TYPES
 from utils.secrets import VaultSecretsLoader
 
 # Load environment variables from .env file
@@ -22,9 +30,22 @@ class DiscordClient:
     It registers event handlers and provides a method to run the bot.
     """
 
-    def __init__(self):
-        self.token = VaultSecretsLoader().load_secret("discord-token") or os.getenv(
-            "DISCORD_TOKEN"
+    def __init__(
+        self, token: str = None, guild_id: str = None, event_index: EventIndex = None
+    ):
+        """
+        Initialize the Discord bot.
+
+        Args:
+            token: Discord bot token. If None, Vault or DISCORD_TOKEN is used.
+            guild_id: ID of the Discord guild. If None, DISCORD_GUILD_ID is used.
+            event_index: Index to keep up to date from scheduled-event gateway
+                         events. If None, the bot does not listen for them.
+        """
+        self.token = (
+            token
+            or VaultSecretsLoader().load_secret("discord-token")
+            or os.getenv("DISCORD_TOKEN")
         )
 
         if not self.token:
@@ -32,15 +53,34 @@ class DiscordClient:
                 "Discord token not found. Set DISCORD_TOKEN environment variable or use Vault secrets."
             )
 
-        if not os.getenv("DISCORD_GUILD_ID"):
+        guild_id = guild_id or os.getenv("DISCORD_GUILD_ID")
+        if not guild_id:
             raise ValueError(
                 "Discord guild ID not found. Set DISCORD_GUILD_ID environment variable."
             )
 
-        self.guild = Object(id=int(os.getenv("DISCORD_GUILD_ID")))
+        self.guild = Object(id=int(guild_id))
+        self.event_index = event_index
+        # One worker applies index updates in the order they arrive
+        self._index_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-index")
+            if event_index is not None
+            else None
+        )
+        # Whether every dispatch since the last resync has been received
+        self._index_current = False
+        self._heartbeat_task = None
         intents = Intents.default()  # Add this line
-        self.bot = commands.Bot(command_prefix="/", intents=intents)
+        # Raw dispatches are needed for scheduled-event user add/remove, which
+        # discord.py drops unless the event and user are already cached
+        self.bot = commands.Bot(
+            command_prefix="/",
+            intents=intents,
+            enable_debug_events=event_index is not None,
+        )
         self._register_events()
+        if event_index is not None:
+            self._register_event_index()
 
     def _register_events(self):
         """
@@ -50,12 +90,111 @@ class DiscordClient:
 
         @self.bot.event
         async def on_ready():
-            logging.info(f"Logged in as {self.bot.user.name} (ID: {self.bot.user.id})")
+            logging.info(
+                "Logged in as %s (ID: %s)", self.bot.user.name, self.bot.user.id
+            )
             try:
                 synced = await self.bot.tree.sync(guild=self.guild)
-                logging.info(f"Synced {len(synced)} command(s) to guild {self.guild}.")
+                logging.info(
+                    "Synced %s command(s) to guild %s.", len(synced), self.guild
+                )
+            except Exception as e:
+                logging.error("Failed to sync commands: %s", e)
+
+    def _register_event_index(self):
+        """
+        Register the gateway listener that keeps the event index up to date.
+        Scheduled-event dispatches are applied to the index as they arrive, and
+        the index is fully resynced on every new gateway session, since events
+        missed while disconnected are not replayed. While the listener is
+        connected it records a heartbeat, without which reminder runs list
+        subscribers from the Discord API instead of trusting the index.
+        """
+
+        @self.bot.event
+        async def on_socket_raw_receive(msg):
+            if not isinstance(msg, str) or "GUILD_SCHEDULED_EVENT" not in msg:
+                return
+            payload = json.loads(msg)
+            if payload.get("t") in GATEWAY_EVENT_TYPES:
+                try:
+                    await self._run_index(
+                        self.event_index.apply_gateway_event, payload["t"], payload["d"]
+                    )
+                except Exception as e:
+                    logging.error(
+                        "Failed to apply %s to event index: %s", payload["t"], e
+                    )
+
+        @self.bot.listen("on_ready")
+        async def resync_event_index():
+            try:
+                await self.resync_event_index()
+                self._index_current = True
+                await self._run_index(self.event_index.record_heartbeat)
             except Exception as e:
-                logging.error(f"Failed to sync commands: {e}")
+                logging.error("Failed to resync event index: %s", e)
+            if self._heartbeat_task is None:
+                self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+        @self.bot.listen("on_disconnect")
+        async def pause_event_index():
+            if self._index_current:
+                self._index_current = False
+                await self._run_index(self.event_index.clear_heartbeat)
+
+        @self.bot.listen("on_resumed")
+        async def resume_event_index():
+            # A resumed session replays the dispatches missed while disconnected
+            self._index_current = True
+
+    async def _run_index(self, function, *args):
+        """
+        Run a blocking EventIndex call on the index worker thread.
+
+        Args:
+            function: EventIndex method to call
+            *args: Arguments for the method
+
+        Returns:
+            The method's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._index_executor, function, *args)
+
+    async def _heartbeat_loop(self):
+        """
+        Record a listener heartbeat at a fixed interval while the index is current.
+        """
+        while not self.bot.is_closed():
+            if self._index_current:
+                try:
+                    await self._run_index(self.event_index.record_heartbeat)
+                except Exception as e:
+                    logging.error("Failed to record event index heartbeat: %s", e)
+            await asyncio.sleep(LISTENER_HEARTBEAT_INTERVAL_SECONDS)
+
+    async def resync_event_index(self):
+        """
+        Replace the event index with the guild's current events and subscribers.
+        """
+        guild = await self.bot.fetch_guild(self.guild.id)
+        events = await guild.fetch_scheduled_events(with_counts=False)
+        for event in events:
+            user_ids = [str(user.id) async for user in event.users()]
+            await self._run_index(
+                self.event_index.sync_event,
+                EventIndex.event_summary(
+                    {
+                        "id": event.id,
+                        "name": event.name,
+                        "scheduled_start_time": event.start_time.isoformat(),
+                        "status": event.status.value,
+                    }
+                ),
+                user_ids,
+            )
+        logging.info("Resynced event index with %s event(s)", len(events))
 
     def run(self):
         """
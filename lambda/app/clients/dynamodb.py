@@ -3,17 +3,88 @@ DynamoDB client for reminder tracking.
 
 This module provides a client for tracking sent Discord event reminders using DynamoDB.
 It prevents duplicate notifications by storing reminder records with a 2-hour TTL.
+
+Reminder records are stored in one of two layouts:
+
+- Flat: one item per reminder in the main table, keyed by
+  reminder_key = "{event_id}:{user_id}:{reminder_type}".
+- Partitioned: a separate reminders table with partition key
+  pk = "{event_id}#{reminder_type}" and sort key sk = "{user_id}", so every
+  user already reminded for an event is read with a single Query.
 """
 
+import json
 import logging
 import time
-from typing import Optional
-import boto3
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set, Tuple
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError, BotoCoreError
-
+from clients.aws import create_client
 
 logger = logging.getLogger(__name__)
 
+# Checkpoints outlive a few missed schedules but not a day's articles
+CHECKPOINT_TTL_SECONDS = 86400
+
+# Maximum number of keys DynamoDB accepts in one BatchGetItem request
+BATCH_GET_LIMIT = 100
+
+# Delivered reminders suppress duplicates for 2 hours
+REMINDER_TTL_SECONDS = 7200
+
+# A claim is held for as long as a Lambda invocation can run, so a run that
+# crashes or times out between claiming and sending does not hold the
+# reminder back for the whole duplicate window
+REMINDER_CLAIM_LEASE_SECONDS = 300
+
+# Status of a reminder record
+REMINDER_CLAIMED = "claimed"
+REMINDER_DELIVERED = "delivered"
+
+# Users who cannot receive DMs are not messaged again for a week, after which
+# a changed privacy setting is picked up
+UNDELIVERABLE_TTL_SECONDS = 7 * 86400
+
+# Event index entries outlive their event by a day; entries for events whose
+# start time is unknown expire after 30 days
+EVENT_INDEX_TTL_SECONDS = 86400
+EVENT_INDEX_FALLBACK_TTL_SECONDS = 30 * 86400
+
+# The gateway listener records a heartbeat this often while it is connected.
+# Indexed subscribers are only trusted while the heartbeat is younger than
+# the maximum age, so a listener that is down sends readers back to Discord.
+LISTENER_HEARTBEAT_INTERVAL_SECONDS = 60
+EVENT_INDEX_MAX_AGE_SECONDS = 180
+LISTENER_HEARTBEAT_KEY = "listener:heartbeat"
+
+# Token counters of a rate budget only matter during their one-second window
+RATE_BUDGET_TTL_SECONDS = 60
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _key(key: str) -> Dict[str, dict]:
+    """Build the low-level Key for an item's reminder_key."""
+    return {"reminder_key": {"S": key}}
+
+
+def _reminder_item_key(partition: str, user_id: str) -> Dict[str, dict]:
+    """Build the low-level Key for an item in the partitioned reminders table."""
+    return {"pk": {"S": partition}, "sk": {"S": user_id}}
+
+
+def _serialize(values: Dict[str, Any]) -> Dict[str, dict]:
+    """Convert Python values to DynamoDB attribute values."""
+    return {name: _serializer.serialize(value) for name, value in values.items()}
+
+
+def _deserialize(item: Dict[str, dict]) -> Dict[str, Any]:
+    """Convert DynamoDB attribute values to Python values (numbers as Decimal)."""
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
+
 
 class DynamoDBClient:
     """
@@ -21,20 +92,71 @@ class DynamoDBClient:
 
     This client manages reminder state to prevent duplicate notifications.
     Records are automatically expired after 2 hours using DynamoDB TTL.
+    It uses the low-level DynamoDB client from the shared factory, which,
+    unlike the resource layer, is thread-safe.
+
+    Reminder records use the flat layout in the main table unless a
+    partitioned reminders table is configured. Checkpoints, the event index
+    and undeliverable users always stay in the main table.
     """
 
-    def __init__(self, table_name: str, region_name: str = None):
+    # Partitioned reminders table; None keeps reminders in the main table
+    reminders_table_name: Optional[str] = None
+
+    # Whether reminders missing from the partitioned table are also looked up
+    # in the main table, where records written before the switch still live
+    legacy_reads: bool = True
+
+    def __init__(
+        self,
+        table_name: str,
+        region_name: str = None,
+        reminders_table_name: str = None,
+        legacy_reads: bool = True,
+    ):
         """
         Initialize the DynamoDB client.
 
         Args:
             table_name: Name of the DynamoDB table for reminder tracking
             region_name: AWS region name (default: None, uses AWS_REGION env var or boto3 default)
+            reminders_table_name: Name of the partitioned reminders table
+                                  (default: None, reminders are kept in table_name)
+            legacy_reads: Also check table_name for reminders recorded before
+                          the partitioned table was enabled (default: True)
         """
         self.table_name = table_name
-        self.dynamodb = boto3.resource("dynamodb", region_name=region_name)
-        self.table = self.dynamodb.Table(table_name)
-        logger.info(f"Initialized DynamoDB client for table: {table_name}")
+        self.reminders_table_name = reminders_table_name
+        self.legacy_reads = legacy_reads
+        self.client = create_client("dynamodb", region_name=region_name)
+        logger.info("Initialized DynamoDB client for table: %s", table_name)
+        if reminders_table_name:
+            logger.info(
+                "Reminders are stored in partitioned table: %s (legacy reads: %s)",
+                reminders_table_name,
+                legacy_reads,
+            )
+
+    def open_connection(self) -> bool:
+        """
+        Open a connection to the DynamoDB endpoint with a read of a key that is
+        never written, so the first real request does not pay for the TLS handshake.
+
+        Returns:
+            True if the request succeeded, False otherwise
+        """
+        try:
+            self.client.get_item(TableName=self.table_name, Key=_key("warmup"))
+            logger.debug("Opened connection to DynamoDB table: %s", self.table_name)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning(
+                "Could not open connection to DynamoDB table %s: %s",
+                self.table_name,
+                e,
+            )
+            return False
 
     @staticmethod
     def generate_reminder_key(event_id: str, user_id: str, reminder_type: str) -> str:
@@ -51,6 +173,53 @@ class DynamoDBClient:
         """
         return f"{event_id}:{user_id}:{reminder_type}"
 
+    @staticmethod
+    def generate_reminder_partition(event_id: str, reminder_type: str) -> str:
+        """
+        Generate the partition key grouping an event's reminders in the
+        partitioned reminders table.
+
+        Args:
+            event_id: Discord event ID
+            reminder_type: Type of reminder (e.g., "1h" for 1-hour reminder)
+
+        Returns:
+            Partition key in format: {event_id}#{reminder_type}
+        """
+        return f"{event_id}#{reminder_type}"
+
+    def _reminder_locations(
+        self, event_id: str, user_id: str, reminder_type: str
+    ) -> List[Tuple[str, Dict[str, dict]]]:
+        """
+        Get the tables and keys a reminder record may be stored under.
+
+        The first location is where records are written; with the partitioned
+        layout and legacy reads enabled, the flat key in the main table follows.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+            reminder_type: Type of reminder (e.g., "1h")
+
+        Returns:
+            List of (table name, low-level Key) tuples
+        """
+        flat = (
+            self.table_name,
+            _key(self.generate_reminder_key(event_id, user_id, reminder_type)),
+        )
+        if not self.reminders_table_name:
+            return [flat]
+
+        partitioned = (
+            self.reminders_table_name,
+            _reminder_item_key(
+                self.generate_reminder_partition(event_id, reminder_type), user_id
+            ),
+        )
+        return [partitioned, flat] if self.legacy_reads else [partitioned]
+
     def check_reminder_sent(
         self, event_id: str, user_id: str, reminder_type: str
     ) -> bool:
@@ -68,32 +237,35 @@ class DynamoDBClient:
         reminder_key = self.generate_reminder_key(event_id, user_id, reminder_type)
 
         try:
-            response = self.table.get_item(Key={"reminder_key": reminder_key})
+            for table_name, key in self._reminder_locations(
+                event_id, user_id, reminder_type
+            ):
+                response = self.client.get_item(TableName=table_name, Key=key)
+                if "Item" not in response:
+                    continue
 
-            if "Item" in response:
                 # Check if the item has expired (TTL might not have cleaned it up yet)
-                ttl = response["Item"].get("ttl")
+                ttl = _deserialize(response["Item"]).get("ttl")
                 current_time = int(time.time())
 
                 if ttl and ttl > current_time:
                     logger.debug(
-                        f"Reminder already sent: {reminder_key} (expires at {ttl})"
+                        "Reminder already sent: %s (expires at %s)", reminder_key, ttl
                     )
                     return True
-                else:
-                    logger.debug(
-                        f"Reminder record expired: {reminder_key} (TTL: {ttl})"
-                    )
-                    return False
 
-            logger.debug(f"No reminder record found: {reminder_key}")
+                logger.debug("Reminder record expired: %s (TTL: %s)", reminder_key, ttl)
+
+            logger.debug("No unexpired reminder record found: %s", reminder_key)
             return False
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.error(
-                f"DynamoDB ClientError checking reminder {reminder_key}: "
-                f"{error_code} - {e}",
+                "DynamoDB ClientError checking reminder %s: %s - %s",
+                reminder_key,
+                error_code,
+                e,
                 exc_info=True,
             )
             # On error, assume reminder was not sent to avoid blocking notifications
@@ -101,13 +273,323 @@ class DynamoDBClient:
 
         except BotoCoreError as e:
             logger.error(
-                f"BotoCoreError checking reminder {reminder_key}: {e}", exc_info=True
+                "BotoCoreError checking reminder %s: %s", reminder_key, e, exc_info=True
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error checking reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    def batch_check_reminders_sent(
+        self, event_id: str, user_ids: List[str], reminder_type: str
+    ) -> Set[str]:
+        """
+        Check which users of an event have already been sent a reminder.
+
+        With the flat layout, keys are read with BatchGetItem in chunks of 100,
+        so a large subscriber list costs one round trip per 100 users instead
+        of one per user. With the partitioned layout, one paginated Query reads
+        the event's partition and the subscribers are intersected with it; users
+        not found there are checked in the main table while legacy reads are on.
+
+        Args:
+            event_id: Discord event ID
+            user_ids: Discord user IDs to check
+            reminder_type: Type of reminder (e.g., "1h")
+
+        Returns:
+            Set of user IDs whose reminder was already sent
+        """
+        if self.reminders_table_name:
+            sent = self._query_reminded_users(event_id, reminder_type) & set(user_ids)
+            remaining = [user_id for user_id in user_ids if user_id not in sent]
+        else:
+            sent = set()
+            remaining = user_ids
+
+        if remaining and (not self.reminders_table_name or self.legacy_reads):
+            keys_by_user = {
+                self.generate_reminder_key(event_id, user_id, reminder_type): user_id
+                for user_id in remaining
+            }
+            sent |= {
+                keys_by_user[key]
+                for key in self._batch_get_unexpired_keys(
+                    list(keys_by_user), f"reminders for event {event_id}"
+                )
+            }
+
+        logger.debug(
+            "Batch checked %s reminder(s) for event %s: %s already sent",
+            len(user_ids),
+            event_id,
+            len(sent),
+        )
+        return sent
+
+    def _query_reminded_users(self, event_id: str, reminder_type: str) -> Set[str]:
+        """
+        Read every user with an unexpired reminder record for an event from
+        the partitioned reminders table.
+
+        The event's partition is read with Query, following LastEvaluatedKey
+        across pages. On error the users read so far are returned, so callers
+        never skip work because of a read failure.
+
+        Args:
+            event_id: Discord event ID
+            reminder_type: Type of reminder (e.g., "1h")
+
+        Returns:
+            Set of user IDs with an unexpired reminder record
+        """
+        partition = self.generate_reminder_partition(event_id, reminder_type)
+        current_time = int(time.time())
+        found = set()
+        request = {
+            "TableName": self.reminders_table_name,
+            "KeyConditionExpression": "pk = :pk",
+            "ProjectionExpression": "sk, #ttl",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "ExpressionAttributeValues": _serialize({":pk": partition}),
+        }
+        pages = 0
+
+        try:
+            while True:
+                response = self.client.query(**request)
+                pages += 1
+                for item in response.get("Items", []):
+                    item = _deserialize(item)
+                    ttl = item.get("ttl")
+                    if ttl and ttl > current_time:
+                        found.add(item["sk"])
+
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                request["ExclusiveStartKey"] = last_key
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error querying reminders %s: %s", partition, e, exc_info=True)
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error querying reminders %s: %s",
+                partition,
+                e,
+                exc_info=True,
+            )
+
+        logger.debug(
+            "Queried reminders %s: %s user(s) in %s page(s)",
+            partition,
+            len(found),
+            pages,
+        )
+        return found
+
+    def _batch_get_unexpired_keys(self, keys: List[str], description: str) -> Set[str]:
+        """
+        Find which keys have an item whose TTL has not yet passed.
+
+        Keys are read with BatchGetItem in chunks of 100. On error the keys of
+        the failed chunk are treated as missing, so callers never skip work
+        because of a read failure.
+
+        Args:
+            keys: Item keys (reminder_key values) to look up
+            description: What is being checked, for log messages
+
+        Returns:
+            Set of keys with an unexpired item
+        """
+        current_time = int(time.time())
+        found = set()
+
+        for start in range(0, len(keys), BATCH_GET_LIMIT):
+            request = {
+                self.table_name: {
+                    "Keys": [
+                        _key(key) for key in keys[start : start + BATCH_GET_LIMIT]
+                    ],
+                    "ProjectionExpression": "reminder_key, #ttl",
+                    "ExpressionAttributeNames": {"#ttl": "ttl"},
+                }
+            }
+
+            try:
+                while request:
+                    response = self.client.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(self.table_name, []):
+                        item = _deserialize(item)
+                        ttl = item.get("ttl")
+                        if ttl and ttl > current_time:
+                            found.add(item["reminder_key"])
+                    # Throttled keys come back unprocessed and must be retried
+                    request = response.get("UnprocessedKeys") or None
+                    if request:
+                        time.sleep(0.1)
+
+            except (ClientError, BotoCoreError) as e:
+                logger.error(
+                    "Error batch checking %s: %s", description, e, exc_info=True
+                )
+
+            except Exception as e:
+                logger.error(
+                    "Unexpected error batch checking %s: %s",
+                    description,
+                    e,
+                    exc_info=True,
+                )
+
+        return found
+
+    def claim_reminder(self, event_id: str, user_id: str, reminder_type: str) -> bool:
+        """
+        Claim a reminder before sending it.
+
+        The claim is a conditional put that only succeeds if no unexpired record
+        exists for the reminder, so of several invocations racing to send the
+        same reminder exactly one wins. Check and record take one round trip.
+        The claim is a short lease (REMINDER_CLAIM_LEASE_SECONDS) that
+        record_reminder_sent() extends to the full 2 hours once the reminder
+        is delivered; if sending fails it should be released with
+        release_reminder_claim().
+        With the partitioned layout the claim is taken in the reminders table;
+        records left in the main table from before the switch are found by the
+        legacy reads of batch_check_reminders_sent(), which runs first.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+            reminder_type: Type of reminder (e.g., "1h")
+
+        Returns:
+            True if this caller claimed the reminder and should send it, False
+            if it was already claimed or sent
+        """
+        reminder_key = self.generate_reminder_key(event_id, user_id, reminder_type)
+        table_name, key = self._reminder_locations(event_id, user_id, reminder_type)[0]
+        current_time = int(time.time())
+
+        try:
+            self.client.put_item(
+                TableName=table_name,
+                Item={
+                    **key,
+                    **_serialize(
+                        {
+                            "status": REMINDER_CLAIMED,
+                            "timestamp": current_time,
+                            "ttl": current_time + REMINDER_CLAIM_LEASE_SECONDS,
+                        }
+                    ),
+                },
+                # Every reminder record has a TTL, so this holds for both layouts.
+                # TTL deletion lags, so expired records count as absent
+                ConditionExpression="attribute_not_exists(#ttl) OR #ttl < :now",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues=_serialize({":now": current_time}),
+            )
+            logger.debug("Claimed reminder: %s", reminder_key)
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "ConditionalCheckFailedException":
+                logger.debug("Reminder already claimed: %s", reminder_key)
+                return False
+            logger.error(
+                "DynamoDB ClientError claiming reminder %s: %s - %s",
+                reminder_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            # On error, send anyway to avoid blocking notifications
+            return True
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError claiming reminder %s: %s", reminder_key, e, exc_info=True
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error claiming reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
+            )
+            return True
+
+    def release_reminder_claim(
+        self, event_id: str, user_id: str, reminder_type: str
+    ) -> bool:
+        """
+        Release a claim whose reminder could not be sent, so a later run retries it.
+        Delivered reminders are left in place.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+            reminder_type: Type of reminder (e.g., "1h")
+
+        Returns:
+            True if the claim was released, False otherwise
+        """
+        reminder_key = self.generate_reminder_key(event_id, user_id, reminder_type)
+        table_name, key = self._reminder_locations(event_id, user_id, reminder_type)[0]
+
+        try:
+            self.client.delete_item(
+                TableName=table_name,
+                Key=key,
+                ConditionExpression="#status = :claimed",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues=_serialize({":claimed": REMINDER_CLAIMED}),
+            )
+            logger.debug("Released reminder claim: %s", reminder_key)
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "ConditionalCheckFailedException":
+                logger.debug("Reminder claim no longer held: %s", reminder_key)
+                return False
+            logger.error(
+                "DynamoDB ClientError releasing reminder %s: %s - %s",
+                reminder_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return False
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError releasing reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
             )
             return False
 
         except Exception as e:
             logger.error(
-                f"Unexpected error checking reminder {reminder_key}: {e}", exc_info=True
+                "Unexpected error releasing reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
             )
             return False
 
@@ -115,9 +597,10 @@ class DynamoDBClient:
         self, event_id: str, user_id: str, reminder_type: str
     ) -> bool:
         """
-        Record that a reminder has been sent.
+        Record that a reminder has been delivered, replacing its claim if any.
 
-        The record will automatically expire after 2 hours via DynamoDB TTL.
+        This extends the claim's short lease: the record will automatically
+        expire after 2 hours via DynamoDB TTL.
 
         Args:
             event_id: Discord event ID
@@ -128,38 +611,52 @@ class DynamoDBClient:
             True if record was successfully created, False otherwise
         """
         reminder_key = self.generate_reminder_key(event_id, user_id, reminder_type)
+        table_name, key = self._reminder_locations(event_id, user_id, reminder_type)[0]
         current_time = int(time.time())
-        ttl = current_time + 7200  # 2 hours = 7200 seconds
+        ttl = current_time + REMINDER_TTL_SECONDS
 
         try:
-            self.table.put_item(
+            self.client.put_item(
+                TableName=table_name,
                 Item={
-                    "reminder_key": reminder_key,
-                    "timestamp": current_time,
-                    "ttl": ttl,
-                }
+                    **key,
+                    **_serialize(
+                        {
+                            "status": REMINDER_DELIVERED,
+                            "timestamp": current_time,
+                            "ttl": ttl,
+                        }
+                    ),
+                },
             )
-            logger.info(f"Recorded reminder: {reminder_key} (expires at {ttl})")
+            logger.debug("Recorded reminder: %s (expires at %s)", reminder_key, ttl)
             return True
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.error(
-                f"DynamoDB ClientError recording reminder {reminder_key}: "
-                f"{error_code} - {e}",
+                "DynamoDB ClientError recording reminder %s: %s - %s",
+                reminder_key,
+                error_code,
+                e,
                 exc_info=True,
             )
             return False
 
         except BotoCoreError as e:
             logger.error(
-                f"BotoCoreError recording reminder {reminder_key}: {e}", exc_info=True
+                "BotoCoreError recording reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
             )
             return False
 
         except Exception as e:
             logger.error(
-                f"Unexpected error recording reminder {reminder_key}: {e}",
+                "Unexpected error recording reminder %s: %s",
+                reminder_key,
+                e,
                 exc_info=True,
             )
             return False
@@ -181,27 +678,814 @@ class DynamoDBClient:
         reminder_key = self.generate_reminder_key(event_id, user_id, reminder_type)
 
         try:
-            self.table.delete_item(Key={"reminder_key": reminder_key})
-            logger.info(f"Deleted reminder record: {reminder_key}")
+            for table_name, key in self._reminder_locations(
+                event_id, user_id, reminder_type
+            ):
+                self.client.delete_item(TableName=table_name, Key=key)
+            logger.info("Deleted reminder record: %s", reminder_key)
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.error(
+                "DynamoDB ClientError deleting reminder %s: %s - %s",
+                reminder_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return False
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError deleting reminder %s: %s", reminder_key, e, exc_info=True
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error deleting reminder %s: %s",
+                reminder_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    @staticmethod
+    def generate_checkpoint_key(handler_type: str) -> str:
+        """
+        Generate the key for a handler's work checkpoint.
+
+        Args:
+            handler_type: Handler that owns the checkpoint (e.g., "newsletter")
+
+        Returns:
+            Key in format: checkpoint:{handler_type}
+        """
+        return f"checkpoint:{handler_type}"
+
+    def save_checkpoint(self, handler_type: str, items: List[dict]) -> bool:
+        """
+        Save the unfinished work of a handler so the next invocation can resume it.
+
+        The record will automatically expire after 24 hours via DynamoDB TTL.
+
+        Args:
+            handler_type: Handler that owns the checkpoint (e.g., "newsletter")
+            items: JSON-serializable work items that were not processed
+
+        Returns:
+            True if the checkpoint was successfully saved, False otherwise
+        """
+        checkpoint_key = self.generate_checkpoint_key(handler_type)
+        current_time = int(time.time())
+        ttl = current_time + CHECKPOINT_TTL_SECONDS
+
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=_serialize(
+                    {
+                        "reminder_key": checkpoint_key,
+                        "payload": json.dumps(items),
+                        "timestamp": current_time,
+                        "ttl": ttl,
+                    }
+                ),
+            )
+            logger.info(
+                "Saved checkpoint: %s (%s pending item(s))", checkpoint_key, len(items)
+            )
             return True
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.error(
-                f"DynamoDB ClientError deleting reminder {reminder_key}: "
-                f"{error_code} - {e}",
+                "DynamoDB ClientError saving checkpoint %s: %s - %s",
+                checkpoint_key,
+                error_code,
+                e,
                 exc_info=True,
             )
             return False
 
         except BotoCoreError as e:
             logger.error(
-                f"BotoCoreError deleting reminder {reminder_key}: {e}", exc_info=True
+                "BotoCoreError saving checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
             )
             return False
 
         except Exception as e:
             logger.error(
-                f"Unexpected error deleting reminder {reminder_key}: {e}", exc_info=True
+                "Unexpected error saving checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
             )
             return False
+
+    def load_checkpoint(self, handler_type: str) -> List[dict]:
+        """
+        Load the unfinished work saved by a previous invocation.
+
+        Args:
+            handler_type: Handler that owns the checkpoint (e.g., "newsletter")
+
+        Returns:
+            List of pending work items, empty if there is no valid checkpoint
+        """
+        checkpoint_key = self.generate_checkpoint_key(handler_type)
+
+        try:
+            response = self.client.get_item(
+                TableName=self.table_name, Key=_key(checkpoint_key)
+            )
+            item = _deserialize(response.get("Item", {}))
+
+            if not item or int(item.get("ttl", 0)) <= int(time.time()):
+                logger.debug("No checkpoint found: %s", checkpoint_key)
+                return []
+
+            items = json.loads(item["payload"])
+            logger.info(
+                "Loaded checkpoint: %s (%s pending item(s))", checkpoint_key, len(items)
+            )
+            return items
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.error(
+                "DynamoDB ClientError loading checkpoint %s: %s - %s",
+                checkpoint_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return []
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError loading checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
+            )
+            return []
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error loading checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
+            )
+            return []
+
+    def clear_checkpoint(self, handler_type: str) -> bool:
+        """
+        Delete a handler's checkpoint once its work has been completed.
+
+        Args:
+            handler_type: Handler that owns the checkpoint (e.g., "newsletter")
+
+        Returns:
+            True if the checkpoint was successfully deleted, False otherwise
+        """
+        checkpoint_key = self.generate_checkpoint_key(handler_type)
+
+        try:
+            self.client.delete_item(TableName=self.table_name, Key=_key(checkpoint_key))
+            logger.info("Cleared checkpoint: %s", checkpoint_key)
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.error(
+                "DynamoDB ClientError clearing checkpoint %s: %s - %s",
+                checkpoint_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return False
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError clearing checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error clearing checkpoint %s: %s",
+                checkpoint_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    @staticmethod
+    def generate_cache_key(key: str) -> str:
+        """
+        Generate the key for a shared cache entry.
+
+        Args:
+            key: Namespaced key of the entry in the tiered cache
+
+        Returns:
+            Key in format: cache:{key}
+        """
+        return f"cache:{key}"
+
+    def get_cache_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Read a shared cache entry.
+
+        Args:
+            key: Namespaced key of the entry in the tiered cache
+
+        Returns:
+            Tuple of (value, expiry as a Unix timestamp), or None if there is no
+            unexpired entry or it could not be read
+        """
+        cache_key = self.generate_cache_key(key)
+
+        try:
+            response = self.client.get_item(
+                TableName=self.table_name, Key=_key(cache_key)
+            )
+            item = _deserialize(response.get("Item", {}))
+
+            expires_at = float(item.get("expires_at", 0))
+            if not item or expires_at <= time.time():
+                return None
+            return json.loads(item["payload"]), expires_at
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Error reading cache entry %s: %s", cache_key, e)
+            return None
+
+        except Exception as e:
+            logger.warning(
+                "Unexpected error reading cache entry %s: %s",
+                cache_key,
+                e,
+                exc_info=True,
+            )
+            return None
+
+    def put_cache_entry(self, key: str, value: Any, expires_at: float) -> bool:
+        """
+        Write a shared cache entry, removed by DynamoDB TTL once it expires.
+
+        Args:
+            key: Namespaced key of the entry in the tiered cache
+            value: JSON-serializable value
+            expires_at: Expiry as a Unix timestamp
+
+        Returns:
+            True if the entry was successfully written, False otherwise
+        """
+        cache_key = self.generate_cache_key(key)
+
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=_serialize(
+                    {
+                        "reminder_key": cache_key,
+                        "payload": json.dumps(value),
+                        "expires_at": Decimal(str(expires_at)),
+                        "ttl": int(expires_at) + 1,
+                    }
+                ),
+            )
+            logger.debug("Wrote cache entry %s", cache_key)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Error writing cache entry %s: %s", cache_key, e)
+            return False
+
+        except Exception as e:
+            logger.warning(
+                "Unexpected error writing cache entry %s: %s",
+                cache_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    def delete_cache_entry(self, key: str) -> bool:
+        """
+        Delete a shared cache entry.
+
+        Args:
+            key: Namespaced key of the entry in the tiered cache
+
+        Returns:
+            True if the entry was successfully deleted, False otherwise
+        """
+        cache_key = self.generate_cache_key(key)
+
+        try:
+            self.client.delete_item(TableName=self.table_name, Key=_key(cache_key))
+            logger.debug("Deleted cache entry %s", cache_key)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Error deleting cache entry %s: %s", cache_key, e)
+            return False
+
+        except Exception as e:
+            logger.warning(
+                "Unexpected error deleting cache entry %s: %s",
+                cache_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    @staticmethod
+    def generate_rate_budget_key(name: str, window: int) -> str:
+        """
+        Generate the key of a rate budget's token counter for one window.
+
+        Args:
+            name: Name of the shared budget
+            window: Window start as a whole Unix timestamp
+
+        Returns:
+            Key in format: rate_budget:{name}:{window}
+        """
+        return f"rate_budget:{name}:{window}"
+
+    def reserve_tokens(self, name: str, window: int, count: int, ceiling: int) -> bool:
+        """
+        Reserve tokens from a shared rate budget.
+
+        The window's counter is incremented with a conditional atomic update that
+        only succeeds while it stays within the ceiling, so concurrent callers
+        in any container never reserve more than the ceiling between them.
+
+        Args:
+            name: Name of the shared budget
+            window: Window start as a whole Unix timestamp
+            count: Number of tokens to reserve
+            ceiling: Tokens the caller may take the counter up to in this window
+
+        Returns:
+            True if the tokens were reserved, False if the window's budget is
+            spent. Errors return True so requests are not blocked; Discord's
+            own rate-limit responses still apply.
+        """
+        budget_key = self.generate_rate_budget_key(name, window)
+
+        try:
+            self.client.update_item(
+                TableName=self.table_name,
+                Key=_key(budget_key),
+                UpdateExpression="ADD #tokens :count SET #ttl = :ttl",
+                ConditionExpression="attribute_not_exists(#tokens) OR #tokens <= :limit",
+                ExpressionAttributeNames={"#tokens": "tokens", "#ttl": "ttl"},
+                ExpressionAttributeValues=_serialize(
+                    {
+                        ":count": count,
+                        ":limit": ceiling - count,
+                        ":ttl": window + RATE_BUDGET_TTL_SECONDS,
+                    }
+                ),
+            )
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "ConditionalCheckFailedException":
+                logger.debug("Rate budget spent: %s", budget_key)
+                return False
+            logger.error(
+                "DynamoDB ClientError reserving tokens from %s: %s - %s",
+                budget_key,
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return True
+
+        except BotoCoreError as e:
+            logger.error(
+                "BotoCoreError reserving tokens from %s: %s",
+                budget_key,
+                e,
+                exc_info=True,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error reserving tokens from %s: %s",
+                budget_key,
+                e,
+                exc_info=True,
+            )
+            return True
+
+    @staticmethod
+    def generate_event_key(event_id: str) -> str:
+        """
+        Generate the key for a scheduled event's subscriber index entry.
+
+        Args:
+            event_id: Discord event ID
+
+        Returns:
+            Key in format: event:{event_id}
+        """
+        return f"event:{event_id}"
+
+    @staticmethod
+    def _event_ttl(event: dict = None) -> int:
+        """Expire index entries a day after the event starts, or in 30 days if unknown."""
+        start = (event or {}).get("scheduled_start_time")
+        if start:
+            try:
+                start_ts = datetime.fromisoformat(start.replace("Z", "+00:00"))
+                return int(start_ts.timestamp()) + EVENT_INDEX_TTL_SECONDS
+            except ValueError:
+                pass
+        return int(time.time()) + EVENT_INDEX_FALLBACK_TTL_SECONDS
+
+    def replace_event_subscribers(self, event: dict, user_ids: List[str]) -> bool:
+        """
+        Store an event with its complete subscriber set, replacing any previous entry.
+
+        Entries written here are marked as synced, so readers can trust that the
+        set is complete rather than built only from incremental updates.
+
+        Args:
+            event: Scheduled event with id, name and scheduled_start_time
+            user_ids: IDs of every user subscribed to the event
+
+        Returns:
+            True if the entry was successfully stored, False otherwise
+        """
+        event_key = self.generate_event_key(event["id"])
+        item = {
+            "reminder_key": event_key,
+            "event_data": json.dumps(event),
+            "synced_at": int(time.time()),
+            "ttl": self._event_ttl(event),
+        }
+        # DynamoDB does not store empty sets
+        if user_ids:
+            item["subscribers"] = set(user_ids)
+
+        try:
+            self.client.put_item(TableName=self.table_name, Item=_serialize(item))
+            logger.info(
+                "Indexed event %s with %s subscriber(s)", event_key, len(user_ids)
+            )
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error indexing event %s: %s", event_key, e, exc_info=True)
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error indexing event %s: %s", event_key, e, exc_info=True
+            )
+            return False
+
+    def save_event(self, event: dict) -> bool:
+        """
+        Create or update an event's details without touching its subscribers.
+
+        Args:
+            event: Scheduled event with id, name and scheduled_start_time
+
+        Returns:
+            True if the entry was successfully updated, False otherwise
+        """
+        return self._update_event_item(
+            event["id"],
+            "SET event_data = :event, #ttl = :ttl",
+            {":event": json.dumps(event), ":ttl": self._event_ttl(event)},
+        )
+
+    def add_event_subscriber(self, event_id: str, user_id: str) -> bool:
+        """
+        Add a user to an event's subscriber set.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+
+        Returns:
+            True if the entry was successfully updated, False otherwise
+        """
+        return self._update_event_item(
+            event_id,
+            "ADD subscribers :users SET #ttl = if_not_exists(#ttl, :ttl)",
+            {":users": {user_id}, ":ttl": self._event_ttl()},
+        )
+
+    def remove_event_subscriber(self, event_id: str, user_id: str) -> bool:
+        """
+        Remove a user from an event's subscriber set.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+
+        Returns:
+            True if the entry was successfully updated, False otherwise
+        """
+        return self._update_event_item(
+            event_id,
+            "DELETE subscribers :users SET #ttl = if_not_exists(#ttl, :ttl)",
+            {":users": {user_id}, ":ttl": self._event_ttl()},
+        )
+
+    def _update_event_item(
+        self, event_id: str, update_expression: str, values: dict
+    ) -> bool:
+        """Apply an update expression to an event index entry."""
+        event_key = self.generate_event_key(event_id)
+
+        try:
+            self.client.update_item(
+                TableName=self.table_name,
+                Key=_key(event_key),
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues=_serialize(values),
+            )
+            logger.debug("Updated event index entry %s", event_key)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "Error updating event index entry %s: %s", event_key, e, exc_info=True
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error updating event index entry %s: %s",
+                event_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    def delete_event(self, event_id: str) -> bool:
+        """
+        Delete an event's index entry.
+
+        Args:
+            event_id: Discord event ID
+
+        Returns:
+            True if the entry was successfully deleted, False otherwise
+        """
+        event_key = self.generate_event_key(event_id)
+
+        try:
+            self.client.delete_item(TableName=self.table_name, Key=_key(event_key))
+            logger.info("Deleted event index entry %s", event_key)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "Error deleting event index entry %s: %s", event_key, e, exc_info=True
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error deleting event index entry %s: %s",
+                event_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    def record_listener_heartbeat(self) -> bool:
+        """
+        Record that the gateway listener is connected and the index is current.
+
+        Returns:
+            True if the heartbeat was successfully written, False otherwise
+        """
+        current_time = int(time.time())
+
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=_serialize(
+                    {
+                        "reminder_key": LISTENER_HEARTBEAT_KEY,
+                        "heartbeat_at": current_time,
+                        "ttl": current_time + EVENT_INDEX_MAX_AGE_SECONDS,
+                    }
+                ),
+            )
+            logger.debug("Recorded listener heartbeat")
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error recording listener heartbeat: %s", e, exc_info=True)
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error recording listener heartbeat: %s", e, exc_info=True
+            )
+            return False
+
+    def clear_listener_heartbeat(self) -> bool:
+        """
+        Remove the listener heartbeat, e.g. when the gateway connection drops,
+        so the index is not trusted until the listener has caught up again.
+
+        Returns:
+            True if the heartbeat was successfully deleted, False otherwise
+        """
+        try:
+            self.client.delete_item(
+                TableName=self.table_name, Key=_key(LISTENER_HEARTBEAT_KEY)
+            )
+            logger.debug("Cleared listener heartbeat")
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error clearing listener heartbeat: %s", e, exc_info=True)
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error clearing listener heartbeat: %s", e, exc_info=True
+            )
+            return False
+
+    def _listener_is_current(self, max_age: float) -> bool:
+        """Check whether the listener has recorded a heartbeat within max_age seconds."""
+        response = self.client.get_item(
+            TableName=self.table_name, Key=_key(LISTENER_HEARTBEAT_KEY)
+        )
+        item = _deserialize(response.get("Item", {}))
+        if "heartbeat_at" not in item:
+            return False
+        return time.time() - float(item["heartbeat_at"]) <= max_age
+
+    def load_event_subscribers(
+        self, event_id: str, max_age: float = EVENT_INDEX_MAX_AGE_SECONDS
+    ) -> Optional[Set[str]]:
+        """
+        Load an event's subscriber set from the index.
+
+        Incremental updates are only applied while the gateway listener is
+        connected, so the set is trusted only if the listener's heartbeat is
+        at most max_age seconds old.
+
+        Args:
+            event_id: Discord event ID
+            max_age: Oldest listener heartbeat, in seconds, the index is trusted with
+
+        Returns:
+            Set of subscribed user IDs, or None if the event has not been fully
+            synced into the index or the listener is not current, and its
+            subscribers must be listed from Discord
+        """
+        event_key = self.generate_event_key(event_id)
+
+        try:
+            if not self._listener_is_current(max_age):
+                logger.info(
+                    "Event index listener has no recent heartbeat - not using %s",
+                    event_key,
+                )
+                return None
+
+            response = self.client.get_item(
+                TableName=self.table_name, Key=_key(event_key)
+            )
+            item = _deserialize(response.get("Item", {}))
+
+            if not item or "synced_at" not in item:
+                logger.debug("Event not indexed: %s", event_key)
+                return None
+
+            subscribers = {str(user_id) for user_id in item.get("subscribers", set())}
+            logger.debug(
+                "Loaded %s indexed subscriber(s) for %s", len(subscribers), event_key
+            )
+            return subscribers
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "Error loading event index entry %s: %s", event_key, e, exc_info=True
+            )
+            return None
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error loading event index entry %s: %s",
+                event_key,
+                e,
+                exc_info=True,
+            )
+            return None
+
+    @staticmethod
+    def generate_undeliverable_key(user_id: str) -> str:
+        """
+        Generate the key recording that a user cannot receive DMs.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Key in format: undeliverable:{user_id}
+        """
+        return f"undeliverable:{user_id}"
+
+    def record_undeliverable_user(self, user_id: str) -> bool:
+        """
+        Record that a user does not accept DMs from the bot.
+
+        The record expires after UNDELIVERABLE_TTL_SECONDS via DynamoDB TTL.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            True if record was successfully created, False otherwise
+        """
+        undeliverable_key = self.generate_undeliverable_key(user_id)
+        current_time = int(time.time())
+
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=_serialize(
+                    {
+                        "reminder_key": undeliverable_key,
+                        "timestamp": current_time,
+                        "ttl": current_time + UNDELIVERABLE_TTL_SECONDS,
+                    }
+                ),
+            )
+            logger.debug("Recorded undeliverable user: %s", undeliverable_key)
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "Error recording undeliverable user %s: %s",
+                undeliverable_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error recording undeliverable user %s: %s",
+                undeliverable_key,
+                e,
+                exc_info=True,
+            )
+            return False
+
+    def batch_check_undeliverable_users(self, user_ids: List[str]) -> Set[str]:
+        """
+        Check which users are recorded as not accepting DMs.
+
+        Args:
+            user_ids: Discord user IDs to check
+
+        Returns:
+            Set of user IDs that cannot be sent DMs
+        """
+        keys_by_user = {
+            self.generate_undeliverable_key(user_id): user_id for user_id in user_ids
+        }
+        undeliverable = {
+            keys_by_user[key]
+            for key in self._batch_get_unexpired_keys(
+                list(keys_by_user), "undeliverable users"
+            )
+        }
+        logger.debug(
+            "Batch checked %s user(s): %s cannot receive DMs",
+            len(user_ids),
+            len(undeliverable),
+        )
+        return undeliverable
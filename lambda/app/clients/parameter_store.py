@@ -6,20 +6,25 @@ It implements caching for Lambda execution context to minimize API calls and imp
 """
 
 import logging
-from typing import Optional, Dict
-import boto3
+import os
+from typing import Optional, Dict, List
 from botocore.exceptions import ClientError, BotoCoreError
-
+from clients.aws import create_client
+from utils.cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
+# Cached parameters are re-read after an hour, so rotated secrets are picked up
+PARAMETER_CACHE_TTL_SECONDS = 3600
+
 
 class ParameterStoreClient:
     """
     Parameter Store client for retrieving and caching secrets.
 
     This client retrieves secrets from AWS Systems Manager Parameter Store
-    and caches them for the duration of the Lambda execution context.
+    and caches them in memory for the Lambda execution context. Secrets are
+    never written to the disk or DynamoDB cache tiers.
     """
 
     def __init__(self, prefix: str = "/the-herald/prod/", region_name: str = None):
@@ -32,9 +37,16 @@ class ParameterStoreClient:
         """
         self.prefix = prefix
         self.region_name = region_name
-        self.ssm_client = boto3.client("ssm", region_name=region_name)
-        self._cache: Dict[str, str] = {}
-        logger.info(f"Initialized Parameter Store client with prefix: {prefix}")
+        self.ssm_client = create_client("ssm", region_name=region_name)
+        self._cache = TieredCache(
+            "parameters",
+            ttl=float(
+                os.environ.get(
+                    "PARAMETER_CACHE_TTL_SECONDS", PARAMETER_CACHE_TTL_SECONDS
+                )
+            ),
+        )
+        logger.info("Initialized Parameter Store client with prefix: %s", prefix)
 
     def get_parameter(self, parameter_name: str, decrypt: bool = True) -> Optional[str]:
         """
@@ -52,9 +64,10 @@ class ParameterStoreClient:
         """
         # Check cache first
         cache_key = f"{self.prefix}{parameter_name}"
-        if cache_key in self._cache:
-            logger.debug(f"Retrieved parameter from cache: {cache_key}")
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Retrieved parameter from cache: %s", cache_key)
+            return cached
 
         # Retrieve from Parameter Store
         full_parameter_name = f"{self.prefix}{parameter_name}"
@@ -67,9 +80,9 @@ class ParameterStoreClient:
             value = response["Parameter"]["Value"]
 
             # Cache the value
-            self._cache[cache_key] = value
+            self._cache.set(cache_key, value)
 
-            logger.info(f"Retrieved and cached parameter: {full_parameter_name}")
+            logger.info("Retrieved and cached parameter: %s", full_parameter_name)
             return value
 
         except ClientError as e:
@@ -77,13 +90,15 @@ class ParameterStoreClient:
 
             if error_code == "ParameterNotFound":
                 logger.error(
-                    f"Parameter not found: {full_parameter_name}. "
-                    f"Ensure the parameter exists in Parameter Store."
+                    "Parameter not found: %s. Ensure the parameter exists in Parameter Store.",
+                    full_parameter_name,
                 )
             else:
                 logger.error(
-                    f"ClientError retrieving parameter {full_parameter_name}: "
-                    f"{error_code} - {e}",
+                    "ClientError retrieving parameter %s: %s - %s",
+                    full_parameter_name,
+                    error_code,
+                    e,
                     exc_info=True,
                 )
 
@@ -93,7 +108,9 @@ class ParameterStoreClient:
 
         except BotoCoreError as e:
             logger.error(
-                f"BotoCoreError retrieving parameter {full_parameter_name}: {e}",
+                "BotoCoreError retrieving parameter %s: %s",
+                full_parameter_name,
+                e,
                 exc_info=True,
             )
             raise ValueError(
@@ -102,7 +119,9 @@ class ParameterStoreClient:
 
         except Exception as e:
             logger.error(
-                f"Unexpected error retrieving parameter {full_parameter_name}: {e}",
+                "Unexpected error retrieving parameter %s: %s",
+                full_parameter_name,
+                e,
                 exc_info=True,
             )
             raise ValueError(
@@ -139,6 +158,56 @@ class ParameterStoreClient:
             raise ValueError("Discord guild ID is empty or None")
         return guild_id
 
+    def prefetch_parameters(self, parameter_names: List[str]) -> int:
+        """
+        Retrieve several parameters in one request and cache them.
+
+        Used to warm the cache before the first invocation. Failures are logged
+        rather than raised; get_parameter() retries missing parameters later.
+
+        Args:
+            parameter_names: Names of the parameters (without prefix), at most 10
+
+        Returns:
+            Number of parameters cached
+        """
+        names = [f"{self.prefix}{name}" for name in parameter_names]
+
+        try:
+            response = self.ssm_client.get_parameters(Names=names, WithDecryption=True)
+
+            for parameter in response.get("Parameters", []):
+                self._cache.set(parameter["Name"], parameter["Value"])
+
+            invalid = response.get("InvalidParameters", [])
+            if invalid:
+                logger.warning("Parameters not found: %s", ", ".join(invalid))
+
+            logger.info(
+                "Prefetched %s parameter(s)", len(response.get("Parameters", []))
+            )
+            return len(response.get("Parameters", []))
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.warning(
+                "ClientError prefetching parameters: %s - %s",
+                error_code,
+                e,
+                exc_info=True,
+            )
+            return 0
+
+        except BotoCoreError as e:
+            logger.warning("BotoCoreError prefetching parameters: %s", e, exc_info=True)
+            return 0
+
+        except Exception as e:
+            logger.warning(
+                "Unexpected error prefetching parameters: %s", e, exc_info=True
+            )
+            return 0
+
     def clear_cache(self) -> None:
         """
         Clear the parameter cache.
@@ -155,4 +224,4 @@ class ParameterStoreClient:
         Returns:
             Dictionary of cached parameters
         """
-        return self._cache.copy()
+        return self._cache.items()
@@ -1,9 +1,309 @@
 """
 This module defines the LoggerConfig class, which is responsible for configuring and providing a logger instance.
 It initializes the logger with a specified class name and provides a method to retrieve the logger instance.
+It also provides the JSON formatter used for CloudWatch, per-logger levels, lazy payload truncation and
+sampling of high-volume per-user and per-message logs. Records can be shipped through a background thread
+so that emitting a log in a hot loop only costs a queue put.
 """
 
+import atexit
+import copy
+import itertools
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+# Longest message, or truncated payload, written to the logs
+DEFAULT_MAX_LENGTH = 2000
+
+# Fraction of sampled INFO/DEBUG records that are written (warnings and errors always are)
+DEFAULT_SAMPLE_RATE = 0.1
+
+# Records written to the stream in one write by the buffered handler
+DEFAULT_BATCH_SIZE = 100
+
+# Longest time flush() waits for buffered records to be written
+DEFAULT_FLUSH_TIMEOUT = 2.0
+
+# LogRecord attributes that are not user-supplied extra fields
+_RECORD_ATTRIBUTES = set(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+def _max_length() -> int:
+    return int(os.environ.get("LOG_MAX_LENGTH", DEFAULT_MAX_LENGTH))
+
+
+def truncate_text(text: str, max_length: int = None) -> str:
+    """
+    Shorten text to at most max_length characters, noting how much was cut.
+    Args:
+        text (str): Text to shorten.
+        max_length (int): Maximum length. If None, LOG_MAX_LENGTH or the default is used.
+    Returns:
+        str: The text, truncated if it was too long.
+    """
+    max_length = max_length or _max_length()
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... ({len(text) - max_length} more chars)"
+
+
+class Truncated:
+    """
+    Log argument that is serialised and truncated only if the record is written.
+
+        logger.debug("Event payload: %s", Truncated(event))
+    """
+
+    __slots__ = ("value", "max_length")
+
+    def __init__(self, value: Any, max_length: int = None):
+        self.value = value
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        text = (
+            self.value
+            if isinstance(self.value, str)
+            else json.dumps(self.value, default=str)
+        )
+        return truncate_text(text, self.max_length)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    JsonFormatter writes each record as one JSON object.
+    Extra fields passed with extra={...} are included as top-level keys, and
+    messages longer than LOG_MAX_LENGTH are truncated.
+    """
+
+    def __init__(self, max_length: int = None):
+        super().__init__()
+        self.max_length = max_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "name": record.name,
+            "message": truncate_text(record.getMessage(), self.max_length),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class BufferedLogHandler(logging.handlers.QueueHandler):
+    """
+    BufferedLogHandler hands records to a background thread, which formats
+    them and writes them to the stream in batches. The calling thread only
+    resolves the message and puts the record on a queue.
+
+    Call flush() before returning from a Lambda invocation: records still in
+    the queue when the execution environment is frozen are written late, or
+    lost if it is shut down.
+    """
+
+    def __init__(self, stream=None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize the handler and start its writer thread.
+        Args:
+            stream: Stream records are written to (default: sys.stderr).
+            batch_size (int): Maximum number of records written in one write.
+        """
+        super().__init__(queue.SimpleQueue())
+        self.stream = stream or sys.stderr
+        self.batch_size = batch_size
+        self._thread = threading.Thread(
+            target=self._write_batches, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve the message now, since its arguments may change before the
+        writer thread formats the record. Formatting is left to that thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def _write_batches(self) -> None:
+        """Write queued records until close() enqueues None."""
+        while True:
+            items = [self.queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: List[str] = []
+            flushed: List[threading.Event] = []
+            stop = False
+            for item in items:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    try:
+                        lines.append(self.format(item))
+                    except Exception:
+                        self.handleError(item)
+
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    pass
+            for event in flushed:
+                event.set()
+            if stop:
+                return
+
+    def flush(self, timeout: float = DEFAULT_FLUSH_TIMEOUT) -> bool:
+        """
+        Wait until every record queued so far has been written.
+        Args:
+            timeout (float): Longest time to wait in seconds.
+        Returns:
+            bool: True if the records were written within the timeout.
+        """
+        if not self._thread.is_alive():
+            return True
+        written = threading.Event()
+        self.queue.put(written)
+        return written.wait(timeout)
+
+    def close(self) -> None:
+        """Write the remaining records and stop the writer thread."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join(DEFAULT_FLUSH_TIMEOUT)
+        super().close()
+
+
+class SampledLogger(logging.LoggerAdapter):
+    """
+    SampledLogger writes one in every N records below WARNING, where N is
+    1 / sample rate, and every warning and error. Written records carry the
+    sample rate so counts can be scaled back up.
+    """
+
+    def __init__(self, logger: logging.Logger, sample_rate: float = None):
+        super().__init__(logger, {})
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("LOG_SAMPLE_RATE", DEFAULT_SAMPLE_RATE))
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self._every = round(1 / self.sample_rate) if self.sample_rate else 0
+        self._counter = itertools.count()
+
+    def log(self, level, msg, *args, **kwargs):
+        if level < logging.WARNING and self.isEnabledFor(level):
+            # Count only records that would otherwise be written
+            if not self._every or next(self._counter) % self._every:
+                return
+        super().log(level, msg, *args, **kwargs)
+
+    def process(self, msg, kwargs):
+        if self.sample_rate < 1.0:
+            kwargs["extra"] = {
+                **kwargs.get("extra", {}),
+                "sample_rate": self.sample_rate,
+            }
+        return msg, kwargs
+
+
+def parse_logger_levels(value: Optional[str]) -> Dict[str, int]:
+    """
+    Parse per-logger levels written as "name=LEVEL,name=LEVEL".
+    Args:
+        value (str): Level settings, e.g. "services.discord=DEBUG,botocore=WARNING".
+    Returns:
+        Dict[str, int]: Logging level by logger name. Malformed entries are skipped.
+    """
+    levels = {}
+    for entry in (value or "").split(","):
+        name, _, level = entry.partition("=")
+        level = getattr(logging, level.strip().upper(), None)
+        if name.strip() and isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+def configure_logging(
+    log_level: str = "INFO", logger_levels: str = None, buffered: bool = None
+) -> logging.Logger:
+    """
+    Configure the root logger to write JSON records to stderr.
+    Args:
+        log_level (str): Level of the root logger (INFO, DEBUG, ERROR).
+        logger_levels (str): Per-logger levels as "name=LEVEL,..." (see parse_logger_levels).
+        buffered (bool): Whether records are written by a background thread
+                         (see BufferedLogHandler). If None, the LOG_BUFFERED
+                         env var is used, defaulting to true.
+    Returns:
+        logging.Logger: The root logger.
+    """
+    logger = logging.getLogger()
+    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+
+    # Remove existing handlers to avoid duplicate logs
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        if isinstance(handler, BufferedLogHandler):
+            handler.close()
+
+    if buffered is None:
+        buffered = os.environ.get("LOG_BUFFERED", "true").lower() == "true"
+
+    # The handler passes everything, so per-logger levels decide what is written
+    handler = BufferedLogHandler() if buffered else logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+
+    for name, level in parse_logger_levels(logger_levels).items():
+        logging.getLogger(name).setLevel(level)
+
+    return logger
+
+
+def flush_logging(timeout: float = DEFAULT_FLUSH_TIMEOUT) -> bool:
+    """
+    Write every buffered record of the root logger's handlers.
+    Args:
+        timeout (float): Longest time to wait for each buffered handler in seconds.
+    Returns:
+        bool: True if all buffered records were written within the timeout.
+    """
+    flushed = True
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, BufferedLogHandler):
+            flushed = handler.flush(timeout) and flushed
+        else:
+            handler.flush()
+    return flushed
+
+
+atexit.register(flush_logging)
 
 
 class LoggerConfig:
@@ -22,3 +322,14 @@ class LoggerConfig:
             logging.Logger: The logger instance configured for the specified class.
         """
         return self.logger
+
+    def get_sampled_logger(self, sample_rate: float = None) -> SampledLogger:
+        """
+        Get a sampling wrapper around the logger for per-user and per-message logs.
+        Args:
+            sample_rate (float): Fraction of INFO/DEBUG records to write.
+                                 If None, LOG_SAMPLE_RATE or the default of 0.1 is used.
+        Returns:
+            SampledLogger: The sampling logger.
+        """
+        return SampledLogger(self.logger, sample_rate)
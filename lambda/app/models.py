@@ -3,11 +3,14 @@ Data models for The Herald bot configuration and data structures.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 import yaml
 
+# Discord allows at most 10 embeds in a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+
 
 @dataclass
 class Feed:
@@ -36,6 +39,31 @@ class Feed:
             raise ValueError("Feed URL must be a valid HTTP/HTTPS URL")
 
 
+@dataclass
+class ChannelConfig:
+    """
+    Represents per-channel publishing options.
+
+    Attributes:
+        name: Discord channel name the options apply to
+        digest: Whether new articles are batched into embed digests
+        digest_size: Maximum number of articles packed into one digest message
+    """
+
+    name: str
+    digest: bool = False
+    digest_size: int = MAX_EMBEDS_PER_MESSAGE
+
+    def __post_init__(self):
+        """Validate channel data after initialization."""
+        if not self.name:
+            raise ValueError("Channel name cannot be empty")
+        if not 1 <= self.digest_size <= MAX_EMBEDS_PER_MESSAGE:
+            raise ValueError(
+                f"Digest size must be between 1 and {MAX_EMBEDS_PER_MESSAGE}"
+            )
+
+
 @dataclass
 class FeedsConfig:
     """
@@ -43,9 +71,11 @@ class FeedsConfig:
 
     Attributes:
         feeds: List of Feed objects
+        channels: List of ChannelConfig objects with per-channel options
     """
 
     feeds: List[Feed]
+    channels: List[ChannelConfig] = field(default_factory=list)
 
     @classmethod
     def from_yaml(cls, yaml_path: str = None) -> "FeedsConfig":
@@ -92,7 +122,23 @@ class FeedsConfig:
             except KeyError as e:
                 raise ValueError(f"Missing required field in feed configuration: {e}")
 
-        return cls(feeds=feeds)
+        channels = []
+        for channel_data in config_data.get("channels") or []:
+            try:
+                channel = ChannelConfig(
+                    name=channel_data["name"],
+                    digest=bool(channel_data.get("digest", False)),
+                    digest_size=int(
+                        channel_data.get("digest_size", MAX_EMBEDS_PER_MESSAGE)
+                    ),
+                )
+                channels.append(channel)
+            except KeyError as e:
+                raise ValueError(
+                    f"Missing required field in channel configuration: {e}"
+                )
+
+        return cls(feeds=feeds, channels=channels)
 
     def get_feeds_by_channel(self, channel_name: str) -> List[Feed]:
         """
@@ -132,3 +178,18 @@ class FeedsConfig:
             List of unique Discord channel names
         """
         return list(set(feed.channel_name for feed in self.feeds))
+
+    def get_channel_config(self, channel_name: str) -> ChannelConfig:
+        """
+        Get the publishing options for a specific Discord channel.
+
+        Args:
+            channel_name: Name of the Discord channel
+
+        Returns:
+            ChannelConfig for the channel, or the defaults if none is configured
+        """
+        for channel in self.channels:
+            if channel.name == channel_name:
+                return channel
+        return ChannelConfig(name=channel_name)
@@ -0,0 +1,187 @@
+"""
+This module defines the ChannelMirror class, which keeps an incremental copy of the links
+posted to Discord channels. Each channel's mirror stores the newest message ID it has seen
+and the links found in recent messages, so a run only fetches the messages posted after
+that ID instead of re-reading the channel's history.
+"""
+
+import time
+from typing import Callable, Dict, List, Set
+from config.logger import LoggerConfig
+from utils.cache import TieredCache
+from utils.deadline import Deadline
+
+# Discord returns at most 100 messages per page
+MESSAGES_PAGE_SIZE = 100
+
+# Links are remembered for this many of a channel's newest messages
+MIRROR_MAX_MESSAGES = 500
+
+# Pages read to catch up before a full resync is cheaper
+MIRROR_MAX_PAGES = 5
+
+# Mirrors are rebuilt from the channel daily, dropping deleted messages and
+# picking up edits to messages already mirrored
+MIRROR_RESYNC_SECONDS = 86400
+
+
+def message_links(message: dict) -> List[str]:
+    """
+    Get the links a message was posted with.
+
+    Args:
+        message: Discord message object
+
+    Returns:
+        The message content, followed by the URLs of its embeds
+    """
+    # Digest messages carry their links in embeds rather than content
+    links = [message["content"]]
+    links.extend(
+        embed["url"] for embed in message.get("embeds", []) if embed.get("url")
+    )
+    return links
+
+
+class ChannelMirror:
+    """
+    ChannelMirror tracks the links posted to channels with a per-channel cursor.
+    The first sync of a channel reads its latest messages; later syncs read
+    only the messages after the newest one seen. Edits and deletes of
+    mirrored messages are picked up lazily, when the mirror is rebuilt.
+
+    Attributes:
+        request (Callable): Sends a Discord API request, e.g. DiscordService._request.
+        cache (TieredCache): Cache the mirrors are stored in between runs.
+        max_messages (int): Newest messages whose links are kept per channel.
+        resync_seconds (float): Age at which a mirror is rebuilt from the channel.
+    """
+
+    def __init__(
+        self,
+        request: Callable,
+        cache: TieredCache,
+        max_messages: int = MIRROR_MAX_MESSAGES,
+        resync_seconds: float = MIRROR_RESYNC_SECONDS,
+    ):
+        """
+        Initialize the ChannelMirror.
+
+        Args:
+            request: Function sending a Discord API request, called with the
+                     method, path and run deadline and returning a requests.Response.
+            cache: Cache the mirrors are stored in, e.g. the DiscordService cache.
+                   A stale copy is safe: the sync fetches everything after its cursor.
+            max_messages: Newest messages whose links are kept per channel.
+            resync_seconds: Age at which a mirror is rebuilt from the channel.
+        """
+        self.logger = LoggerConfig(__name__).get_logger()
+        self.request = request
+        self.cache = cache
+        self.max_messages = max_messages
+        self.resync_seconds = resync_seconds
+
+    def get_links(self, channel_id: str, deadline: Deadline = None) -> Set[str]:
+        """
+        Sync a channel's mirror and get the links posted to it.
+
+        Args:
+            channel_id: ID of the Discord channel
+            deadline: Run deadline passed on to every request
+
+        Returns:
+            Links of the channel's newest messages (up to max_messages)
+        """
+        cache_key = f"channel_mirror:{channel_id}"
+        mirror = self.cache.get(cache_key)
+
+        if mirror is None or not self._catch_up(channel_id, mirror, deadline):
+            mirror = self._full_sync(channel_id, deadline)
+
+        # The entry expires when the mirror is due to be rebuilt
+        ttl = mirror["synced_at"] + self.resync_seconds - time.time()
+        if ttl > 0:
+            self.cache.set(cache_key, mirror, ttl=ttl)
+
+        return {link for links in mirror["messages"].values() for link in links}
+
+    def _fetch(
+        self, channel_id: str, after: str = None, deadline: Deadline = None
+    ) -> list:
+        """Fetch one page of messages, newest first when after is not given."""
+        path = f"/channels/{channel_id}/messages?limit={MESSAGES_PAGE_SIZE}"
+        if after:
+            path += f"&after={after}"
+        return self.request("GET", path, deadline=deadline).json()
+
+    def _full_sync(self, channel_id: str, deadline: Deadline = None) -> dict:
+        """
+        Build a channel's mirror from its latest messages.
+
+        Args:
+            channel_id: ID of the Discord channel
+            deadline: Run deadline passed on to every request
+
+        Returns:
+            New mirror with the cursor at the newest message
+        """
+        mirror = {"cursor": None, "synced_at": time.time(), "messages": {}}
+        self._add_messages(mirror, self._fetch(channel_id, deadline=deadline))
+        self.logger.info(
+            "Mirrored %d message(s) of channel %s",
+            len(mirror["messages"]),
+            channel_id,
+        )
+        return mirror
+
+    def _catch_up(
+        self, channel_id: str, mirror: dict, deadline: Deadline = None
+    ) -> bool:
+        """
+        Add the messages posted after a mirror's cursor.
+
+        Args:
+            channel_id: ID of the Discord channel
+            mirror: Mirror to update in place
+            deadline: Run deadline passed on to every request
+
+        Returns:
+            True if the mirror caught up, False if more than MIRROR_MAX_PAGES
+            pages were behind and it should be rebuilt instead
+        """
+        if mirror["cursor"] is None:
+            return False
+
+        added = 0
+        for _ in range(MIRROR_MAX_PAGES):
+            page = self._fetch(channel_id, after=mirror["cursor"], deadline=deadline)
+            self._add_messages(mirror, page)
+            added += len(page)
+            if len(page) < MESSAGES_PAGE_SIZE:
+                self.logger.debug(
+                    "Mirror of channel %s caught up with %d new message(s)",
+                    channel_id,
+                    added,
+                )
+                return True
+
+        self.logger.info(
+            "Mirror of channel %s is more than %d pages behind - rebuilding it",
+            channel_id,
+            MIRROR_MAX_PAGES,
+        )
+        return False
+
+    def _add_messages(self, mirror: dict, messages: list) -> None:
+        """Add messages to a mirror, advance its cursor and drop the oldest entries."""
+        entries: Dict[str, List[str]] = mirror["messages"]
+        for message in messages:
+            entries[message["id"]] = message_links(message)
+
+        if not entries:
+            return
+        # Snowflake IDs grow over time; compare them as integers
+        newest_first = sorted(entries, key=int, reverse=True)
+        mirror["cursor"] = newest_first[0]
+        for message_id in newest_first[self.max_messages :]:
+            del entries[message_id]
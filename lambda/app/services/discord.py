@@ -3,13 +3,83 @@ DiscordService is responsible for interacting with the Discord API.
 It provides methods to get channel IDs and check messages in a Discord channel.
 """
 
+import asyncio
+from collections import deque
 from datetime import datetime, timedelta, timezone
+import os
 import time
 import json
+from typing import List
+import aiohttp
 import requests
-from config.logger import LoggerConfig
+from config.logger import LoggerConfig, Truncated
 from clients.parameter_store import ParameterStoreClient
-from clients.dynamodb import DynamoDBClient
+from clients.dynamodb import UNDELIVERABLE_TTL_SECONDS, DynamoDBClient
+from clients.lambda_invoker import LambdaInvoker
+from models import MAX_EMBEDS_PER_MESSAGE
+from services.discord_async import (
+    AsyncDiscordService,
+    DEFAULT_CONCURRENCY,
+    DISCORD_API_BASE_URL,
+    DM_CHANNEL_CACHE_TTL_SECONDS,
+    dm_channel_cache_key,
+)
+from services.channel_mirror import ChannelMirror, message_links
+from services.event_index import EventIndex
+from utils.cache import MemoryTier, TieredCache, build_cache
+from utils.deadline import Deadline
+from utils.rate_limit import AsyncRateLimiter, RateLimiter, route_key
+from utils.token_bucket import DEFAULT_RATE, PRIORITY_HIGH, SharedTokenBucket
+from utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_server_failure,
+)
+
+DEFAULT_SHARD_SIZE = 100
+
+# Discord error code for a user who does not accept DMs from the bot
+CANNOT_DM_USER_ERROR_CODE = 50007
+
+# Discord's limit on the length of message content
+MAX_MESSAGE_LENGTH = 2000
+
+# Discord returns at most 100 users per scheduled-event users page
+EVENT_USERS_PAGE_SIZE = 100
+
+# Guild channels are listed again after 15 minutes, so new channels are found
+CHANNEL_CACHE_TTL_SECONDS = 900
+
+# Users known not to accept DMs are kept in memory up to this many at a time.
+# Users read from DynamoDB are checked there again after an hour, since their
+# record may be close to expiring; users marked by this process are kept
+# until their new record expires.
+UNDELIVERABLE_CACHE_MAX_ENTRIES = 10000
+UNDELIVERABLE_RECHECK_SECONDS = 3600
+
+# Rate limits belong to the bot token, so every run and container shares one entry
+RATE_LIMIT_STATE_CACHE_KEY = "rate_limits"
+
+
+def is_undeliverable_dm_error(error: Exception) -> bool:
+    """
+    Check whether a failed request means the user does not accept DMs.
+    Args:
+        error (Exception): Error raised by DiscordService or AsyncDiscordService.
+    Returns:
+        bool: True if Discord rejected the DM with error code 50007.
+    """
+    try:
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            body = error.response.json()
+        elif isinstance(error, aiohttp.ClientResponseError):
+            body = json.loads(error.message)
+        else:
+            return False
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("code") == CANNOT_DM_USER_ERROR_CODE
 
 
 class DiscordService:
@@ -19,13 +89,48 @@ class DiscordService:
     Attributes:
         token (str): Discord bot token for authentication.
         guild_id (str): ID of the Discord guild (server) to interact with.
+        parameter_store_client (ParameterStoreClient): Client the credentials were read from.
         dynamodb_client (DynamoDBClient): Client for reminder state tracking.
+        rate_limiter (RateLimiter): Tracker for Discord's per-route rate limits,
+            or None when a shared rate-limit proxy owns the buckets.
+        invoker (LambdaInvoker): Invoker used to fan reminder shards out to other invocations.
+        shard_size (int): Maximum number of subscribers handled by one reminder shard.
+        base_url (str): Base URL of the Discord REST API, or of a proxy serving the same paths.
+        session (requests.Session): HTTP session every Discord request is sent through.
+            The newsletter publishes to several channels from worker threads over
+            this one session: requests take their headers and deadline per call,
+            and the adapter's connection pool is thread-safe and holds more
+            connections than there are workers.
+        concurrency (int): Maximum number of reminders sent at once through the async service.
+        event_index (EventIndex): Index of event subscribers kept up to date from the gateway.
+        retry_policy (RetryPolicy): Decides which failed requests are retried and how long to wait.
+        circuit_breaker (CircuitBreaker): Per-route breaker that fails requests fast after repeated failures.
+        fallback_channel (str): Channel where users who do not accept DMs are mentioned instead.
+        undeliverable_users (TieredCache): Users known not to accept DMs, by ID.
+        cache (TieredCache): Cache of guild channels and DM channel IDs.
+        channel_mirror (ChannelMirror): Incremental mirror of channel links, or None to read the latest messages.
+        rate_limit_state (bool): Whether rate-limit state is saved to the cache for the next run.
     """
 
     def __init__(
         self,
         parameter_store_client: ParameterStoreClient = None,
         dynamodb_client: DynamoDBClient = None,
+        rate_limiter: RateLimiter = None,
+        invoker: LambdaInvoker = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        base_url: str = None,
+        session: requests.Session = None,
+        rate_limit_proxy: bool = None,
+        concurrency: int = None,
+        event_index: EventIndex = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        fallback_channel: str = None,
+        cache: TieredCache = None,
+        channel_mirror: bool = None,
+        rate_limit_state: bool = None,
+        request_priority: str = PRIORITY_HIGH,
     ):
         """
         Initialize the DiscordService.
@@ -35,12 +140,62 @@ class DiscordService:
                                    If None, a default client will be created.
             dynamodb_client: Client for reminder state tracking in DynamoDB.
                             If None, reminder tracking will be disabled.
+            rate_limiter: Tracker for Discord rate-limit buckets.
+                          If None, a new tracker is created. It takes tokens
+                          from the global limit shared through dynamodb_client
+                          when SHARED_RATE_LIMIT_ENABLED is set.
+            invoker: Invoker for reminder shards (LambdaInvoker or LocalInvoker).
+                     If None, all reminders are sent by this invocation.
+            shard_size: Subscriber count above which an event's reminders are
+                        split into shards and fanned out through the invoker.
+            base_url: Base URL for API requests.
+                      If None, DISCORD_API_BASE_URL env var or the Discord API is used.
+            session: Session used to send requests, e.g. one with custom adapters.
+                     If None, a new session is created so connections are reused.
+            rate_limit_proxy: Whether base_url is a shared proxy that enforces
+                              Discord rate limits for every container. Local
+                              bucket tracking is then skipped and only 429s are
+                              honoured. If None, the DISCORD_RATE_LIMIT_PROXY
+                              env var is used.
+            concurrency: Maximum number of reminders sent at once. Values above 1
+                         send reminders through AsyncDiscordService; 1 sends them
+                         one by one. If None, the DISCORD_CONCURRENCY env var or
+                         the default of 10 is used.
+            event_index: Index of event subscribers maintained by the gateway
+                         listener. If None, or if an event is not indexed,
+                         subscribers are listed from the Discord API.
+            retry_policy: Retry policy for failed requests.
+                          If None, the default RetryPolicy is used.
+            circuit_breaker: Per-route circuit breaker.
+                             If None, a new breaker is created.
+            fallback_channel: Name of the channel where users who do not accept
+                              DMs are mentioned instead. If None, the
+                              REMINDER_FALLBACK_CHANNEL env var is used; if that
+                              is unset, those users are skipped.
+            cache: Cache of guild channels and DM channel IDs.
+                   If None, one is built with build_cache(), sharing entries
+                   through dynamodb_client when CACHE_SHARED_ENABLED is set.
+            channel_mirror: Whether channel links are read from a mirror kept in
+                            the cache and synced with only the messages posted
+                            since the last run. If None, the
+                            CHANNEL_MIRROR_ENABLED env var is used.
+            rate_limit_state: Whether the known rate limits are saved to the
+                              cache at the end of a run and loaded at the start
+                              of the next. If None, the RATE_LIMIT_STATE_ENABLED
+                              env var is used, which defaults to true.
+            request_priority: Priority of this service's requests in the shared
+                              global limit, e.g. PRIORITY_LOW for newsletter posts
+                              so reminders are sent first.
         """
-        self.logger = LoggerConfig(__name__).get_logger()
+        logger_config = LoggerConfig(__name__)
+        self.logger = logger_config.get_logger()
+        # Per-user and per-message logs are sampled at reminder volumes
+        self.sampled_logger = logger_config.get_sampled_logger()
 
         # Initialize Parameter Store client if not provided
         if parameter_store_client is None:
             parameter_store_client = ParameterStoreClient()
+        self.parameter_store_client = parameter_store_client
 
         # Retrieve Discord credentials from Parameter Store
         try:
@@ -50,9 +205,51 @@ class DiscordService:
                 "Successfully retrieved Discord credentials from Parameter Store"
             )
         except ValueError as e:
-            self.logger.error(f"Failed to retrieve Discord credentials: {e}")
+            self.logger.error("Failed to retrieve Discord credentials: %s", e)
             raise
 
+        self.base_url = (
+            base_url or os.environ.get("DISCORD_API_BASE_URL") or DISCORD_API_BASE_URL
+        ).rstrip("/")
+        self.session = session or requests.Session()
+
+        if rate_limit_proxy is None:
+            rate_limit_proxy = (
+                os.environ.get("DISCORD_RATE_LIMIT_PROXY", "").lower() == "true"
+            )
+        if rate_limit_proxy:
+            # The proxy shares buckets across containers; tracking them here too
+            # would only add waits based on this container's partial view
+            self.rate_limiter = None
+            self.logger.info("Routing Discord requests through rate-limit proxy")
+        else:
+            self.rate_limiter = rate_limiter or RateLimiter(
+                shared_budget=self._shared_budget(dynamodb_client),
+                priority=request_priority,
+            )
+        self.invoker = invoker
+        self.shard_size = shard_size
+        self.event_index = event_index
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.fallback_channel = fallback_channel or os.environ.get(
+            "REMINDER_FALLBACK_CHANNEL"
+        )
+        # Cached alongside DynamoDB so a warm container skips the lookup
+        self.undeliverable_users = TieredCache(
+            "undeliverable_users",
+            tiers=[MemoryTier(max_entries=UNDELIVERABLE_CACHE_MAX_ENTRIES)],
+            ttl=UNDELIVERABLE_TTL_SECONDS,
+        )
+        self.concurrency = max(
+            1,
+            int(
+                concurrency
+                or os.environ.get("DISCORD_CONCURRENCY")
+                or DEFAULT_CONCURRENCY
+            ),
+        )
+
         # Store DynamoDB client for reminder tracking
         self.dynamodb_client = dynamodb_client
         if self.dynamodb_client:
@@ -61,75 +258,278 @@ class DiscordService:
             self.logger.warning(
                 "No DynamoDB client provided - reminder tracking disabled"
             )
+        # An empty cache is falsy, so test for None explicitly
+        if cache is None:
+            cache = build_cache("discord", dynamodb_client=dynamodb_client)
+        self.cache = cache
+
+        if channel_mirror is None:
+            channel_mirror = (
+                os.environ.get("CHANNEL_MIRROR_ENABLED", "").lower() == "true"
+            )
+        self.channel_mirror = (
+            ChannelMirror(self._request, self.cache) if channel_mirror else None
+        )
+
+        if rate_limit_state is None:
+            rate_limit_state = (
+                os.environ.get("RATE_LIMIT_STATE_ENABLED", "true").lower() == "true"
+            )
+        self.rate_limit_state = rate_limit_state
+
+    def _shared_budget(self, dynamodb_client: DynamoDBClient) -> SharedTokenBucket:
+        """
+        Build the global request budget shared with other invocations.
+        Args:
+            dynamodb_client (DynamoDBClient): Client holding the token counters.
+        Returns:
+            SharedTokenBucket: The budget, or None if SHARED_RATE_LIMIT_ENABLED
+                               is not set or there is no DynamoDB client.
+        """
+        enabled = os.environ.get("SHARED_RATE_LIMIT_ENABLED", "").lower() == "true"
+        if not enabled or dynamodb_client is None:
+            return None
+
+        rate = int(os.environ.get("SHARED_RATE_LIMIT_PER_SECOND") or DEFAULT_RATE)
+        self.logger.info("Sharing a global budget of %d request(s) per second", rate)
+        return SharedTokenBucket(dynamodb_client, rate=rate)
+
+    def load_rate_limit_state(self) -> int:
+        """
+        Seed the rate limiter with the limits saved by a previous run, so a run
+        that starts while a bucket or the global limit is exhausted waits for
+        the reset instead of running into 429s.
+        Returns:
+            int: Number of buckets loaded.
+        """
+        if not (self.rate_limit_state and self.rate_limiter):
+            return 0
+
+        try:
+            state = self.cache.get(RATE_LIMIT_STATE_CACHE_KEY)
+            if not state:
+                return 0
+            loaded = self.rate_limiter.load_state(state)
+        except Exception as e:
+            # A run without the saved limits only relearns them
+            self.logger.warning("Could not load rate-limit state: %s", e)
+            return 0
+
+        self.logger.info("Loaded rate-limit state for %d bucket(s)", loaded)
+        return loaded
+
+    def save_rate_limit_state(self) -> None:
+        """
+        Save the rate limits still in effect for the next run.
+        The entry expires when the last of them resets.
+        """
+        if not (self.rate_limit_state and self.rate_limiter):
+            return
+
+        try:
+            state = self.rate_limiter.export_state()
+            resets = [state["global_reset_at"]] + [
+                bucket["reset_at"] for bucket in state["buckets"].values()
+            ]
+            ttl = max(resets) - time.time()
+            if ttl <= 0:
+                return
+            self.cache.set(RATE_LIMIT_STATE_CACHE_KEY, state, ttl=ttl)
+        except Exception as e:
+            self.logger.warning("Could not save rate-limit state: %s", e)
+            return
+
+        self.logger.info(
+            "Saved rate-limit state for %d bucket(s)", len(state["buckets"])
+        )
+
+    def open_connection(self, timeout: float = 5) -> bool:
+        """
+        Open a pooled connection to the Discord API (or rate-limit proxy), so
+        the first request of a run skips the TLS handshake. The request is not
+        authenticated and does not count against any rate-limit bucket.
+        Args:
+            timeout (float): Longest time to wait for a response, in seconds.
+        Returns:
+            bool: True if a response was received, whatever its status.
+        """
+        try:
+            self.session.head(self.base_url, timeout=timeout)
+            return True
+        except requests.RequestException as e:
+            self.logger.warning("Could not open connection to %s: %s", self.base_url, e)
+            return False
 
     def _make_request_with_retry(
-        self, method: str, url: str, headers: dict, **kwargs
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        deadline: Deadline = None,
+        **kwargs,
     ) -> requests.Response:
         """
-        Make a request to Discord API with automatic retry on rate limits.
+        Make a request to Discord API, retrying failures the retry policy
+        considers transient. Requests wait on the route's rate-limit bucket,
+        so a rate-limited route does not delay requests to other routes.
 
         Args:
             method (str): HTTP method (GET, POST, etc.)
             url (str): Request URL
             headers (dict): Request headers
+            deadline (Deadline): Run deadline; retries never wait past it.
             **kwargs: Additional arguments for requests
 
         Returns:
             requests.Response: The response object
 
         Raises:
-            requests.HTTPError: If request fails after retries
+            requests.RequestException: If the request fails and is not retried
+            CircuitOpenError: If the route's circuit breaker is open
         """
-        max_retries = 5
-        base_delay = 1
+        route = route_key(method, url)
+        delay = None
 
-        # Add a small delay before the first request to avoid rapid-fire requests
-        time.sleep(3)
+        for attempt in range(self.retry_policy.max_attempts):
+            if self.circuit_breaker and not self.circuit_breaker.allow(route):
+                raise CircuitOpenError(route)
 
-        for attempt in range(max_retries):
+            retry_after = None
             try:
-                response = requests.request(
+                # Wait for the route's rate-limit bucket instead of a fixed delay
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(route)
+                response = self.session.request(
                     method, url, headers=headers, timeout=10, **kwargs
                 )
+                if self.rate_limiter:
+                    self.rate_limiter.update(
+                        route, response.headers, response.status_code
+                    )
 
-                if response.status_code == 429:
-                    # Rate limited - check if Discord provided retry-after header
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        wait_time = int(retry_after)
-                        self.logger.warning(
-                            f"Rate limited. Waiting {wait_time} seconds as instructed by Discord."
-                        )
-                    else:
-                        # Exponential backoff if no retry-after header
-                        wait_time = base_delay * (2**attempt)
-                        self.logger.warning(
-                            f"Rate limited. Using exponential backoff: {wait_time} seconds."
-                        )
-
-                    if attempt < max_retries - 1:  # Don't sleep on last attempt
-                        time.sleep(wait_time)
-                        continue
+                if response.status_code != 429:
+                    response.raise_for_status()
+                    if self.circuit_breaker:
+                        self.circuit_breaker.record_success(route)
+                    return response
 
-                response.raise_for_status()
-                return response
+                # Rate limited - Discord says how long to wait in Retry-After
+                status = 429
+                if response.headers.get("Retry-After"):
+                    retry_after = float(response.headers["Retry-After"])
+                error = requests.HTTPError(
+                    f"429 Too Many Requests for url: {url}", response=response
+                )
 
             except requests.exceptions.RequestException as e:
-                self.logger.error(f"Request failed on attempt {attempt + 1}: {e}")
-                if attempt == max_retries - 1:
-                    raise
+                error = e
+                status = e.response.status_code if e.response is not None else None
+                if self.rate_limiter and e.response is None:
+                    self.rate_limiter.release(route)
 
-                # Wait before retrying
-                wait_time = base_delay * (2**attempt)
-                time.sleep(wait_time)
+            if self.circuit_breaker and is_server_failure(status):
+                self.circuit_breaker.record_failure(route)
 
-        raise requests.HTTPError(f"Failed to make request after {max_retries} attempts")
+            delay = self.retry_policy.retry_delay(
+                attempt, status, delay, deadline, retry_after
+            )
+            if delay is None:
+                self.logger.error(
+                    "Request to %s failed on attempt %d, not retrying: %s",
+                    route,
+                    attempt + 1,
+                    error,
+                )
+                raise error
 
-    def get_channel_id(self, channel_name: str) -> int:
+            self.logger.warning(
+                "Request to %s failed on attempt %d (%s). Retrying in %.2f seconds.",
+                route,
+                attempt + 1,
+                status or error,
+                delay,
+            )
+            # The rate limiter holds the next attempt until the bucket resets;
+            # behind a rate-limit proxy there is none, so wait here
+            if retry_after is None or not self.rate_limiter:
+                time.sleep(delay)
+
+        raise requests.HTTPError(
+            f"Failed to make request after {self.retry_policy.max_attempts} attempts"
+        )
+
+    def _auth_headers(self) -> dict:
+        """
+        Build the headers sent with every Discord API request.
+        Returns:
+            dict: Authorization and content-type headers.
+        """
+        return {
+            "Authorization": f"Bot {self.token}",
+            "Content-Type": "application/json",
+        }
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        headers: dict = None,
+        deadline: Deadline = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request to the Discord API relative to the configured base URL.
+        Every Discord call goes through here, so the base URL, session and
+        rate limiting apply to all of them.
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            path (str): API path starting with "/", e.g. "/guilds/123/channels"
+            headers (dict): Request headers. Defaults to the authorization headers.
+            deadline (Deadline): Run deadline; retries never wait past it.
+            **kwargs: Additional arguments for requests
+        Returns:
+            requests.Response: The response object
+        Raises:
+            requests.HTTPError: If request fails after retries
+        """
+        return self._make_request_with_retry(
+            method,
+            self.base_url + path,
+            headers or self._auth_headers(),
+            deadline,
+            **kwargs,
+        )
+
+    def async_service(self, deadline: Deadline = None) -> AsyncDiscordService:
+        """
+        Create an AsyncDiscordService with this service's credentials and settings.
+        Both services share rate-limit bucket state and circuit breakers, so
+        requests made through either one count against the same buckets.
+        Args:
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            AsyncDiscordService: Service to use as an async context manager.
+        """
+        return AsyncDiscordService(
+            token=self.token,
+            guild_id=self.guild_id,
+            base_url=self.base_url,
+            rate_limiter=(
+                AsyncRateLimiter(self.rate_limiter) if self.rate_limiter else None
+            ),
+            concurrency=self.concurrency,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            deadline=deadline,
+            cache=self.cache,
+        )
+
+    def get_channel_id(self, channel_name: str, deadline: Deadline = None) -> int:
         """
         Get the ID of a Discord channel by its name.
         Args:
             channel_name (str): Name of the Discord channel.
+            deadline (Deadline): Run deadline; retries never wait past it.
         Returns:
             int: ID of the Discord channel.
         Raises:
@@ -139,28 +539,37 @@ class DiscordService:
         if not channel_name:
             raise ValueError("Channel name cannot be empty.")
 
-        url = f"https://discord.com/api/v10/guilds/{self.guild_id}/channels"
-        headers = {
-            "Authorization": f"Bot {self.token}",
-            "Content-Type": "application/json",
-        }
-
-        response = self._make_request_with_retry("GET", url, headers)
-        channels = response.json()
+        # Channels are published to concurrently; only one thread lists them
+        cache_key = f"guild_channels:{self.guild_id}"
+        channels = self.cache.get_or_load(
+            cache_key,
+            lambda: [
+                {"id": channel["id"], "name": channel["name"]}
+                for channel in self._request(
+                    "GET", f"/guilds/{self.guild_id}/channels", deadline=deadline
+                ).json()
+            ],
+            ttl=CHANNEL_CACHE_TTL_SECONDS,
+        )
         for channel in channels:
             if channel["name"] == channel_name:
                 return channel["id"]
 
+        # The channel may have been created since the list was cached
+        self.cache.delete(cache_key)
         raise ValueError(
             f"Channel '{channel_name}' not found in guild {self.guild_id}."
         )
 
-    def check_messages_in_discord(self, messages: list, channel_id: str) -> list:
+    def check_messages_in_discord(
+        self, messages: list, channel_id: str, deadline: Deadline = None
+    ) -> list:
         """
         Check if the given messages exist in the specified Discord channel.
         Args:
             messages (list): List of messages to check.
             channel_id (str): ID of the Discord channel to check.
+            deadline (Deadline): Run deadline; retries never wait past it.
         Returns:
             list: List of messages that do not exist in the channel.
         """
@@ -169,33 +578,50 @@ class DiscordService:
             self.logger.warning("No messages provided to check.")
             return []
 
-        url = f"https://discord.com/api/v10/channels/{channel_id}/messages?limit=50"
-        headers = {
-            "Authorization": f"Bot {self.token}",
-            "Content-Type": "application/json",
-        }
         new_messages = []
-
-        response = self._make_request_with_retry("GET", url, headers)
-        channel_messages = response.json()
-        message_contents = [
-            channel_message["content"] for channel_message in channel_messages
-        ]
-        self.logger.info("Existing messages in channel: %s", message_contents)
+        message_contents = self.list_channel_links(channel_id, deadline)
 
         for message in messages:
             if message not in message_contents:
-                self.logger.info("This message does not exist: %s", message)
+                self.sampled_logger.info("This message does not exist: %s", message)
                 new_messages.append(message)
 
         return new_messages
 
-    def send_message_to_channel(self, channel_id: str, message: str) -> None:
+    def list_channel_links(self, channel_id: str, deadline: Deadline = None) -> set:
+        """
+        List the content and embed links of the latest messages in a channel.
+        When the channel mirror is enabled, only the messages posted since
+        the last run are fetched.
+        Args:
+            channel_id (str): ID of the Discord channel to read.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            set: Content of the latest messages and the URLs of their embeds.
+        """
+        if self.channel_mirror:
+            message_contents = self.channel_mirror.get_links(channel_id, deadline)
+        else:
+            response = self._request(
+                "GET", f"/channels/{channel_id}/messages?limit=50", deadline=deadline
+            )
+            message_contents = {
+                link for message in response.json() for link in message_links(message)
+            }
+        self.logger.debug(
+            "Existing messages in channel: %s", Truncated(sorted(message_contents))
+        )
+        return message_contents
+
+    def send_message_to_channel(
+        self, channel_id: str, message: str, deadline: Deadline = None
+    ) -> None:
         """
         Send a message to a specified Discord channel.
         Args:
             channel_id (str): ID of the Discord channel to send the message to.
             message (str): The message content to send.
+            deadline (Deadline): Run deadline; retries never wait past it.
         Raises:
             ValueError: If the channel ID or message is empty.
         """
@@ -204,16 +630,13 @@ class DiscordService:
             self.logger.warning("Message cannot be empty.")
             return
 
-        url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
-
-        headers = {
-            "Authorization": f"Bot {self.token}",
-            "Content-Type": "application/json",
-        }
         data = {"content": message}
 
-        response = self._make_request_with_retry(
-            "POST", url, headers, data=json.dumps(data)
+        response = self._request(
+            "POST",
+            f"/channels/{channel_id}/messages",
+            deadline=deadline,
+            data=json.dumps(data),
         )
 
         if response.status_code == 200:
@@ -225,30 +648,112 @@ class DiscordService:
                 response.status_code,
             )
 
-    def list_scheduled_events(self) -> list:
+    def send_embeds_to_channel(
+        self,
+        channel_id: str,
+        embeds: list,
+        content: str = None,
+        deadline: Deadline = None,
+    ) -> None:
+        """
+        Send a message made of embeds to a specified Discord channel.
+        Args:
+            channel_id (str): ID of the Discord channel to send the message to.
+            embeds (list): Embed objects to include (at most 10 per message).
+            content (str): Optional text content shown above the embeds.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Raises:
+            ValueError: If more embeds are given than Discord allows per message.
+        """
+        self.logger.info(
+            "Sending %d embed(s) to channel ID: %s", len(embeds), channel_id
+        )
+        if not embeds:
+            self.logger.warning("Embeds cannot be empty.")
+            return
+        if len(embeds) > MAX_EMBEDS_PER_MESSAGE:
+            raise ValueError(
+                f"A message can contain at most {MAX_EMBEDS_PER_MESSAGE} embeds."
+            )
+
+        data = {"embeds": embeds}
+        if content:
+            data["content"] = content
+
+        response = self._request(
+            "POST",
+            f"/channels/{channel_id}/messages",
+            deadline=deadline,
+            data=json.dumps(data),
+        )
+
+        if response.status_code == 200:
+            self.logger.info("Embeds sent successfully to channel ID: %s", channel_id)
+        else:
+            self.logger.error(
+                "Failed to send embeds to channel ID: %s. Status code: %d",
+                channel_id,
+                response.status_code,
+            )
+
+    def list_scheduled_events(self, deadline: Deadline = None) -> list:
         """
         List scheduled events in the Discord guild.
+        Args:
+            deadline (Deadline): Run deadline; retries never wait past it.
         Returns:
             list: List of scheduled events in the guild.
         Raises:
             HTTPError: If the request to the Discord API fails.
         """
-        url = f"https://discord.com/api/v10/guilds/{self.guild_id}/scheduled-events"
-        headers = {
-            "Authorization": f"Bot {self.token}",
-            "Content-Type": "application/json",
-        }
-
-        response = self._make_request_with_retry("GET", url, headers)
+        response = self._request(
+            "GET", f"/guilds/{self.guild_id}/scheduled-events", deadline=deadline
+        )
         events = response.json()
-        self.logger.info("Scheduled events fetched successfully: %s", events)
+        self.logger.info("Fetched %d scheduled event(s)", len(events))
+        self.logger.debug("Scheduled events: %s", Truncated(events))
 
         return events
 
+    def list_scheduled_event_users(
+        self, event_id: str, deadline: Deadline = None
+    ) -> list:
+        """
+        List every user subscribed to a scheduled event.
+        Pages through the users endpoint, which returns at most 100 users per request.
+        Args:
+            event_id (str): ID of the scheduled event.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            list: Scheduled event user objects.
+        Raises:
+            HTTPError: If the request to the Discord API fails.
+        """
+        users = []
+        after = None
+        while True:
+            path = (
+                f"/guilds/{self.guild_id}/scheduled-events/"
+                f"{event_id}/users?limit={EVENT_USERS_PAGE_SIZE}"
+            )
+            if after:
+                path += f"&after={after}"
+
+            page = self._request("GET", path, deadline=deadline).json()
+            users.extend(page)
+            if len(page) < EVENT_USERS_PAGE_SIZE:
+                break
+            after = page[-1]["user"]["id"]
+
+        self.logger.info("Found %d user(s) for event %s", len(users), event_id)
+        return users
+
     def list_scheduled_events_and_notify(
-        self, time_delta: timedelta = timedelta(minutes=1)
-    ) -> None:
-        # pylint:disable=too-many-locals
+        self,
+        time_delta: timedelta = timedelta(minutes=1),
+        deadline: Deadline = None,
+        pending_reminders: list = None,
+    ) -> list:
         """
         List scheduled events in the Discord guild and send reminders to users.
         This method checks for events starting in about 1 hour and sends reminders to users.
@@ -256,23 +761,32 @@ class DiscordService:
 
         Args:
             time_delta (timedelta): Time delta to check for events. Defaults to 1 minute.
+            deadline (Deadline): Run deadline; sending stops once it expires.
+            pending_reminders (list): Unsent reminders checkpointed by a previous run,
+                                      sent ahead of newly due events.
+        Returns:
+            list: Reminders left unsent because the deadline expired.
         Raises:
             HTTPError: If the request to the Discord API fails.
         """
-        events = self.list_scheduled_events()
+        events = self.list_scheduled_events(deadline)
 
         now = datetime.now(timezone.utc)
         reminder_delta = timedelta(hours=1)
 
-        headers = {
-            "Authorization": f"Bot {self.token}",
-            "Content-Type": "application/json",
-        }
+        headers = self._auth_headers()
 
         self.logger.info("Checking scheduled events in guild ID: %s", self.guild_id)
         self.logger.info("Current time: %s", now.isoformat())
         self.logger.info("Time delta for reminders: %s", time_delta)
 
+        # Work items are either a whole event whose subscribers still need to
+        # be listed, or a single user's reminder for an event
+        work = list(pending_reminders or [])
+        if work:
+            self.logger.info("Resuming %d reminder(s) from checkpoint", len(work))
+        pending_events = {item["event_id"] for item in work if "user_id" not in item}
+
         for event in events:
             start_str = event[
                 "scheduled_start_time"
@@ -293,87 +807,548 @@ class DiscordService:
                     event["id"],
                 )
 
-                event_id = event["id"]
-                users_url = f"https://discord.com/api/v10/guilds/{self.guild_id}/scheduled-events/{event_id}/users?limit=100"
-                users_resp = self._make_request_with_retry("GET", users_url, headers)
-                users = users_resp.json()
-                event_link = f"https://discord.com/events/{self.guild_id}/{event_id}"
-
-                for user in users:
-                    user_id = user["user"]["id"]
-                    username = user["user"]["username"]
-
-                    # Check if reminder was already sent using DynamoDB
-                    if self.dynamodb_client:
-                        reminder_already_sent = (
-                            self.dynamodb_client.check_reminder_sent(
-                                event_id=event_id, user_id=user_id, reminder_type="1h"
-                            )
-                        )
+                if event["id"] not in pending_events:
+                    work.append({"event_id": event["id"], "event_name": event["name"]})
+
+        return self._process_reminders(work, headers, deadline)
 
-                        if reminder_already_sent:
-                            self.logger.info(
-                                "Reminder already sent for event %s to user %s (within 2-hour window)",
-                                event_id,
-                                user_id,
-                            )
-                            continue
-                    else:
-                        self.logger.warning(
-                            "DynamoDB client not available - skipping duplicate check for event %s, user %s",
-                            event_id,
-                            user_id,
+    def _process_reminders(
+        self, work: list, headers: dict, deadline: Deadline = None
+    ) -> list:
+        """
+        Send reminders for the given work items in order until done or out of time.
+        Args:
+            work (list): Event items ({"event_id", "event_name"}) and reminder items
+                         ({"event_id", "event_name", "user_id", "username"}).
+            headers (dict): Headers for the HTTP requests, including authorization.
+            deadline (Deadline): Run deadline; sending stops once it expires.
+        Returns:
+            list: Work items left unprocessed because the deadline expired.
+        """
+        if self.concurrency > 1:
+            return asyncio.run(self._process_reminders_async(work, deadline))
+
+        queue = deque(work)
+
+        while queue:
+            if deadline and deadline.expired():
+                self.logger.warning(
+                    "Run deadline reached with %d reminder item(s) unsent", len(queue)
+                )
+                return list(queue)
+
+            item = queue.popleft()
+
+            if "user_id" not in item:
+                # Expand the event into one reminder per subscriber, in place
+                queue.extendleft(reversed(self._expand_event(item, deadline)))
+                continue
+
+            self._send_reminder(item, headers, deadline)
+
+        return []
+
+    async def _process_reminders_async(
+        self, work: list, deadline: Deadline = None
+    ) -> list:
+        """
+        Send reminders like _process_reminders, up to `concurrency` DMs at a time.
+        Reminders go out in waves over one aiohttp session; the deadline is
+        checked before each wave. DynamoDB claims and outcomes, and fallback
+        mentions, run in worker threads so they do not hold up the event loop.
+        Args:
+            work (list): Event items and reminder items, as for _process_reminders.
+            deadline (Deadline): Run deadline; sending stops once it expires.
+        Returns:
+            list: Work items left unprocessed because the deadline expired.
+        """
+        queue = deque(work)
+
+        async with self.async_service(deadline) as client:
+            while queue:
+                if deadline and deadline.expired():
+                    self.logger.warning(
+                        "Run deadline reached with %d reminder item(s) unsent",
+                        len(queue),
+                    )
+                    return list(queue)
+
+                if "user_id" not in queue[0]:
+                    # Listing users and dispatching shards is blocking work
+                    expanded = await asyncio.to_thread(
+                        self._expand_event, queue.popleft(), deadline
+                    )
+                    queue.extendleft(reversed(expanded))
+                    continue
+
+                candidates = []
+                while (
+                    queue
+                    and "user_id" in queue[0]
+                    and len(candidates) < self.concurrency
+                ):
+                    candidates.append(queue.popleft())
+
+                # Claims are blocking DynamoDB writes; make them off the event
+                # loop, all at once
+                claimed = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self._should_send_reminder, reminder)
+                        for reminder in candidates
+                    )
+                )
+                wave = [
+                    reminder
+                    for reminder, is_claimed in zip(candidates, claimed)
+                    if is_claimed
+                ]
+
+                results = await asyncio.gather(
+                    *(
+                        client.send_dm(
+                            reminder["user_id"], self._reminder_message(reminder)
                         )
+                        for reminder in wave
+                    ),
+                    return_exceptions=True,
+                )
+                await asyncio.to_thread(
+                    self._record_wave_results, wave, results, deadline
+                )
+
+        return []
+
+    def _record_wave_results(
+        self, wave: list, results: list, deadline: Deadline = None
+    ) -> None:
+        """
+        Record the outcome of a wave of reminders sent through the async service.
+        Delivered reminders are recorded, failed ones released, and users who do
+        not accept DMs are mentioned in the fallback channel instead.
+        Args:
+            wave (list): Claimed reminder items, in the order they were sent.
+            results (list): Result or exception of each send, as returned by gather.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        """
+        undeliverable = []
+        for reminder, result in zip(wave, results):
+            if is_undeliverable_dm_error(result):
+                undeliverable.append(reminder)
+            elif isinstance(result, Exception):
+                self.logger.error("Could not DM %s: %s", reminder["username"], result)
+                self._release_reminder(reminder)
+            else:
+                self._record_reminder(reminder)
+        self._mark_undeliverable(undeliverable, deadline)
+
+    def _expand_event(self, item: dict, deadline: Deadline = None) -> list:
+        """
+        Turn an event work item into reminder items for its subscribers.
+        Large subscriber lists are split into shards and fanned out through the
+        invoker; only subscribers not handed to a shard are returned.
+        Args:
+            item (dict): Event item with event_id and event_name.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            list: Reminder items for subscribers this invocation should notify.
+        """
+        event_id = item["event_id"]
+        users = self._list_event_subscribers(event_id, deadline)
 
+        if self.invoker and len(users) > self.shard_size:
+            local_users = []
+            for start in range(0, len(users), self.shard_size):
+                shard = users[start : start + self.shard_size]
+                payload = {
+                    "handler_type": "reminder_shard",
+                    "event_id": event_id,
+                    "event_name": item["event_name"],
+                    "user_ids": [user["id"] for user in shard],
+                }
+                if self.invoker.invoke_async(payload):
                     self.logger.info(
-                        "Sending reminder for event %s to user %s", event_id, user_id
+                        "Dispatched reminder shard of %d user(s) for event %s",
+                        len(shard),
+                        event_id,
                     )
-
-                    reminder = (
-                        f"🌟 Hey <@{user_id}>! Just a quick vibe check — **{event['name']}** is starting in "
-                        f"an hour! You don't want to miss this! "
-                        f"Grab your snacks, bring your energy, and click the link below to join: \n{event_link}"
+                else:
+                    self.logger.warning(
+                        "Could not dispatch reminder shard for event %s - sending locally",
+                        event_id,
                     )
-                    try:
-                        self._send_dm(user_id, reminder, headers)
-
-                        # Record reminder in DynamoDB with 2-hour TTL
-                        if self.dynamodb_client:
-                            success = self.dynamodb_client.record_reminder_sent(
-                                event_id=event_id, user_id=user_id, reminder_type="1h"
-                            )
-                            if success:
-                                self.logger.info(
-                                    "Reminder sent and recorded for event %s to user %s",
-                                    event_id,
-                                    user_id,
-                                )
-                            else:
-                                self.logger.warning(
-                                    "Reminder sent but failed to record in DynamoDB for event %s, user %s",
-                                    event_id,
-                                    user_id,
-                                )
-                        else:
-                            self.logger.info(
-                                "Reminder sent for event %s to user %s (DynamoDB tracking disabled)",
-                                event_id,
-                                user_id,
-                            )
-                    except Exception as e:
-                        self.logger.error(f"Could not DM {username}: {e}")
-
-    def _send_dm(self, user_id: str, message: str, headers: dict) -> None:
+                    local_users.extend(shard)
+            users = local_users
+
+        return self._filter_unsent_reminders(
+            event_id, item["event_name"], users, deadline
+        )
+
+    def _list_event_subscribers(self, event_id: str, deadline: Deadline = None) -> list:
+        """
+        Get the subscribers of an event, from the event index when it has them.
+        Args:
+            event_id (str): ID of the scheduled event.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            list: Users as dicts with id and username.
+        """
+        if self.event_index:
+            user_ids = self.event_index.get_subscribers(event_id)
+            if user_ids is not None:
+                self.logger.info(
+                    "Using %d indexed subscriber(s) for event %s",
+                    len(user_ids),
+                    event_id,
+                )
+                # The index keeps IDs only; usernames are only used in logs
+                return [
+                    {"id": user_id, "username": user_id} for user_id in sorted(user_ids)
+                ]
+
+        return [
+            {"id": user["user"]["id"], "username": user["user"]["username"]}
+            for user in self.list_scheduled_event_users(event_id, deadline)
+        ]
+
+    def _filter_unsent_reminders(
+        self, event_id: str, event_name: str, users: list, deadline: Deadline = None
+    ) -> list:
+        """
+        Build reminder items for the users who have not been reminded yet.
+        Sent status is checked with one batched DynamoDB read per 100 users.
+        Args:
+            event_id (str): ID of the scheduled event.
+            event_name (str): Name of the scheduled event.
+            users (list): Users as dicts with id and username.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        Returns:
+            list: Reminder items for users still to be reminded.
+        """
+        already_sent = set()
+        if self.dynamodb_client and users:
+            already_sent = self.dynamodb_client.batch_check_reminders_sent(
+                event_id=event_id,
+                user_ids=[user["id"] for user in users],
+                reminder_type="1h",
+            )
+            if already_sent:
+                self.logger.info(
+                    "Reminder already sent for event %s to %d user(s) (within 2-hour window)",
+                    event_id,
+                    len(already_sent),
+                )
+
+        reminders = [
+            {
+                "event_id": event_id,
+                "event_name": event_name,
+                "user_id": user["id"],
+                "username": user["username"],
+            }
+            for user in users
+            if user["id"] not in already_sent
+        ]
+
+        undeliverable = self._find_undeliverable_users(
+            [reminder["user_id"] for reminder in reminders]
+        )
+        if not undeliverable:
+            return reminders
+
+        self.logger.info(
+            "Skipping DMs for event %s to %d user(s) who do not accept DMs",
+            event_id,
+            len(undeliverable),
+        )
+        # Without a fallback channel these users are skipped, so nothing is claimed
+        if self.fallback_channel:
+            self._send_fallback_mentions(
+                [
+                    reminder
+                    for reminder in reminders
+                    if reminder["user_id"] in undeliverable
+                    and self._should_send_reminder(reminder)
+                ],
+                deadline,
+            )
+        return [
+            reminder
+            for reminder in reminders
+            if reminder["user_id"] not in undeliverable
+        ]
+
+    def _find_undeliverable_users(self, user_ids: List[str]) -> set:
+        """
+        Find the users known not to accept DMs, from memory and then DynamoDB.
+        Args:
+            user_ids (List[str]): IDs of the users to check.
+        Returns:
+            set: IDs of the users who cannot be sent DMs.
+        """
+        undeliverable = {
+            user_id for user_id in user_ids if self.undeliverable_users.get(user_id)
+        }
+        unknown = [user_id for user_id in user_ids if user_id not in undeliverable]
+        if self.dynamodb_client and unknown:
+            found = self.dynamodb_client.batch_check_undeliverable_users(unknown)
+            for user_id in found:
+                self.undeliverable_users.set(
+                    user_id, True, ttl=UNDELIVERABLE_RECHECK_SECONDS
+                )
+            undeliverable.update(found)
+        return undeliverable
+
+    def _mark_undeliverable(self, reminders: list, deadline: Deadline = None) -> None:
+        """
+        Record that the recipients of failed reminders do not accept DMs, and
+        mention them in the fallback channel instead.
+        Args:
+            reminders (list): Reminder items whose DM was rejected with error 50007.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        """
+        for reminder in reminders:
+            self.logger.warning(
+                "User %s does not accept DMs - skipping their DMs from now on",
+                reminder["user_id"],
+            )
+            self.undeliverable_users.set(reminder["user_id"], True)
+            if self.dynamodb_client:
+                self.dynamodb_client.record_undeliverable_user(reminder["user_id"])
+        self._send_fallback_mentions(reminders, deadline)
+
+    def _send_fallback_mentions(
+        self, reminders: list, deadline: Deadline = None
+    ) -> None:
+        """
+        Mention users who do not accept DMs in the fallback channel, one
+        message per event (split to fit Discord's message length limit).
+        Each mentioned user is recorded as reminded; claims of users who could
+        not be mentioned, including all of them when no fallback channel is
+        configured, are released.
+        Args:
+            reminders (list): Claimed reminder items for users who cannot be sent DMs.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        """
+        if not self.fallback_channel:
+            for reminder in reminders:
+                self._release_reminder(reminder)
+            return
+        if not reminders:
+            return
+
+        by_event = {}
+        for reminder in reminders:
+            by_event.setdefault(
+                (reminder["event_id"], reminder["event_name"]), []
+            ).append(reminder)
+
+        recorded = []
+        try:
+            channel_id = self.get_channel_id(self.fallback_channel, deadline)
+            for (event_id, event_name), event_reminders in by_event.items():
+                header = (
+                    f"⏰ **{event_name}** is starting in an hour! "
+                    f"https://discord.com/events/{self.guild_id}/{event_id}\n"
+                )
+                message = header
+                for reminder in event_reminders:
+                    mention = f"<@{reminder['user_id']}> "
+                    if len(message) + len(mention) > MAX_MESSAGE_LENGTH:
+                        self.send_message_to_channel(
+                            channel_id, message.rstrip(), deadline
+                        )
+                        message = header
+                    message += mention
+                self.send_message_to_channel(channel_id, message.rstrip(), deadline)
+
+                for reminder in event_reminders:
+                    self._record_reminder(reminder)
+                    recorded.append(reminder)
+                self.logger.info(
+                    "Mentioned %d user(s) who do not accept DMs in %s for event %s",
+                    len(event_reminders),
+                    self.fallback_channel,
+                    event_id,
+                )
+        except Exception as e:
+            self.logger.error(
+                "Could not send fallback mentions to %s: %s", self.fallback_channel, e
+            )
+            for reminder in reminders:
+                if reminder not in recorded:
+                    self._release_reminder(reminder)
+
+    def notify_event_shard(
+        self,
+        event_id: str,
+        event_name: str,
+        user_ids: list,
+        deadline: Deadline = None,
+    ) -> list:
+        """
+        Send reminders for one shard of an event's subscribers.
+        Args:
+            event_id (str): ID of the scheduled event.
+            event_name (str): Name of the scheduled event.
+            user_ids (list): IDs of the subscribers in this shard.
+            deadline (Deadline): Run deadline; sending stops once it expires.
+        Returns:
+            list: Reminder items left unsent because the deadline expired.
+        """
+        headers = self._auth_headers()
+
+        self.logger.info(
+            "Processing reminder shard of %d user(s) for event %s",
+            len(user_ids),
+            event_id,
+        )
+        users = [{"id": user_id, "username": user_id} for user_id in user_ids]
+        work = self._filter_unsent_reminders(event_id, event_name, users, deadline)
+        return self._process_reminders(work, headers, deadline)
+
+    def _should_send_reminder(self, reminder: dict) -> bool:
+        """
+        Check whether a reminder still needs to be sent.
+        Args:
+            reminder (dict): Reminder item with event_id, event_name, user_id and username.
+        Returns:
+            bool: False if the reminder was already sent or claimed by another run.
+        """
+        event_id = reminder["event_id"]
+        user_id = reminder["user_id"]
+
+        # Claim the reminder in DynamoDB; a concurrent run that claimed it first
+        # sends it instead. Batch-checked items are claimed too, as another run
+        # may have started sending since the check.
+        if self.dynamodb_client:
+            claimed = self.dynamodb_client.claim_reminder(
+                event_id=event_id, user_id=user_id, reminder_type="1h"
+            )
+
+            if not claimed:
+                self.sampled_logger.info(
+                    "Reminder already sent for event %s to user %s (within 2-hour window)",
+                    event_id,
+                    user_id,
+                )
+                return False
+        else:
+            self.logger.warning(
+                "DynamoDB client not available - skipping duplicate check for event %s, user %s",
+                event_id,
+                user_id,
+            )
+
+        self.sampled_logger.info(
+            "Sending reminder for event %s to user %s", event_id, user_id
+        )
+        return True
+
+    def _reminder_message(self, reminder: dict) -> str:
+        """
+        Build the DM text for a reminder.
+        Args:
+            reminder (dict): Reminder item with event_id, event_name and user_id.
+        Returns:
+            str: Reminder message with the event link.
+        """
+        event_link = (
+            f"https://discord.com/events/{self.guild_id}/{reminder['event_id']}"
+        )
+        return (
+            f"🌟 Hey <@{reminder['user_id']}>! Just a quick vibe check — **{reminder['event_name']}** is starting in "
+            f"an hour! You don't want to miss this! "
+            f"Grab your snacks, bring your energy, and click the link below to join: \n{event_link}"
+        )
+
+    def _record_reminder(self, reminder: dict) -> None:
+        """
+        Mark a claimed reminder as delivered in DynamoDB, with a 2-hour TTL.
+        Args:
+            reminder (dict): Reminder item with event_id and user_id.
+        """
+        event_id = reminder["event_id"]
+        user_id = reminder["user_id"]
+
+        if not self.dynamodb_client:
+            self.sampled_logger.info(
+                "Reminder sent for event %s to user %s (DynamoDB tracking disabled)",
+                event_id,
+                user_id,
+            )
+            return
+
+        success = self.dynamodb_client.record_reminder_sent(
+            event_id=event_id, user_id=user_id, reminder_type="1h"
+        )
+        if success:
+            self.sampled_logger.info(
+                "Reminder sent and recorded for event %s to user %s",
+                event_id,
+                user_id,
+            )
+        else:
+            self.logger.warning(
+                "Reminder sent but failed to record in DynamoDB for event %s, user %s",
+                event_id,
+                user_id,
+            )
+
+    def _release_reminder(self, reminder: dict) -> None:
+        """
+        Release the claim of a reminder that could not be sent, so the next run retries it.
+        Args:
+            reminder (dict): Reminder item with event_id and user_id.
+        """
+        if self.dynamodb_client:
+            self.dynamodb_client.release_reminder_claim(
+                event_id=reminder["event_id"],
+                user_id=reminder["user_id"],
+                reminder_type="1h",
+            )
+
+    def _send_reminder(
+        self, reminder: dict, headers: dict, deadline: Deadline = None
+    ) -> None:
+        """
+        Send one event reminder to a user unless it was already sent.
+        Args:
+            reminder (dict): Reminder item with event_id, event_name, user_id and username.
+            headers (dict): Headers for the HTTP requests, including authorization.
+            deadline (Deadline): Run deadline; retries never wait past it.
+        """
+        if not self._should_send_reminder(reminder):
+            return
+
+        try:
+            self._send_dm(
+                reminder["user_id"],
+                self._reminder_message(reminder),
+                headers,
+                deadline,
+            )
+            self._record_reminder(reminder)
+        except Exception as e:
+            if is_undeliverable_dm_error(e):
+                self._mark_undeliverable([reminder], deadline)
+            else:
+                self.logger.error("Could not DM %s: %s", reminder["username"], e)
+                self._release_reminder(reminder)
+
+    def _send_dm(
+        self, user_id: str, message: str, headers: dict, deadline: Deadline = None
+    ) -> None:
         """
         Send a direct message to a user in Discord.
         Args:
             user_id (str): ID of the user to send the message to.
             message (str): The message content to send.
             headers (dict): Headers for the HTTP request, including authorization.
+            deadline (Deadline): Run deadline; retries never wait past it.
         Raises:
             HTTPError: If the request to send the DM fails.
         """
-        self.logger.info("Sending DM to user ID: %s", user_id)
+        self.sampled_logger.debug("Sending DM to user ID: %s", user_id)
         if not user_id or not message:
             self.logger.warning("User ID and message cannot be empty.")
             return
@@ -381,26 +1356,42 @@ class DiscordService:
             self.logger.error("Invalid user ID format: %s", user_id)
             raise ValueError("User ID must be a numeric string.")
 
-        # Create DM channel
-        self.logger.info("Creating DM channel for user ID: %s", user_id)
+        # Reuse the user's DM channel if it is cached, otherwise create it
+        cache_key = dm_channel_cache_key(user_id)
+        channel_id = self.cache.get(cache_key)
+        if channel_id is None:
+            self.sampled_logger.debug("Creating DM channel for user ID: %s", user_id)
 
-        dm_url = "https://discord.com/api/v10/users/@me/channels"
-        dm_data = {"recipient_id": user_id}
+            dm_data = {"recipient_id": user_id}
+
+            dm_resp = self._request(
+                "POST", "/users/@me/channels", headers, deadline, json=dm_data
+            )
+            dm_channel = dm_resp.json()
 
-        dm_resp = self._make_request_with_retry("POST", dm_url, headers, json=dm_data)
-        dm_channel = dm_resp.json()
+            self.sampled_logger.debug(
+                "DM channel created successfully for user ID: %s", user_id
+            )
 
-        self.logger.info("DM channel created successfully for user ID: %s", user_id)
+            channel_id = dm_channel["id"]
+            self.cache.set(cache_key, channel_id, ttl=DM_CHANNEL_CACHE_TTL_SECONDS)
 
-        channel_id = dm_channel["id"]
-        msg_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
         msg_data = {"content": message}
 
-        msg_resp = self._make_request_with_retry(
-            "POST", msg_url, headers, json=msg_data
-        )
+        try:
+            msg_resp = self._request(
+                "POST",
+                f"/channels/{channel_id}/messages",
+                headers,
+                deadline,
+                json=msg_data,
+            )
+        except requests.HTTPError:
+            # Open a fresh channel next time in case the cached one went stale
+            self.cache.delete(cache_key)
+            raise
         if msg_resp.status_code == 200:
-            self.logger.info("DM sent successfully to user ID: %s", user_id)
+            self.sampled_logger.info("DM sent successfully to user ID: %s", user_id)
         else:
             self.logger.error(
                 "Failed to send DM to user ID: %s. Status code: %d",
@@ -0,0 +1,263 @@
+"""
+AsyncDiscordService is the asyncio counterpart of DiscordService for bulk DMs.
+It sends direct messages as coroutines over one shared aiohttp session, so many
+reminders can be in flight at once within one event loop. Every other Discord
+operation goes through DiscordService.
+"""
+
+import asyncio
+import json
+from typing import Optional
+import aiohttp
+from config.logger import LoggerConfig
+from utils.cache import TieredCache
+from utils.deadline import Deadline
+from utils.rate_limit import AsyncRateLimiter, route_key
+from utils.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, is_server_failure
+
+DISCORD_API_BASE_URL = "https://discord.com/api/v10"
+
+# Upper bound on requests in flight at once
+DEFAULT_CONCURRENCY = 10
+
+# A user's DM channel keeps its ID, so it is reused for a day before reopening
+DM_CHANNEL_CACHE_TTL_SECONDS = 86400
+
+
+def dm_channel_cache_key(user_id: str) -> str:
+    """Key of a user's DM channel ID in the service cache."""
+    return f"dm_channel:{user_id}"
+
+
+class AsyncDiscordService:
+    """
+    AsyncDiscordService sends Discord API requests as coroutines.
+    Use it as an async context manager so the aiohttp session is closed:
+
+        async with AsyncDiscordService(token, guild_id) as discord:
+            await discord.send_dm(user_id, message)
+
+    Attributes:
+        token (str): Discord bot token for authentication.
+        guild_id (str): ID of the Discord guild (server) to interact with.
+        base_url (str): Base URL of the Discord REST API, or of a proxy serving the same paths.
+        rate_limiter (AsyncRateLimiter): Tracker for Discord's per-route rate limits,
+            or None when a shared rate-limit proxy owns the buckets.
+        concurrency (int): Maximum number of requests in flight at once.
+        retry_policy (RetryPolicy): Decides which failed requests are retried and how long to wait.
+        circuit_breaker (CircuitBreaker): Per-route breaker that fails requests fast after repeated failures.
+        deadline (Deadline): Run deadline; retries never wait past it.
+        cache (TieredCache): Cache of DM channel IDs, or None to open one per DM.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        guild_id: str,
+        base_url: str = DISCORD_API_BASE_URL,
+        session: aiohttp.ClientSession = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        deadline: Optional[Deadline] = None,
+        cache: Optional[TieredCache] = None,
+    ):
+        """
+        Initialize the AsyncDiscordService.
+
+        Args:
+            token: Discord bot token.
+            guild_id: ID of the Discord guild.
+            base_url: Base URL for API requests.
+            session: Shared aiohttp session. If None, one is created on first use
+                     and closed by close().
+            rate_limiter: Async rate limiter, e.g. one wrapping the RateLimiter of a
+                          DiscordService so both share bucket state. If None,
+                          rate limits are only handled when Discord returns 429.
+            concurrency: Maximum number of requests in flight at once.
+            retry_policy: Retry policy for failed requests.
+                          If None, the default RetryPolicy is used.
+            circuit_breaker: Per-route circuit breaker, e.g. the one of a
+                             DiscordService. If None, routes are never cut off.
+            deadline: Run deadline. If None, retries are limited by attempts only.
+            cache: Cache of DM channel IDs, e.g. the one of a DiscordService.
+                   If None, a DM channel is opened for every DM.
+        """
+        logger_config = LoggerConfig(__name__)
+        self.logger = logger_config.get_logger()
+        self.sampled_logger = logger_config.get_sampled_logger()
+        self.token = token
+        self.guild_id = guild_id
+        self.base_url = base_url.rstrip("/")
+        self.rate_limiter = rate_limiter
+        self.concurrency = max(1, concurrency)
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self.deadline = deadline
+        self.cache = cache
+
+    async def __aenter__(self) -> "AsyncDiscordService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the aiohttp session if this service created it."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def _request(self, method: str, path: str, **kwargs):
+        """
+        Send a request to the Discord API, retrying failures the retry policy
+        considers transient. Mirrors DiscordService._make_request_with_retry,
+        but waits by yielding to the event loop.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            path (str): API path starting with "/", e.g. "/guilds/123/channels"
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            Decoded JSON response body, or None for an empty body
+
+        Raises:
+            aiohttp.ClientError: If the request fails and is not retried
+            CircuitOpenError: If the route's circuit breaker is open
+        """
+        url = self.base_url + path
+        route = route_key(method, url)
+        session = self._get_session()
+        headers = {"Authorization": f"Bot {self.token}"}
+        delay = None
+
+        for attempt in range(self.retry_policy.max_attempts):
+            if self.circuit_breaker and not self.circuit_breaker.allow(route):
+                raise CircuitOpenError(route)
+
+            retry_after = None
+            try:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(route)
+                async with self._semaphore:
+                    async with session.request(
+                        method, url, headers=headers, **kwargs
+                    ) as response:
+                        if self.rate_limiter:
+                            self.rate_limiter.update(
+                                route, response.headers, response.status
+                            )
+                        body = await response.text()
+
+                        if response.status == 429 and response.headers.get(
+                            "Retry-After"
+                        ):
+                            retry_after = float(response.headers["Retry-After"])
+                        if response.status >= 400:
+                            raise aiohttp.ClientResponseError(
+                                response.request_info,
+                                response.history,
+                                status=response.status,
+                                message=body,
+                                headers=response.headers,
+                            )
+
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_success(route)
+                return json.loads(body) if body else None
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                status = (
+                    e.status if isinstance(e, aiohttp.ClientResponseError) else None
+                )
+                if self.rate_limiter and status is None:
+                    self.rate_limiter.release(route)
+
+            if self.circuit_breaker and is_server_failure(status):
+                self.circuit_breaker.record_failure(route)
+
+            delay = self.retry_policy.retry_delay(
+                attempt, status, delay, self.deadline, retry_after
+            )
+            if delay is None:
+                self.logger.error(
+                    "Request to %s failed on attempt %d, not retrying: %s",
+                    route,
+                    attempt + 1,
+                    error,
+                )
+                raise error
+
+            self.logger.warning(
+                "Request to %s failed on attempt %d (%s). Retrying in %.2f seconds.",
+                route,
+                attempt + 1,
+                status or error,
+                delay,
+            )
+            # The rate limiter holds the next attempt until the bucket resets
+            if retry_after is None or not self.rate_limiter:
+                await asyncio.sleep(delay)
+
+        raise aiohttp.ClientError(
+            f"Failed to make request after {self.retry_policy.max_attempts} attempts"
+        )
+
+    async def send_dm(self, user_id: str, message: str) -> None:
+        """
+        Send a direct message to a user in Discord.
+        Args:
+            user_id (str): ID of the user to send the message to.
+            message (str): The message content to send.
+        Raises:
+            ValueError: If the user ID is not numeric.
+            aiohttp.ClientResponseError: If the request to send the DM fails.
+        """
+        if not user_id or not message:
+            self.logger.warning("User ID and message cannot be empty.")
+            return
+        if not user_id.isdigit():
+            self.logger.error("Invalid user ID format: %s", user_id)
+            raise ValueError("User ID must be a numeric string.")
+
+        # Cache tiers may block on disk or DynamoDB, so they run off the loop
+        cache_key = dm_channel_cache_key(user_id)
+        channel_id = None
+        if self.cache is not None:
+            channel_id = await asyncio.to_thread(self.cache.get, cache_key)
+        if channel_id is None:
+            dm_channel = await self._request(
+                "POST", "/users/@me/channels", json={"recipient_id": user_id}
+            )
+            channel_id = dm_channel["id"]
+            if self.cache is not None:
+                await asyncio.to_thread(
+                    self.cache.set, cache_key, channel_id, DM_CHANNEL_CACHE_TTL_SECONDS
+                )
+
+        try:
+            await self._request(
+                "POST",
+                f"/channels/{channel_id}/messages",
+                json={"content": message},
+            )
+        except aiohttp.ClientResponseError:
+            # Open a fresh channel next time in case the cached one went stale
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.delete, cache_key)
+            raise
+        self.sampled_logger.info("DM sent successfully to user ID: %s", user_id)
@@ -0,0 +1,249 @@
+"""
+This module defines the EventIndex class, which keeps the guild's scheduled events and their
+subscribers up to date from Discord gateway events. The index is kept in memory and written
+through to DynamoDB, so reminder runs can read subscriber sets instead of listing users from
+the Discord API at send time.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set
+from clients.dynamodb import EVENT_INDEX_MAX_AGE_SECONDS, DynamoDBClient
+from config.logger import LoggerConfig
+
+# Gateway dispatch types the index subscribes to
+EVENT_CREATE = "GUILD_SCHEDULED_EVENT_CREATE"
+EVENT_UPDATE = "GUILD_SCHEDULED_EVENT_UPDATE"
+EVENT_DELETE = "GUILD_SCHEDULED_EVENT_DELETE"
+EVENT_USER_ADD = "GUILD_SCHEDULED_EVENT_USER_ADD"
+EVENT_USER_REMOVE = "GUILD_SCHEDULED_EVENT_USER_REMOVE"
+GATEWAY_EVENT_TYPES = {
+    EVENT_CREATE,
+    EVENT_UPDATE,
+    EVENT_DELETE,
+    EVENT_USER_ADD,
+    EVENT_USER_REMOVE,
+}
+
+# Scheduled event statuses after which no reminders are sent
+COMPLETED_STATUSES = {3, 4}
+
+
+class EventIndex:
+    """
+    EventIndex tracks scheduled events and their subscribers.
+    Only events whose subscribers were fully synced (see sync_event) are served
+    from the index, and only while the listener's heartbeat is recent; for any
+    other event get_subscribers returns None and the caller lists subscribers
+    from the Discord API instead.
+
+    Attributes:
+        guild_id (str): Guild whose events are indexed; gateway events for other guilds are ignored.
+        dynamodb_client (DynamoDBClient): Client the index is written through to.
+            If None, the index is kept in memory only.
+        events (Dict[str, dict]): Indexed events by event ID.
+        subscribers (Dict[str, Set[str]]): Subscribed user IDs by event ID.
+        heartbeat_at (float): Time of the listener's last heartbeat, or None while it is disconnected.
+    """
+
+    def __init__(
+        self, guild_id: str = None, dynamodb_client: Optional[DynamoDBClient] = None
+    ):
+        """
+        Initialize the EventIndex.
+
+        Args:
+            guild_id: Guild whose events are indexed. If None, events of every guild are indexed.
+            dynamodb_client: Client the index is written through to.
+                            If None, the index is kept in memory only.
+        """
+        self.logger = LoggerConfig(__name__).get_logger()
+        self.guild_id = str(guild_id) if guild_id else None
+        self.dynamodb_client = dynamodb_client
+        self.events: Dict[str, dict] = {}
+        self.subscribers: Dict[str, Set[str]] = {}
+        self._synced: Set[str] = set()
+        self._lock = threading.Lock()
+        self.heartbeat_at: Optional[float] = None
+
+    @staticmethod
+    def event_summary(data: dict) -> dict:
+        """
+        Reduce a Discord scheduled event object to the fields the index keeps.
+
+        Args:
+            data: Scheduled event object from the API or gateway
+
+        Returns:
+            Event dict with id, name, scheduled_start_time and status
+        """
+        return {
+            "id": str(data["id"]),
+            "name": data.get("name"),
+            "scheduled_start_time": data.get("scheduled_start_time"),
+            "status": data.get("status"),
+        }
+
+    def apply_gateway_event(self, event_type: str, data: dict) -> bool:
+        """
+        Apply a gateway dispatch to the index.
+
+        Args:
+            event_type: Dispatch type, e.g. GUILD_SCHEDULED_EVENT_USER_ADD
+            data: Dispatch payload
+
+        Returns:
+            True if the dispatch changed the index, False if it was ignored
+        """
+        if event_type not in GATEWAY_EVENT_TYPES or not data:
+            return False
+        if self.guild_id and str(data.get("guild_id")) != self.guild_id:
+            return False
+
+        if event_type in (EVENT_CREATE, EVENT_UPDATE):
+            event = self.event_summary(data)
+            if event["status"] in COMPLETED_STATUSES:
+                self.remove_event(event["id"])
+            else:
+                self.upsert_event(event, new=event_type == EVENT_CREATE)
+        elif event_type == EVENT_DELETE:
+            self.remove_event(str(data["id"]))
+        elif event_type == EVENT_USER_ADD:
+            self.add_subscriber(
+                str(data["guild_scheduled_event_id"]), str(data["user_id"])
+            )
+        else:
+            self.remove_subscriber(
+                str(data["guild_scheduled_event_id"]), str(data["user_id"])
+            )
+        return True
+
+    def sync_event(self, event: dict, user_ids: List[str]) -> None:
+        """
+        Replace an event and its complete subscriber list, e.g. after a resync on connect.
+
+        Args:
+            event: Event dict as returned by event_summary
+            user_ids: IDs of every user subscribed to the event
+        """
+        event_id = event["id"]
+        with self._lock:
+            self.events[event_id] = event
+            self.subscribers[event_id] = set(user_ids)
+            self._synced.add(event_id)
+
+        if self.dynamodb_client:
+            self.dynamodb_client.replace_event_subscribers(event, list(user_ids))
+        self.logger.info(
+            "Synced event %s with %d subscriber(s)", event_id, len(user_ids)
+        )
+
+    def upsert_event(self, event: dict, new: bool = False) -> None:
+        """
+        Add or update an event without changing its subscribers.
+
+        Args:
+            event: Event dict as returned by event_summary
+            new: Whether the event was just created. A new event has no
+                 subscribers yet, so its (empty) subscriber set is complete.
+        """
+        event_id = event["id"]
+        with self._lock:
+            self.events[event_id] = event
+            self.subscribers.setdefault(event_id, set())
+            if new:
+                self._synced.add(event_id)
+
+        if self.dynamodb_client:
+            if new:
+                self.dynamodb_client.replace_event_subscribers(event, [])
+            else:
+                self.dynamodb_client.save_event(event)
+        self.logger.info("Indexed event %s (%s)", event_id, event.get("name"))
+
+    def remove_event(self, event_id: str) -> None:
+        """
+        Remove an event and its subscribers from the index.
+
+        Args:
+            event_id: Discord event ID
+        """
+        with self._lock:
+            self.events.pop(event_id, None)
+            self.subscribers.pop(event_id, None)
+            self._synced.discard(event_id)
+
+        if self.dynamodb_client:
+            self.dynamodb_client.delete_event(event_id)
+        self.logger.info("Removed event %s from index", event_id)
+
+    def add_subscriber(self, event_id: str, user_id: str) -> None:
+        """
+        Record that a user subscribed to an event.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+        """
+        with self._lock:
+            self.subscribers.setdefault(event_id, set()).add(user_id)
+
+        if self.dynamodb_client:
+            self.dynamodb_client.add_event_subscriber(event_id, user_id)
+        self.logger.debug("User %s subscribed to event %s", user_id, event_id)
+
+    def remove_subscriber(self, event_id: str, user_id: str) -> None:
+        """
+        Record that a user unsubscribed from an event.
+
+        Args:
+            event_id: Discord event ID
+            user_id: Discord user ID
+        """
+        with self._lock:
+            self.subscribers.get(event_id, set()).discard(user_id)
+
+        if self.dynamodb_client:
+            self.dynamodb_client.remove_event_subscriber(event_id, user_id)
+        self.logger.debug("User %s unsubscribed from event %s", user_id, event_id)
+
+    def record_heartbeat(self) -> None:
+        """
+        Record that the index is being kept current by a connected listener.
+        Readers stop trusting the index once heartbeats stop.
+        """
+        self.heartbeat_at = time.time()
+        if self.dynamodb_client:
+            self.dynamodb_client.record_listener_heartbeat()
+
+    def clear_heartbeat(self) -> None:
+        """
+        Record that the listener lost its connection and may miss updates.
+        """
+        self.heartbeat_at = None
+        if self.dynamodb_client:
+            self.dynamodb_client.clear_listener_heartbeat()
+
+    def get_subscribers(self, event_id: str) -> Optional[Set[str]]:
+        """
+        Get the subscribers of an event.
+        The in-memory index is checked first, then the DynamoDB copy written by
+        the gateway listener (e.g. when called from a Lambda invocation).
+
+        Args:
+            event_id: Discord event ID
+
+        Returns:
+            Set of subscribed user IDs, or None if the event is not fully indexed
+        """
+        current = (
+            self.heartbeat_at is not None
+            and time.time() - self.heartbeat_at <= EVENT_INDEX_MAX_AGE_SECONDS
+        )
+        with self._lock:
+            if current and event_id in self._synced:
+                return set(self.subscribers.get(event_id, set()))
+
+        if self.dynamodb_client:
+            return self.dynamodb_client.load_event_subscribers(event_id)
+        return None
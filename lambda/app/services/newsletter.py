@@ -4,14 +4,59 @@ It initializes the DiscordService, fetches articles from configured feeds, and p
 It also handles timezone conversion for article publication dates.
 """
 
-import time
+import base64
+import html
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import feedparser
 import pytz
 
 from services.discord import DiscordService
-from config.logger import LoggerConfig
-from models import FeedsConfig, Feed
+from config.logger import LoggerConfig, Truncated
+from clients.parameter_store import ParameterStoreClient
+from clients.dynamodb import DynamoDBClient
+from models import FeedsConfig, Feed, ChannelConfig
+from utils.bloom import BloomFilter
+from utils.cache import (
+    DEFAULT_CACHE_DIR,
+    DiskTier,
+    DynamoDBTier,
+    TieredCache,
+    build_cache,
+)
+from utils.dedup import ArticleDeduplicator
+from utils.deadline import Deadline
+from utils.token_bucket import PRIORITY_LOW
+
+# Discord embed limits (https://discord.com/developers/docs/resources/message#embed-object-embed-limits)
+EMBED_TITLE_LIMIT = 256
+EMBED_FOOTER_LIMIT = 2048
+MESSAGE_EMBED_CHARS_LIMIT = 6000
+# Keep digest entries short so a full digest stays readable
+EMBED_DESCRIPTION_LIMIT = 300
+
+# Upper bound on channels published to concurrently
+MAX_CHANNEL_WORKERS = 8
+
+# Feed validators and entries are kept for a day, so hourly runs can fetch
+# feeds conditionally and reuse the entries of unchanged ones
+FEED_CACHE_TTL_SECONDS = 86400
+
+# Each channel's filter of posted links holds this many links at a 1%
+# false-positive rate; a full filter is rebuilt from the channel history
+POSTED_LINKS_CAPACITY = 5000
+POSTED_LINKS_ERROR_RATE = 0.01
+# Filters are saved after every run, so only abandoned channels expire
+POSTED_LINKS_TTL_SECONDS = 30 * 86400
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate text to the given length, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1] + "…"
 
 
 class NewsletterService:
@@ -22,25 +67,106 @@ class NewsletterService:
 
     Attributes:
         discord_service (DiscordService): Service to interact with Discord API.
+        deduplicator (ArticleDeduplicator): Collapses duplicate articles across feeds.
         channel_name (str): Name of the Discord channel to publish articles.
+        feeds_config (FeedsConfig): Feeds and channel settings, or None to load config.yaml.
+        parameter_store_client (ParameterStoreClient): Client passed to the DiscordService.
+        dynamodb_client (DynamoDBClient): Client for DynamoDB state, passed to the DiscordService.
+        cache (TieredCache): Cache of feed validators (ETag, Last-Modified) and entries.
+        posted_links (TieredCache): Store of each channel's Bloom filter of posted
+            links, or None when the filter is disabled.
     """
 
-    def __init__(self):
-        self.logger = LoggerConfig(__name__).get_logger()
-        self.discord_service = DiscordService()
+    def __init__(
+        self,
+        parameter_store_client: ParameterStoreClient = None,
+        dynamodb_client: DynamoDBClient = None,
+        feeds_config: FeedsConfig = None,
+        cache: TieredCache = None,
+        posted_links_filter: bool = None,
+    ):
+        """
+        Initialize the NewsletterService.
 
-    def publish_latest_articles(self):
+        Args:
+            parameter_store_client: Client for retrieving secrets from Parameter Store.
+                                   If None, a default client will be created.
+            dynamodb_client: Client for DynamoDB state, passed to the DiscordService.
+            feeds_config: Feeds and channel settings to publish.
+                          If None, static/config.yaml is loaded on each run.
+            cache: Cache of feed responses. If None, one is built with
+                   build_cache(), sharing entries through dynamodb_client when
+                   CACHE_SHARED_ENABLED is set.
+            posted_links_filter: Whether to keep a Bloom filter of the links
+                                 posted to each channel, so the channel history
+                                 is only fetched for links that may have been
+                                 posted. Filters are stored in DynamoDB when
+                                 dynamodb_client is given, otherwise in /tmp.
+                                 If None, the POSTED_LINKS_FILTER_ENABLED env
+                                 var is used.
+        """
+        logger_config = LoggerConfig(__name__)
+        self.logger = logger_config.get_logger()
+        self.sampled_logger = logger_config.get_sampled_logger()
+        self.parameter_store_client = parameter_store_client
+        self.dynamodb_client = dynamodb_client
+        # Reminders are time-critical, so posts yield the shared request budget
+        self.discord_service = DiscordService(
+            parameter_store_client=parameter_store_client,
+            dynamodb_client=dynamodb_client,
+            request_priority=PRIORITY_LOW,
+        )
+        self.deduplicator = ArticleDeduplicator()
+        self.feeds_config = feeds_config
+        if cache is None:
+            cache = build_cache("feeds", dynamodb_client=dynamodb_client)
+        self.cache = cache
+
+        if posted_links_filter is None:
+            posted_links_filter = (
+                os.environ.get("POSTED_LINKS_FILTER_ENABLED", "").lower() == "true"
+            )
+        self.posted_links = None
+        if posted_links_filter:
+            # A filter must hold every link posted to its channel, so it is read
+            # from one authoritative tier instead of a possibly stale local copy
+            if dynamodb_client is not None:
+                tier = DynamoDBTier(dynamodb_client)
+            else:
+                directory = os.environ.get("CACHE_DIR", DEFAULT_CACHE_DIR)
+                tier = DiskTier(os.path.join(directory, "posted_links"))
+            self.posted_links = TieredCache(
+                "posted_links", tiers=[tier], ttl=POSTED_LINKS_TTL_SECONDS
+            )
+
+    def publish_latest_articles(
+        self, deadline: Deadline = None, pending_articles: list = None
+    ) -> list:
         """
         Fetches articles from configured RSS feeds and publishes the latest articles to the specified Discord channel.
         It retrieves the articles, checks if they are already published in the Discord channel, and sends new articles.
+        Channels configured for digest mode receive new articles batched into embed messages.
+        Args:
+            deadline (Deadline): Run deadline; publishing stops once it expires.
+            pending_articles (list): Unsent articles checkpointed by a previous run,
+                                     published ahead of newly fetched articles.
+        Returns:
+            list: Articles left unsent because the deadline expired or their
+                  channel failed, to be published by the next run.
         """
         self.logger.info("Starting to publish latest articles...")
 
         # Fetch all articles from configured feeds
         all_articles = []
 
-        feeds = FeedsConfig.from_yaml().feeds
-        for feed in feeds:
+        feeds_config = self.feeds_config or FeedsConfig.from_yaml()
+        for feed in feeds_config.feeds:
+            if deadline and deadline.expired():
+                self.logger.warning(
+                    "Run deadline reached - skipping remaining feeds from: %s",
+                    feed.name,
+                )
+                break
             self.logger.info("Fetching articles from feed: %s", feed.name)
             articles = self._fetch_articles(feed)
             all_articles.extend(articles)
@@ -48,36 +174,325 @@ class NewsletterService:
         # Get today's articles from the combined list
         latest_articles = self.get_latest_article_with_timezone(all_articles)
 
-        self.logger.info("Latest articles: %s", latest_articles)
+        # Resumed articles go first so they keep their place in each queue
+        if pending_articles:
+            self.logger.info(
+                "Resuming %d article(s) from checkpoint", len(pending_articles)
+            )
+            latest_articles = list(pending_articles) + latest_articles
 
-        # Extract links from all articles
-        newsletter_info = [
-            (article["link"], article["channel_name"]) for article in latest_articles
-        ]
+        # Collapse the same story syndicated by several feeds
+        latest_articles = self.deduplicator.deduplicate(latest_articles)
 
-        # Log the newsletter info
-        for newsletter in newsletter_info:
-            link = newsletter[0]
-            channel_name = newsletter[1]
-            self.logger.info("Processing link: %s for channel: %s", link, channel_name)
-            try:
-                channel_id = self.discord_service.get_channel_id(channel_name)
-                if self.discord_service.check_messages_in_discord([link], channel_id):
-                    self.discord_service.send_message_to_channel(
-                        channel_id,
-                        link,
-                    )
+        self.logger.info("Found %d latest article(s)", len(latest_articles))
+        self.logger.debug("Latest articles: %s", Truncated(latest_articles))
+
+        # Group articles by channel, keeping feed order within each channel
+        articles_by_channel = {}
+        for article in latest_articles:
+            articles_by_channel.setdefault(article["channel_name"], []).append(article)
+
+        if not articles_by_channel:
+            self.logger.info("No articles to publish.")
+            return []
 
-                    self.logger.info("Message sent to channel: %s", channel_name)
-                else:
-                    self.logger.info(
-                        "Message already exists in channel: %s", channel_name
+        # Drain each channel's queue in parallel. Discord rate limits are per
+        # channel, so a slow channel only delays its own queue. The workers
+        # share the Discord service and its session; the deadline is passed
+        # with every call rather than stored on it.
+        max_workers = min(len(articles_by_channel), MAX_CHANNEL_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._publish_to_channel,
+                    channel_articles,
+                    feeds_config.get_channel_config(channel_name),
+                    deadline,
+                ): channel_name
+                for channel_name, channel_articles in articles_by_channel.items()
+            }
+            unsent_articles = []
+            for future in as_completed(futures):
+                try:
+                    unsent_articles.extend(future.result())
+                except Exception as e:
+                    self.logger.error(
+                        "Error processing channel %s: %s", futures[future], str(e)
                     )
+                    # Retried next run; articles already sent are recognized then
+                    unsent_articles.extend(articles_by_channel[futures[future]])
 
-                time.sleep(3)  # Small delay to prevent rate limiting
-            except Exception as e:
-                self.logger.error("Error processing message: %s", str(e))
-                continue
+        if unsent_articles:
+            self.logger.warning(
+                "%d article(s) left unsent for the next run", len(unsent_articles)
+            )
+        return unsent_articles
+
+    def _publish_to_channel(
+        self, articles: list, channel_config: ChannelConfig, deadline: Deadline = None
+    ) -> list:
+        """
+        Publishes the articles that are not yet in the channel, in order.
+        Pacing is left to the Discord service's per-channel rate-limit bucket.
+        Args:
+            articles (list): Articles destined for the channel, in publishing order.
+            channel_config (ChannelConfig): Publishing options for the channel.
+            deadline (Deadline): Run deadline; publishing stops once it expires.
+        Returns:
+            list: Articles left unsent because the deadline expired.
+        """
+        channel_name = channel_config.name
+        if deadline and deadline.expired():
+            return articles
+
+        channel_id = self.discord_service.get_channel_id(channel_name, deadline)
+
+        # Check the feed's original links too, so posts made before links
+        # were canonicalized are still recognized
+        links = []
+        for article in articles:
+            links.append(article["link"])
+            if article.get("original_link", article["link"]) != article["link"]:
+                links.append(article["original_link"])
+        new_links, posted_links = self._find_new_links(links, channel_id, deadline)
+        new_articles = [
+            article
+            for article in articles
+            if article["link"] in new_links
+            and article.get("original_link", article["link"]) in new_links
+        ]
+
+        try:
+            return self._send_new_articles(
+                new_articles, channel_id, channel_config, deadline, posted_links
+            )
+        finally:
+            self._save_posted_links(channel_id, posted_links)
+
+    def _send_new_articles(
+        self,
+        new_articles: list,
+        channel_id: str,
+        channel_config: ChannelConfig,
+        deadline: Deadline = None,
+        posted_links: BloomFilter = None,
+    ) -> list:
+        """
+        Sends articles to a channel, as digests or one message per article.
+        Args:
+            new_articles (list): Articles not yet in the channel, in publishing order.
+            channel_id (str): ID of the channel.
+            channel_config (ChannelConfig): Publishing options for the channel.
+            deadline (Deadline): Run deadline; publishing stops once it expires.
+            posted_links (BloomFilter): Filter the links of sent articles are added to.
+        Returns:
+            list: Articles left unsent because the deadline expired.
+        """
+        channel_name = channel_config.name
+        if not new_articles:
+            self.logger.info("Messages already exist in channel: %s", channel_name)
+            return []
+
+        if channel_config.digest:
+            digests = self._build_digest_messages(
+                new_articles, channel_config.digest_size
+            )
+            # Embeds are built one per article, in order
+            sent = 0
+            for embeds in digests:
+                if deadline and deadline.expired():
+                    return new_articles[sent:]
+                self.discord_service.send_embeds_to_channel(
+                    channel_id, embeds, deadline=deadline
+                )
+                self._remember_posted(
+                    posted_links, new_articles[sent : sent + len(embeds)]
+                )
+                sent += len(embeds)
+                self.logger.info(
+                    "Digest of %d article(s) sent to channel: %s",
+                    len(embeds),
+                    channel_name,
+                )
+            return []
+
+        for index, article in enumerate(new_articles):
+            if deadline and deadline.expired():
+                return new_articles[index:]
+            self.sampled_logger.info(
+                "Processing link: %s for channel: %s", article["link"], channel_name
+            )
+            self.discord_service.send_message_to_channel(
+                channel_id, article["link"], deadline
+            )
+            self._remember_posted(posted_links, [article])
+            self.sampled_logger.info("Message sent to channel: %s", channel_name)
+
+        return []
+
+    def _find_new_links(
+        self, links: list, channel_id: str, deadline: Deadline = None
+    ) -> tuple:
+        """
+        Finds the links that have not been posted to a channel.
+        With the posted-links filter, links the filter has never seen are new
+        without reading the channel; the history is only fetched to confirm
+        links that may have been posted. Without a stored filter, the history
+        is read and a new filter is built from it.
+        Args:
+            links (list): Links to check.
+            channel_id (str): ID of the channel.
+            deadline (Deadline): Run deadline; Discord retries never wait past it.
+        Returns:
+            tuple: Set of new links, and the channel's BloomFilter (None when
+                   the filter is disabled).
+        """
+        if self.posted_links is None:
+            new_links = self.discord_service.check_messages_in_discord(
+                links, channel_id, deadline
+            )
+            return set(new_links), None
+
+        posted_links = self._load_posted_links(channel_id)
+        if posted_links is None:
+            history = self.discord_service.list_channel_links(channel_id, deadline)
+            posted_links = BloomFilter.for_capacity(
+                POSTED_LINKS_CAPACITY, POSTED_LINKS_ERROR_RATE
+            )
+            posted_links.update(history)
+            return {link for link in links if link not in history}, posted_links
+
+        maybe_posted = {link for link in links if link in posted_links}
+        new_links = set(links) - maybe_posted
+        if maybe_posted:
+            history = self.discord_service.list_channel_links(channel_id, deadline)
+            new_links.update(link for link in maybe_posted if link not in history)
+        else:
+            self.logger.info(
+                "No link may have been posted to channel %s - skipped history fetch",
+                channel_id,
+            )
+        return new_links, posted_links
+
+    @staticmethod
+    def _remember_posted(posted_links: BloomFilter, articles: list) -> None:
+        """Add the links of sent articles to the channel's filter, if any."""
+        if posted_links is None:
+            return
+        for article in articles:
+            posted_links.add(article["link"])
+            if article.get("original_link", article["link"]) != article["link"]:
+                posted_links.add(article["original_link"])
+
+    def _load_posted_links(self, channel_id: str):
+        """
+        Loads a channel's filter of posted links.
+        Args:
+            channel_id (str): ID of the channel.
+        Returns:
+            BloomFilter: The stored filter, or None if there is none, it cannot
+                         be read, or it is full and must be rebuilt.
+        """
+        blob = self.posted_links.get(channel_id)
+        if not blob:
+            return None
+        try:
+            posted_links = BloomFilter.from_bytes(base64.b64decode(blob))
+        except ValueError as e:
+            self.logger.warning(
+                "Discarding unreadable posted-links filter for %s: %s", channel_id, e
+            )
+            return None
+        if posted_links.count >= POSTED_LINKS_CAPACITY:
+            self.logger.info(
+                "Posted-links filter for %s is full - rebuilding it", channel_id
+            )
+            return None
+        return posted_links
+
+    def _save_posted_links(self, channel_id: str, posted_links: BloomFilter) -> None:
+        """Stores a channel's filter of posted links as one base64-encoded blob."""
+        if self.posted_links is None or posted_links is None:
+            return
+        self.posted_links.set(
+            channel_id, base64.b64encode(posted_links.to_bytes()).decode("ascii")
+        )
+
+    def _build_digest_messages(self, articles: list, digest_size: int) -> list:
+        """
+        Packs articles into embed lists that each fit in a single Discord message.
+        Args:
+            articles (list): Articles to pack, in publishing order.
+            digest_size (int): Maximum number of embeds per message.
+        Returns:
+            list: List of embed lists, one per message to send.
+        """
+        messages = []
+        current = []
+        current_chars = 0
+
+        for article in articles:
+            embed = self._build_embed(article)
+            embed_chars = self._embed_length(embed)
+
+            if current and (
+                len(current) >= digest_size
+                or current_chars + embed_chars > MESSAGE_EMBED_CHARS_LIMIT
+            ):
+                messages.append(current)
+                current = []
+                current_chars = 0
+
+            current.append(embed)
+            current_chars += embed_chars
+
+        if current:
+            messages.append(current)
+
+        return messages
+
+    @staticmethod
+    def _build_embed(article: dict) -> dict:
+        """
+        Builds a Discord embed object for an article.
+        Args:
+            article (dict): Article with title, link, summary and feed name.
+        Returns:
+            dict: Embed object with text fields truncated to Discord's limits.
+        """
+        summary = html.unescape(re.sub(r"<[^>]+>", "", article.get("summary") or ""))
+        summary = " ".join(summary.split())
+        if summary == "N/A":
+            summary = ""
+
+        embed = {
+            "title": _truncate(
+                article.get("title") or article["link"], EMBED_TITLE_LIMIT
+            ),
+            "url": article["link"],
+        }
+        if summary:
+            embed["description"] = _truncate(summary, EMBED_DESCRIPTION_LIMIT)
+        if article.get("feed_name"):
+            embed["footer"] = {
+                "text": _truncate(article["feed_name"], EMBED_FOOTER_LIMIT)
+            }
+        return embed
+
+    @staticmethod
+    def _embed_length(embed: dict) -> int:
+        """
+        Counts the characters Discord includes in its per-message embed limit.
+        Args:
+            embed (dict): Embed object.
+        Returns:
+            int: Combined length of the embed's title, description and footer.
+        """
+        return (
+            len(embed.get("title", ""))
+            + len(embed.get("description", ""))
+            + len(embed.get("footer", {}).get("text", ""))
+        )
 
     def get_latest_article_with_timezone(self, articles, timezone_str="UTC"):
         """
@@ -118,6 +533,8 @@ class NewsletterService:
         """
         Fetch articles from the specified RSS feed.
         returns a list of dictionaries containing the articles.
+        The feed is requested with the ETag and Last-Modified of the previous
+        response, and the cached entries are reused when it has not changed.
         Args:
             feed (Feed): The Feed object containing the feed configuration.
         Returns:
@@ -125,21 +542,48 @@ class NewsletterService:
         Raises:
             ValueError: If there is an error parsing the feed.
         """
-        feed_data = feedparser.parse(feed.url)
-        if feed_data.bozo:
-            raise ValueError(f"Error parsing feed '{feed.name}': {feed.bozo_exception}")
+        cached = self.cache.get(feed.url) or {}
+        feed_data = feedparser.parse(
+            feed.url, etag=cached.get("etag"), modified=cached.get("modified")
+        )
+
+        if cached and feed_data.get("status") == 304:
+            entries = cached["entries"]
+            self.logger.info(
+                "Feed '%s' not modified - reusing %d cached entries",
+                feed.name,
+                len(entries),
+            )
+        else:
+            if feed_data.bozo:
+                raise ValueError(
+                    f"Error parsing feed '{feed.name}': {feed.bozo_exception}"
+                )
 
-        articles = []
-        for entry in feed_data.entries:
-            articles.append(
+            entries = [
                 {
                     "title": entry.title,
                     "link": entry.link,
                     "published": entry.get("published", "N/A"),
                     "summary": entry.get("summary", "N/A"),
-                    "channel_name": feed.channel_name,
+                    "origin_link": entry.get("feedburner_origlink"),
                 }
-            )
+                for entry in feed_data.entries
+            ]
+            # Without validators the next request cannot be conditional
+            etag, modified = feed_data.get("etag"), feed_data.get("modified")
+            if isinstance(etag, str) or isinstance(modified, str):
+                self.cache.set(
+                    feed.url,
+                    {"etag": etag, "modified": modified, "entries": entries},
+                    ttl=FEED_CACHE_TTL_SECONDS,
+                )
+
+        # Channel and feed names come from the current config, not the cache
+        articles = [
+            {**entry, "channel_name": feed.channel_name, "feed_name": feed.name}
+            for entry in entries
+        ]
 
         self.logger.info("Fetched %d articles from feed '%s'", len(articles), feed.name)
 
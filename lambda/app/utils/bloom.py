@@ -0,0 +1,133 @@
+"""
+Bloom filter for remembering which links were posted to a channel.
+
+A Bloom filter answers "definitely not added" or "possibly added" using a
+fixed-size bit array, so a channel's posting history fits in a few kilobytes
+and a lookup is a handful of bit tests. It serializes to one small binary
+blob for storage between runs.
+"""
+
+import hashlib
+import math
+import struct
+
+# Header of a serialized filter: magic, bit count, hash count, items added
+_HEADER = struct.Struct(">4sIBI")
+_MAGIC = b"HBF1"
+
+
+class BloomFilter:
+    """
+    Space-efficient set membership test with false positives but no false negatives.
+
+    Positions are derived from one 128-bit BLAKE2b digest per item with double
+    hashing, so adding or testing an item hashes it once.
+
+    Attributes:
+        size_bits: Number of bits in the filter
+        num_hashes: Bits set per item
+        count: Number of items added
+    """
+
+    def __init__(self, size_bits: int, num_hashes: int, count: int = 0, bits=None):
+        """
+        Initialize an empty filter, or one restored from its bits.
+
+        Args:
+            size_bits: Number of bits in the filter
+            num_hashes: Bits set per item
+            count: Number of items already added (when restoring)
+            bits: Bit array to restore (default: all bits clear)
+        """
+        if size_bits <= 0 or num_hashes <= 0:
+            raise ValueError("Bloom filter size and hash count must be positive")
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self._bits = (
+            bytearray(bits) if bits is not None else bytearray((size_bits + 7) // 8)
+        )
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> "BloomFilter":
+        """
+        Create a filter sized for a number of items and false-positive rate.
+
+        Args:
+            capacity: Number of items the filter should hold
+            error_rate: False-positive rate once capacity items are added
+
+        Returns:
+            Empty BloomFilter
+        """
+        size_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(size_bits / capacity * math.log(2)))
+        return cls(size_bits, num_hashes)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return (
+            (first + index * second) % self.size_bits
+            for index in range(self.num_hashes)
+        )
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: Item to add
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items) -> None:
+        """
+        Add several items to the filter.
+
+        Args:
+            items: Items to add
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the filter.
+
+        Returns:
+            Header followed by the bit array
+        """
+        header = _HEADER.pack(_MAGIC, self.size_bits, self.num_hashes, self.count)
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Restore a filter serialized with to_bytes().
+
+        Args:
+            data: Serialized filter
+
+        Returns:
+            Restored BloomFilter
+
+        Raises:
+            ValueError: If the data is not a serialized filter
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Serialized Bloom filter is truncated")
+        magic, size_bits, num_hashes, count = _HEADER.unpack_from(data)
+        bits = data[_HEADER.size :]
+        if magic != _MAGIC or len(bits) != (size_bits + 7) // 8:
+            raise ValueError("Data is not a serialized Bloom filter")
+        return cls(size_bits, num_hashes, count=count, bits=bits)
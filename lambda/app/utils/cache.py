@@ -0,0 +1,414 @@
+"""
+Tiered cache for values reused across invocations.
+
+TieredCache looks a key up in up to three tiers, fastest first:
+
+- MemoryTier: an in-process LRU with per-entry expiry and a bounded size.
+- DiskTier: JSON files under /tmp, which survive between invocations of a
+  warm container (and across code that builds its own services per run).
+- DynamoDBTier: entries in the DynamoDB table, shared by every container.
+
+A hit in a slower tier is copied into the faster ones with its remaining
+lifetime. get_or_load() runs one loader per key at a time, so threads that
+miss on the same key wait for the first load instead of repeating it.
+Hits (by tier), misses, loads and evictions are counted for logging.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Entries kept in memory per cache before the least recently used is evicted
+DEFAULT_MAX_ENTRIES = 1024
+
+# Lifetime of an entry when the caller does not give one
+DEFAULT_TTL_SECONDS = 300
+
+# Directory of the disk tier; /tmp is the only writable path in Lambda
+DEFAULT_CACHE_DIR = "/tmp/the-herald-cache"
+
+# Loads are serialized per key through this many locks
+LOCK_STRIPES = 16
+
+# (value, expiry as a Unix timestamp)
+Entry = Tuple[Any, float]
+
+_MISSING = object()
+
+
+class MemoryTier:
+    """
+    In-process LRU cache with per-entry expiry.
+
+    Attributes:
+        max_entries: Entries kept before the least recently used is evicted
+        evictions: Entries evicted to stay within max_entries
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def items(self) -> Dict[str, Any]:
+        """Unexpired entries by key."""
+        now = time.time()
+        with self._lock:
+            return {
+                key: value
+                for key, (value, expires_at) in self._entries.items()
+                if expires_at > now
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskTier:
+    """
+    Cache tier of JSON files, one per key, in a local directory.
+
+    Files are written to a temporary name and renamed into place, so readers
+    never see a partial entry. Values must be JSON-serializable. Read and
+    write failures are logged and treated as misses.
+
+    Attributes:
+        directory: Directory holding the entry files
+    """
+
+    name = "disk"
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Entry]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read cache file %s: %s", path, e)
+            return None
+
+        # Guard against hash collisions and expired files
+        if data.get("key") != key or data.get("expires_at", 0) <= time.time():
+            return None
+        return data["value"], data["expires_at"]
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        path = self._path(key)
+        temp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "value": value, "expires_at": expires_at}, f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write cache file %s: %s", path, e)
+            temp_path.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not delete cache file for %s: %s", key, e)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class DynamoDBTier:
+    """
+    Cache tier stored in the DynamoDB table and shared by every container.
+
+    Entries expire through the table's TTL; clear() leaves them to it.
+
+    Attributes:
+        dynamodb_client: Client whose table holds the entries
+    """
+
+    name = "dynamodb"
+
+    def __init__(self, dynamodb_client):
+        self.dynamodb_client = dynamodb_client
+
+    def get(self, key: str) -> Optional[Entry]:
+        return self.dynamodb_client.get_cache_entry(key)
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self.dynamodb_client.put_cache_entry(key, value, expires_at)
+
+    def delete(self, key: str) -> None:
+        self.dynamodb_client.delete_cache_entry(key)
+
+    def clear(self) -> None:
+        pass
+
+
+class TieredCache:
+    """
+    Cache that reads through its tiers in order and writes to all of them.
+
+    Keys are prefixed with the cache's namespace, so caches for different
+    kinds of values can share the disk and DynamoDB tiers.
+
+    Attributes:
+        namespace: Prefix of every key written by this cache
+        tiers: Tiers from fastest to slowest
+        ttl: Lifetime of entries, in seconds, when set() is not given one
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        tiers: List = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Prefix of every key written by this cache
+            tiers: Tiers from fastest to slowest (default: a MemoryTier only)
+            ttl: Default lifetime of entries in seconds
+        """
+        self.namespace = namespace
+        self.tiers = tiers if tiers is not None else [MemoryTier()]
+        self.ttl = ttl
+        self._memory = next(
+            (tier for tier in self.tiers if isinstance(tier, MemoryTier)), None
+        )
+        self._hits: Dict[str, int] = {tier.name: 0 for tier in self.tiers}
+        self._misses = 0
+        self._loads = 0
+        self._stats_lock = threading.Lock()
+        self._load_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _lookup(self, key: str) -> Tuple[Any, Optional[str]]:
+        """Find a key, copying a hit into the faster tiers it was missing from."""
+        full_key = self._full_key(key)
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get(full_key)
+            if entry is None:
+                continue
+            value, expires_at = entry
+            for faster in self.tiers[:index]:
+                faster.set(full_key, value, expires_at)
+            return value, tier.name
+        return _MISSING, None
+
+    def _count(self, tier_name: Optional[str]) -> None:
+        with self._stats_lock:
+            if tier_name is None:
+                self._misses += 1
+            else:
+                self._hits[tier_name] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Key within this cache's namespace
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default if no tier holds an unexpired entry
+        """
+        value, tier_name = self._lookup(key)
+        self._count(tier_name)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        """
+        Store a value in every tier.
+
+        Args:
+            key: Key within this cache's namespace
+            value: Value to cache (JSON-serializable if a disk or DynamoDB tier is used)
+            ttl: Lifetime in seconds (default: the cache's ttl)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        full_key = self._full_key(key)
+        for tier in self.tiers:
+            tier.set(full_key, value, expires_at)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from every tier, e.g. once it is known to be stale.
+
+        Args:
+            key: Key within this cache's namespace
+        """
+        full_key = self._full_key(key)
+        for tier in self.tiers:
+            tier.delete(full_key)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: float = None):
+        """
+        Get a cached value, loading and caching it on a miss.
+
+        Only one loader runs per key at a time: callers that miss while a load
+        is in progress wait for it and use its result. Loader errors are raised
+        and nothing is cached.
+
+        Args:
+            key: Key within this cache's namespace
+            loader: Function returning the value to cache
+            ttl: Lifetime in seconds (default: the cache's ttl)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value, tier_name = self._lookup(key)
+        if value is not _MISSING:
+            self._count(tier_name)
+            return value
+
+        with self._load_locks[hash(key) % LOCK_STRIPES]:
+            # Another caller may have loaded the value while this one waited
+            value, tier_name = self._lookup(key)
+            self._count(tier_name)
+            if value is not _MISSING:
+                return value
+
+            value = loader()
+            with self._stats_lock:
+                self._loads += 1
+            self.set(key, value, ttl)
+            return value
+
+    def clear(self) -> None:
+        """Remove every entry from the memory and disk tiers; DynamoDB entries expire by TTL."""
+        for tier in self.tiers:
+            tier.clear()
+
+    def items(self) -> Dict[str, Any]:
+        """
+        Get the unexpired entries held in memory (for debugging/testing).
+
+        Returns:
+            Dictionary of cached values by key
+        """
+        if self._memory is None:
+            return {}
+        prefix = f"{self.namespace}:"
+        return {
+            key[len(prefix) :]: value
+            for key, value in self._memory.items().items()
+            if key.startswith(prefix)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache's counters.
+
+        Returns:
+            Dictionary with hits by tier, misses, loads, memory evictions and
+            the number of entries in memory
+        """
+        with self._stats_lock:
+            return {
+                "hits": dict(self._hits),
+                "misses": self._misses,
+                "loads": self._loads,
+                "evictions": self._memory.evictions if self._memory else 0,
+                "entries": len(self),
+            }
+
+    def __len__(self) -> int:
+        return len(self._memory) if self._memory else 0
+
+
+def build_cache(
+    namespace: str,
+    dynamodb_client=None,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> TieredCache:
+    """
+    Build a cache with the tiers enabled for this environment.
+
+    The memory tier is always used. The disk tier is used when
+    CACHE_DISK_ENABLED is "true", which is the default inside Lambda; its
+    directory is CACHE_DIR. The DynamoDB tier is used when a client is given
+    and CACHE_SHARED_ENABLED is "true".
+
+    Args:
+        namespace: Prefix of every key written by the cache
+        dynamodb_client: Client for the shared DynamoDB tier (default: None)
+        ttl: Default lifetime of entries in seconds
+        max_entries: Entries kept in memory
+
+    Returns:
+        TieredCache with the enabled tiers
+    """
+    tiers = [MemoryTier(max_entries)]
+
+    in_lambda = bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+    disk_enabled = os.environ.get(
+        "CACHE_DISK_ENABLED", "true" if in_lambda else "false"
+    )
+    if disk_enabled.lower() == "true":
+        directory = os.environ.get("CACHE_DIR", DEFAULT_CACHE_DIR)
+        tiers.append(DiskTier(os.path.join(directory, namespace)))
+
+    shared_enabled = os.environ.get("CACHE_SHARED_ENABLED", "").lower() == "true"
+    if dynamodb_client is not None and shared_enabled:
+        tiers.append(DynamoDBTier(dynamodb_client))
+
+    logger.debug(
+        "Built %s cache with tiers: %s",
+        namespace,
+        ", ".join(tier.name for tier in tiers),
+    )
+    return TieredCache(namespace, tiers=tiers, ttl=ttl)
@@ -0,0 +1,69 @@
+"""
+Lambda run deadline tracking.
+
+This module wraps the Lambda context's remaining execution time so work loops
+can stop cleanly, and checkpoint what is left, before the function times out.
+"""
+
+from typing import Any, Optional
+
+# Time kept in reserve for checkpointing and returning a response
+DEFAULT_MARGIN_MS = 30000
+
+
+class Deadline:
+    """
+    Tracks the time left in a Lambda invocation.
+
+    Without a context the deadline never expires, so services behave the same
+    when run outside Lambda.
+
+    Attributes:
+        context: Lambda context object, or None
+        margin_ms: Remaining time below which work should stop
+    """
+
+    def __init__(self, context: Any = None, margin_ms: int = DEFAULT_MARGIN_MS):
+        """
+        Initialize the deadline.
+
+        Args:
+            context: Lambda context providing get_remaining_time_in_millis()
+            margin_ms: Remaining time in milliseconds below which work should stop
+        """
+        self.context = context
+        self.margin_ms = margin_ms
+
+    def remaining_ms(self) -> Optional[int]:
+        """
+        Get the time left before the Lambda timeout.
+
+        Returns:
+            Remaining milliseconds, or None if there is no deadline
+        """
+        if self.context is None:
+            return None
+        return self.context.get_remaining_time_in_millis()
+
+    def time_left(self) -> Optional[float]:
+        """
+        Get the time left before work should stop.
+
+        Returns:
+            Seconds until the deadline expires (0 once expired), or None if there
+            is no deadline
+        """
+        remaining = self.remaining_ms()
+        if remaining is None:
+            return None
+        return max(0, remaining - self.margin_ms) / 1000
+
+    def expired(self) -> bool:
+        """
+        Check whether work should stop to leave time for checkpointing.
+
+        Returns:
+            True if the remaining time is below the margin, False otherwise
+        """
+        remaining = self.remaining_ms()
+        return remaining is not None and remaining < self.margin_ms
@@ -0,0 +1,414 @@
+"""
+Article deduplication helpers.
+
+This module canonicalizes article URLs (stripping tracking parameters and
+resolving FeedBurner redirects) and detects near-duplicate titles using
+character shingles, so a story syndicated by several feeds is posted once.
+
+Titles are matched through a MinHash/LSH index: each title's signature is
+split into bands, and only titles sharing a band bucket are compared exactly,
+so checking an article costs about the same however many were kept before it.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from utils.cache import MemoryTier, TieredCache
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only carry tracking information
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ncid"}
+
+# Hosts whose links are redirects to the publisher's article
+FEEDBURNER_HOSTS = {"feeds.feedburner.com", "feedproxy.google.com"}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Resolved redirects kept per container, and for how long
+REDIRECT_CACHE_MAX_ENTRIES = 2048
+REDIRECT_CACHE_TTL_SECONDS = 86400
+
+# Redirects resolved at once, and the longest a run spends resolving them
+REDIRECT_WORKERS = 8
+REDIRECT_BUDGET_SECONDS = 10.0
+
+# MinHash signature length and its split into LSH bands. With 16 bands of 4
+# rows, titles with a similarity of 0.8 share a bucket with probability
+# 1 - (1 - 0.8**4)**16 > 0.999, while those at 0.3 rarely do.
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+# Fixed seed, so signatures are stable across processes
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def strip_tracking_params(url: str) -> str:
+    """
+    Normalize a URL and remove tracking query parameters.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        URL with a lowercase scheme and host, no default port, no fragment
+        and no utm_* or other tracking parameters
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname or ""
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    query = [
+        (key, value)
+        for key, value in params
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        and key.lower() not in TRACKING_PARAMS
+    ]
+    # Only re-encode the query when something was removed, so untouched
+    # links keep their exact encoding
+    query_string = urlencode(query) if len(query) != len(params) else parts.query
+
+    return urlunsplit((scheme, netloc, parts.path, query_string, ""))
+
+
+def title_shingles(title: str, size: int = 5) -> Set[str]:
+    """
+    Build the set of character shingles for a title.
+
+    Args:
+        title: Article title
+        size: Number of characters per shingle
+
+    Returns:
+        Set of shingles taken from the lowercased, punctuation-free title
+    """
+    normalized = " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard_similarity(first: Set[str], second: Set[str]) -> float:
+    """
+    Compute the Jaccard similarity of two shingle sets.
+
+    Args:
+        first: First shingle set
+        second: Second shingle set
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def minhash_signature(shingles: Set[str]) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a shingle set.
+
+    The fraction of positions at which two signatures agree estimates the
+    Jaccard similarity of their sets.
+
+    Args:
+        shingles: Non-empty shingle set
+
+    Returns:
+        Signature of MINHASH_PERMUTATIONS values
+    """
+    hashes = [
+        int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for shingle in shingles
+    ]
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+class TitleIndex:
+    """
+    MinHash/LSH index of title shingle sets.
+
+    Candidates are the titles sharing at least one band of their signature;
+    each candidate is then confirmed with the exact Jaccard similarity.
+    """
+
+    def __init__(self, bands: int = LSH_BANDS):
+        """
+        Initialize an empty index.
+
+        Args:
+            bands: Number of LSH bands the signature is split into
+        """
+        self.bands = bands
+        self.rows = MINHASH_PERMUTATIONS // bands
+        self._buckets: Dict[Tuple[int, tuple], List[int]] = {}
+        self._shingles: List[Set[str]] = []
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, tuple]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    def find_similar(self, shingles: Set[str], threshold: float) -> bool:
+        """
+        Check whether a similar title was added.
+
+        Args:
+            shingles: Shingle set of the title to look up
+            threshold: Minimum Jaccard similarity treated as a match
+
+        Returns:
+            True if an added title is at least threshold similar
+        """
+        if not shingles:
+            return False
+        checked = set()
+        for key in self._band_keys(minhash_signature(shingles)):
+            for position in self._buckets.get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                if jaccard_similarity(shingles, self._shingles[position]) >= threshold:
+                    return True
+        return False
+
+    def add(self, shingles: Set[str]) -> None:
+        """
+        Add a title's shingle set to the index.
+
+        Args:
+            shingles: Shingle set of the title
+        """
+        if not shingles:
+            return
+        position = len(self._shingles)
+        self._shingles.append(shingles)
+        for key in self._band_keys(minhash_signature(shingles)):
+            self._buckets.setdefault(key, []).append(position)
+
+
+class UrlCanonicalizer:
+    """
+    Resolves article links to a canonical form.
+
+    FeedBurner redirects are resolved with a HEAD request and kept in a
+    bounded LRU cache, so each redirect is only followed once per day in a
+    warm container. resolve_redirects() resolves a run's redirects
+    concurrently within a time budget.
+
+    Attributes:
+        redirect_cache: Resolved redirects by feed link
+    """
+
+    def __init__(
+        self,
+        timeout: int = 5,
+        max_workers: int = REDIRECT_WORKERS,
+        budget_seconds: float = REDIRECT_BUDGET_SECONDS,
+    ):
+        """
+        Initialize the canonicalizer.
+
+        Args:
+            timeout: Timeout in seconds for resolving one redirect
+            max_workers: Redirects resolved at once
+            budget_seconds: Longest time resolve_redirects() waits for a batch
+        """
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.budget_seconds = budget_seconds
+        self.redirect_cache = TieredCache(
+            "redirects",
+            tiers=[MemoryTier(max_entries=REDIRECT_CACHE_MAX_ENTRIES)],
+            ttl=REDIRECT_CACHE_TTL_SECONDS,
+        )
+
+    @staticmethod
+    def is_redirect(url: str) -> bool:
+        """Check whether a link is a FeedBurner redirect."""
+        return (urlsplit(url).hostname or "").lower() in FEEDBURNER_HOSTS
+
+    def resolve_redirects(self, urls: Iterable[str]) -> int:
+        """
+        Resolve uncached redirects concurrently, waiting at most budget_seconds.
+
+        Redirects still unresolved when the budget runs out keep resolving in
+        the background and are cached for a later run.
+
+        Args:
+            urls: Feed links, of which only FeedBurner redirects are resolved
+
+        Returns:
+            Number of redirects resolved within the budget
+        """
+        pending = {
+            url
+            for url in urls
+            if self.is_redirect(url) and self.redirect_cache.get(url) is None
+        }
+        if not pending:
+            return 0
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="redirects",
+        )
+        try:
+            futures = [executor.submit(self._resolve_redirect, url) for url in pending]
+            done, not_done = wait(futures, timeout=self.budget_seconds)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            "Resolved %d of %d redirect(s) in %.1fs",
+            len(done),
+            len(pending),
+            time.monotonic() - started,
+        )
+        return len(done)
+
+    def canonicalize(
+        self, url: str, origin_url: Optional[str] = None, resolve: bool = True
+    ) -> str:
+        """
+        Get the canonical form of an article URL.
+
+        Args:
+            url: Link as published in the feed
+            origin_url: Publisher link provided by the feed, if any
+                        (e.g. feedburner:origLink)
+            resolve: Whether to resolve a redirect missing from the cache.
+                     If False, such a redirect is kept as published.
+
+        Returns:
+            Canonical URL
+        """
+        if origin_url:
+            return strip_tracking_params(origin_url)
+
+        if self.is_redirect(url):
+            resolved = self.redirect_cache.get(url)
+            if resolved is None and resolve:
+                resolved = self._resolve_redirect(url)
+            url = resolved or url
+
+        return strip_tracking_params(url)
+
+    def _resolve_redirect(self, url: str) -> str:
+        """
+        Follow redirects for a URL, caching the final location.
+
+        Args:
+            url: URL to resolve
+
+        Returns:
+            Final URL after redirects, or the original URL if resolution fails
+        """
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=self.timeout)
+            resolved = response.url or url
+        except requests.exceptions.RequestException as e:
+            logger.warning("Could not resolve redirect for %s: %s", url, e)
+            resolved = url
+
+        # Failures are cached too, so a slow redirector only costs one timeout
+        self.redirect_cache.set(url, resolved)
+        return resolved
+
+
+class ArticleDeduplicator:
+    """
+    Collapses duplicate articles across feeds.
+
+    Articles are considered duplicates when they are destined for the same
+    channel and either share a canonical link or have near-identical titles.
+    """
+
+    def __init__(
+        self,
+        canonicalizer: UrlCanonicalizer = None,
+        title_threshold: float = 0.8,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            canonicalizer: Canonicalizer used for article links.
+                           If None, a new one is created.
+            title_threshold: Minimum title similarity treated as a duplicate
+        """
+        self.canonicalizer = canonicalizer or UrlCanonicalizer()
+        self.title_threshold = title_threshold
+
+    def deduplicate(self, articles: List[dict]) -> List[dict]:
+        """
+        Remove duplicate articles, keeping the first occurrence.
+
+        Each returned article's "link" is replaced by its canonical link and
+        the feed's link is kept as "original_link". Redirects are resolved
+        up front, concurrently and within the canonicalizer's time budget.
+
+        Args:
+            articles: Articles in publishing order
+
+        Returns:
+            List of unique articles in publishing order
+        """
+        seen_links: Dict[str, Set[str]] = {}
+        seen_titles: Dict[str, TitleIndex] = {}
+        unique_articles = []
+
+        self.canonicalizer.resolve_redirects(
+            article["link"] for article in articles if not article.get("origin_link")
+        )
+
+        for article in articles:
+            channel_name = article["channel_name"]
+            canonical_link = self.canonicalizer.canonicalize(
+                article["link"], article.get("origin_link"), resolve=False
+            )
+
+            channel_links = seen_links.setdefault(channel_name, set())
+            if canonical_link in channel_links:
+                logger.debug("Skipping duplicate link: %s", canonical_link)
+                continue
+
+            shingles = title_shingles(article.get("title") or "")
+            channel_titles = seen_titles.setdefault(channel_name, TitleIndex())
+            if channel_titles.find_similar(shingles, self.title_threshold):
+                logger.debug("Skipping near-duplicate title: %s", article.get("title"))
+                continue
+
+            channel_links.add(canonical_link)
+            channel_titles.add(shingles)
+            unique_articles.append(
+                {
+                    **article,
+                    "link": canonical_link,
+                    "original_link": article.get("original_link", article["link"]),
+                }
+            )
+
+        return unique_articles
@@ -0,0 +1,385 @@
+"""
+Discord rate-limit tracking.
+
+This module keeps track of Discord's per-route rate-limit buckets using the
+X-RateLimit-* response headers, so requests wait only as long as Discord
+requires instead of sleeping a fixed amount before every call.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+from utils.token_bucket import PRIORITY_HIGH, SharedTokenBucket
+
+# Path segments whose following ID is a Discord "major parameter". Routes with
+# different major parameters have independent rate limits.
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
+
+SNOWFLAKE_PATTERN = re.compile(r"^\d{15,25}$")
+
+# While the first request to a bucket is in flight its budget is unknown, so
+# other requests poll at this interval until the response headers arrive
+PROBE_POLL_SECONDS = 0.05
+
+# A probe without a response after this long (the request timeout) is abandoned
+PROBE_TIMEOUT_SECONDS = 10.0
+
+
+def route_key(method: str, url: str) -> str:
+    """
+    Build the rate-limit route key for a request.
+
+    IDs that are not major parameters are replaced with a placeholder, so for
+    example every user of a scheduled event shares one bucket, while every
+    channel gets its own.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+
+    Returns:
+        Route key such as "POST /channels/123/messages"
+    """
+    segments = urlsplit(url).path.split("/")
+    normalized = []
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else ""
+        if SNOWFLAKE_PATTERN.match(segment) and previous not in MAJOR_PARAMETERS:
+            normalized.append("{id}")
+        else:
+            normalized.append(segment)
+    path = "/".join(normalized)
+    # Drop the API version prefix so keys do not depend on the base URL
+    path = re.sub(r"^.*?/api/v\d+", "", path)
+    return f"{method.upper()} {path}"
+
+
+class RateLimitBucket:
+    """
+    State of a single Discord rate-limit bucket.
+
+    Attributes:
+        remaining: Requests left in the current window, or None if unknown
+        reset_at: Epoch time at which the window resets
+        probe_started_at: Time the request that will reveal an unknown budget
+            was sent, or None if no such request is in flight
+    """
+
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.probe_started_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def wait_time(self, now: float) -> float:
+        """
+        Get how long a request must wait before using this bucket.
+
+        Args:
+            now: Current epoch time
+
+        Returns:
+            Seconds to wait, 0.0 if a request may be sent immediately
+        """
+        if self.remaining is not None and self.remaining <= 0 and self.reset_at > now:
+            return self.reset_at - now
+        if (
+            self.remaining is None
+            and self.probe_started_at is not None
+            and now - self.probe_started_at < PROBE_TIMEOUT_SECONDS
+        ):
+            # Concurrent requests would all overrun a budget nobody knows yet
+            return PROBE_POLL_SECONDS
+        return 0.0
+
+    def reserve(self, now: float) -> None:
+        """
+        Reserve one request from the bucket.
+
+        Args:
+            now: Current epoch time
+        """
+        if self.reset_at <= now:
+            # The window has reset; the next response tells us the new budget
+            self.remaining = None
+        if self.remaining is None:
+            self.probe_started_at = now
+        else:
+            self.remaining -= 1
+
+    def update(self, headers: Mapping[str, str], now: float) -> None:
+        """
+        Update the bucket from Discord's rate-limit response headers.
+
+        Args:
+            headers: Response headers
+            now: Current epoch time
+        """
+        self.probe_started_at = None
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+        self.remaining = int(remaining)
+        self.reset_at = now + float(reset_after)
+
+
+class RateLimiter:
+    """
+    Thread-safe tracker for Discord's per-route and global rate limits.
+
+    Each route has its own bucket, so a rate-limited channel only delays
+    requests for that channel. The known limits can be exported at the end
+    of a run and loaded by the next one, so it does not relearn them by
+    running into 429s. With a shared budget, every request also takes a token
+    from the global limit shared with other invocations.
+
+    Attributes:
+        shared_budget: Global request budget shared with other invocations, or None
+        priority: Priority of this limiter's requests in the shared budget
+    """
+
+    def __init__(
+        self,
+        shared_budget: Optional[SharedTokenBucket] = None,
+        priority: str = PRIORITY_HIGH,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            shared_budget: Global request budget shared with other invocations.
+                           If None, only this limiter's own view of the global
+                           limit applies.
+            priority: Priority of this limiter's requests in the shared budget
+        """
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._buckets_lock = threading.Lock()
+        self._global_reset_at = 0.0
+        self.shared_budget = shared_budget
+        self.priority = priority
+
+    def _get_bucket(self, route: str) -> RateLimitBucket:
+        """Get or create the bucket for a route."""
+        with self._buckets_lock:
+            bucket = self._buckets.get(route)
+            if bucket is None:
+                bucket = RateLimitBucket()
+                self._buckets[route] = bucket
+            return bucket
+
+    def try_acquire(self, route: str) -> float:
+        """
+        Reserve a request on the route if one may be sent now.
+
+        Args:
+            route: Route key from route_key()
+
+        Returns:
+            0.0 if a request was reserved, otherwise seconds to wait before retrying
+        """
+        bucket = self._get_bucket(route)
+        now = time.time()
+        with bucket.lock:
+            wait = max(bucket.wait_time(now), self._global_reset_at - now)
+            if wait > 0:
+                return wait
+            if self.shared_budget is None:
+                bucket.reserve(now)
+                return 0.0
+
+        # Taking a token may reach the store, so the bucket is not locked meanwhile
+        wait = self.shared_budget.try_acquire(self.priority)
+        if wait > 0:
+            return wait
+        now = time.time()
+        with bucket.lock:
+            # Another thread may have spent the bucket since; the token is
+            # then unused, which only leaves more room in the shared budget
+            wait = bucket.wait_time(now)
+            if wait <= 0:
+                bucket.reserve(now)
+            return wait
+
+    def acquire(self, route: str) -> float:
+        """
+        Block until a request on the route may be sent, then reserve it.
+
+        Args:
+            route: Route key from route_key()
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            wait = self.try_acquire(route)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def release(self, route: str) -> None:
+        """
+        Give up a reserved request that failed without a response.
+
+        Args:
+            route: Route key from route_key()
+        """
+        bucket = self._get_bucket(route)
+        with bucket.lock:
+            bucket.probe_started_at = None
+
+    def update(
+        self, route: str, headers: Mapping[str, str], status_code: int = 200
+    ) -> None:
+        """
+        Record rate-limit information from a response.
+
+        Args:
+            route: Route key from route_key()
+            headers: Response headers
+            status_code: Response status code
+        """
+        now = time.time()
+        bucket = self._get_bucket(route)
+        with bucket.lock:
+            bucket.update(headers, now)
+
+        if status_code == 429:
+            retry_after = float(headers.get("Retry-After") or 0)
+            is_global = (
+                headers.get("X-RateLimit-Global", "").lower() == "true"
+                or headers.get("X-RateLimit-Scope") == "global"
+            )
+            if is_global:
+                self._global_reset_at = max(self._global_reset_at, now + retry_after)
+            else:
+                with bucket.lock:
+                    bucket.remaining = 0
+                    bucket.reset_at = max(bucket.reset_at, now + retry_after)
+
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Export the limits that are still in effect.
+
+        Only buckets with a known budget and a window that has not reset yet
+        are included; the rest would be relearned from the next response anyway.
+
+        Returns:
+            JSON-serializable state with "global_reset_at" and "buckets", a
+            mapping of route key to {"remaining", "reset_at"}
+        """
+        now = time.time()
+        with self._buckets_lock:
+            buckets = list(self._buckets.items())
+
+        exported = {}
+        for route, bucket in buckets:
+            with bucket.lock:
+                if bucket.remaining is not None and bucket.reset_at > now:
+                    exported[route] = {
+                        "remaining": bucket.remaining,
+                        "reset_at": bucket.reset_at,
+                    }
+        return {"global_reset_at": self._global_reset_at, "buckets": exported}
+
+    def load_state(self, state: Mapping[str, Any]) -> int:
+        """
+        Seed the limiter with state exported by a previous run.
+
+        Windows that have reset since the export are skipped, and a bucket
+        this limiter already knows a later window for keeps its own state.
+
+        Args:
+            state: State returned by export_state()
+
+        Returns:
+            Number of buckets loaded
+        """
+        now = time.time()
+        self._global_reset_at = max(
+            self._global_reset_at, float(state.get("global_reset_at") or 0)
+        )
+
+        loaded = 0
+        for route, saved in (state.get("buckets") or {}).items():
+            reset_at = float(saved["reset_at"])
+            if reset_at <= now:
+                continue
+            bucket = self._get_bucket(route)
+            with bucket.lock:
+                if bucket.reset_at >= reset_at:
+                    continue
+                bucket.remaining = int(saved["remaining"])
+                bucket.reset_at = reset_at
+                loaded += 1
+        return loaded
+
+
+class AsyncRateLimiter:
+    """
+    Asyncio front end for a RateLimiter.
+
+    Waiting coroutines yield to the event loop instead of blocking it. The
+    bucket state lives in the wrapped RateLimiter, so sync and async callers
+    sharing one limiter see each other's requests.
+    """
+
+    def __init__(self, limiter: RateLimiter = None):
+        """
+        Initialize the async rate limiter.
+
+        Args:
+            limiter: Limiter holding the bucket state. If None, a new one is created.
+        """
+        self.limiter = limiter or RateLimiter()
+
+    async def acquire(self, route: str) -> float:
+        """
+        Wait until a request on the route may be sent, then reserve it.
+
+        Args:
+            route: Route key from route_key()
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            if self.limiter.shared_budget is None:
+                wait = self.limiter.try_acquire(route)
+            else:
+                # Reserving shared tokens is a store round trip
+                wait = await asyncio.to_thread(self.limiter.try_acquire, route)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update(
+        self, route: str, headers: Mapping[str, str], status_code: int = 200
+    ) -> None:
+        """
+        Record rate-limit information from a response.
+
+        Args:
+            route: Route key from route_key()
+            headers: Response headers
+            status_code: Response status code
+        """
+        self.limiter.update(route, headers, status_code)
+
+    def release(self, route: str) -> None:
+        """
+        Give up a reserved request that failed without a response.
+
+        Args:
+            route: Route key from route_key()
+        """
+        self.limiter.release(route)
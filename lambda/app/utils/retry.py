@@ -0,0 +1,192 @@
+"""
+Retry policy and circuit breaker for Discord API requests.
+
+RetryPolicy decides whether a failed request is worth retrying and how long to
+wait first: only rate limits, server errors and transport failures are
+retried, waits use decorrelated jitter, and no retry is attempted that would
+run past the run's deadline. CircuitBreaker stops sending requests to a route
+that keeps failing, so an outage fails fast instead of costing every caller a
+full set of retries.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+from utils.deadline import Deadline
+
+# Statuses that may succeed when retried; other 4xx errors never will
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable(status: Optional[int]) -> bool:
+    """
+    Classify a failed request.
+
+    Args:
+        status: HTTP status of the response, or None if no response was received
+
+    Returns:
+        True for rate limits, server errors and transport failures
+    """
+    return status is None or status in RETRYABLE_STATUSES
+
+
+def is_server_failure(status: Optional[int]) -> bool:
+    """
+    Check whether a failure counts against the route's circuit breaker.
+    Client errors and rate limits say nothing about the route's health.
+
+    Args:
+        status: HTTP status of the response, or None if no response was received
+
+    Returns:
+        True for server errors and transport failures
+    """
+    return status is None or status >= 500
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its route's circuit is open."""
+
+    def __init__(self, route: str):
+        super().__init__(f"Circuit open for {route} after repeated failures")
+        self.route = route
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Attributes:
+        max_attempts: Attempts per request, including the first
+        base_delay: Shortest wait between attempts in seconds
+        max_delay: Longest wait between attempts in seconds
+        classifier: Decides from the HTTP status (None for no response) whether
+                    a failure is retryable
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 16.0
+    classifier: Callable[[Optional[int]], bool] = is_retryable
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def backoff(self, previous_delay: Optional[float] = None) -> float:
+        """
+        Pick the next wait with decorrelated jitter: a random time between the
+        base delay and three times the previous wait, capped at max_delay.
+
+        Args:
+            previous_delay: Previous wait in seconds, or None before the first retry
+
+        Returns:
+            Seconds to wait
+        """
+        upper = max(self.base_delay, (previous_delay or self.base_delay) * 3)
+        return min(self.max_delay, self.rng.uniform(self.base_delay, upper))
+
+    def retry_delay(
+        self,
+        attempt: int,
+        status: Optional[int],
+        previous_delay: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            status: HTTP status of the response, or None if no response was received
+            previous_delay: Wait before the failed attempt, or None
+            deadline: Run deadline; no retry is made that would wait past it
+            retry_after: Wait requested by the server (Retry-After), if any
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt + 1 >= self.max_attempts or not self.classifier(status):
+            return None
+
+        delay = retry_after if retry_after is not None else self.backoff(previous_delay)
+
+        time_left = deadline.time_left() if deadline else None
+        if time_left is not None and delay >= time_left:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Per-route circuit breaker.
+
+    A route's circuit opens after failure_threshold consecutive server or
+    transport failures. While open, requests to the route are refused; once
+    reset_timeout has passed one trial request is let through, and its outcome
+    closes the circuit or keeps it open for another reset_timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = None,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a route's circuit
+            reset_timeout: Seconds an open circuit refuses requests before a trial
+            clock: Monotonic clock, replaceable for tests (default: time.monotonic)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock or time.monotonic
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, route: str) -> bool:
+        """
+        Check whether a request to the route may be sent.
+
+        Args:
+            route: Route key from route_key()
+
+        Returns:
+            True if the circuit is closed, or open long enough for a trial request
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(route)
+            if opened_at is None:
+                return True
+            now = self._clock()
+            if now - opened_at >= self.reset_timeout:
+                # Let one trial through and refuse the rest for another timeout
+                self._opened_at[route] = now
+                return True
+            return False
+
+    def is_open(self, route: str) -> bool:
+        """Check whether the route's circuit is open."""
+        with self._lock:
+            return route in self._opened_at
+
+    def record_success(self, route: str) -> None:
+        """Close the route's circuit after a successful request."""
+        with self._lock:
+            self._failures.pop(route, None)
+            self._opened_at.pop(route, None)
+
+    def record_failure(self, route: str) -> None:
+        """Count a server or transport failure, opening the circuit at the threshold."""
+        with self._lock:
+            failures = self._failures.get(route, 0) + 1
+            self._failures[route] = failures
+            if failures >= self.failure_threshold:
+                self._opened_at[route] = self._clock()
@@ -1,78 +1,170 @@
 """
-# scheduler.py --- IGNORE ---
-This module defines the JobScheduler class, which is responsible for managing scheduled jobs in the trading bot application.
-It initializes the job scheduler, adds jobs based on configuration, and provides methods to start and shutdown the scheduler.
+This module defines the JobScheduler class, which runs jobs at fixed intervals in a long-running process.
+It is used by the local runner to run the newsletter and event-notification jobs in one warm process
+instead of one Lambda invocation per schedule.
 """
 
-from datetime import datetime
-from apscheduler.schedulers.background import BackgroundScheduler
-from services.discord import DiscordService
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
 from config.logger import LoggerConfig
 
-from services.newsletter import NewsletterService
-from services.calendar import GoogleCalendarService
+
+@dataclass
+class Job:
+    """
+    A job run by the JobScheduler.
+
+    Attributes:
+        name: Job name used in logs
+        interval_seconds: Time between the starts of consecutive runs
+        func: Callable run with no arguments
+        next_run_at: Monotonic time of the next run (0 runs the job immediately)
+        running: Whether a run of the job is in progress
+    """
+
+    name: str
+    interval_seconds: float
+    func: Callable[[], object]
+    next_run_at: float = 0.0
+    running: bool = field(default=False, repr=False)
 
 
 class JobScheduler:
     """
-    JobScheduler is responsible for managing scheduled jobs in the trading bot application.
-    It initializes the job scheduler, adds jobs based on configuration, and provides methods to start and shutdown the scheduler.
+    JobScheduler runs jobs at fixed intervals until shut down.
+    Each run happens on its own thread, so a slow newsletter run does not delay
+    the per-minute event check. A job is skipped while its previous run is
+    still in progress.
 
     Attributes:
-        bg_scheduler (BackgroundScheduler): Background scheduler instance to manage jobs.
+        jobs (List[Job]): Jobs to run.
         logger (LoggerConfig): Logger instance for logging events and errors.
     """
 
-    def __init__(self):
-        self.bg_scheduler = BackgroundScheduler()
+    def __init__(self, jobs: List[Job] = None, clock: Callable[[], float] = None):
+        """
+        Initialize the JobScheduler.
+
+        Args:
+            jobs: Jobs to run. More can be added with add_job().
+            clock: Monotonic clock, replaceable for tests (default: time.monotonic)
+        """
+        self.jobs: List[Job] = list(jobs or [])
         self.logger = LoggerConfig(__name__).get_logger()
+        self._clock = clock or time.monotonic
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
 
-    def start(self):
+    def add_job(
+        self, name: str, interval_seconds: float, func: Callable[[], object]
+    ) -> Job:
         """
-        Start the job scheduler and add jobs to it.
-        This method initializes the scheduler and adds jobs based on the configuration.
+        Add a job that first runs immediately and then every interval_seconds.
+
+        Args:
+            name: Job name used in logs
+            interval_seconds: Time between the starts of consecutive runs
+            func: Callable run with no arguments
+
+        Returns:
+            Job: The added job
         """
-        # Add NewsletterService job to the scheduler
-        self.bg_scheduler.add_job(
-            NewsletterService().publish_latest_articles,
-            trigger="interval",
-            minutes=60,  # Run every hour
-            id="hourly_newsletter_job",
-            replace_existing=True,
-            next_run_time=datetime.now(),
-        )
-        self.logger.info("Adding job to publish latest articles every hour.")
-
-        # Check events with Discord
-        self.bg_scheduler.add_job(
-            DiscordService().list_scheduled_events_and_notify,
-            trigger="interval",
-            minutes=1,  # Run every minute
-            id="minute_discord_events_job",
-            replace_existing=True,
-            next_run_time=datetime.now(),
-        )
-        self.logger.info("Adding job to check Discord events every minute.")
-
-        # Sync Discord events with Google Calendar
-        self.bg_scheduler.add_job(
-            GoogleCalendarService().sync_discord_events,
-            trigger="interval",
-            minutes=15,  # Run every 15 minutes
-            id="fifteen_minute_sync_discord_events_job",
-            replace_existing=True,
-            next_run_time=datetime.now(),
-        )
-        self.logger.info(
-            "Adding job to sync Discord events with Google Calendar every 15 minutes."
-        )
-
-        # Start the background scheduler
-        self.bg_scheduler.start()
-        self.logger.info("Job scheduler started and jobs added.")
-
-    def shutdown(self):
+        job = Job(name=name, interval_seconds=interval_seconds, func=func)
+        self.jobs.append(job)
+        self.logger.info("Added job %s every %s seconds", name, interval_seconds)
+        return job
+
+    def run_pending(self) -> List[Job]:
         """
-        Shut down the job scheduler and all running jobs.
+        Start every job that is due and not already running.
+
+        Returns:
+            List[Job]: Jobs started by this call
         """
-        self.bg_scheduler.shutdown()
+        now = self._clock()
+        started = []
+
+        with self._lock:
+            for job in self.jobs:
+                if now < job.next_run_at:
+                    continue
+                # Schedule from the planned time so runs do not drift, unless
+                # the job fell a whole interval behind
+                job.next_run_at += job.interval_seconds
+                if job.next_run_at <= now:
+                    job.next_run_at = now + job.interval_seconds
+                if job.running:
+                    self.logger.warning(
+                        "Skipping job %s - previous run still in progress", job.name
+                    )
+                    continue
+                job.running = True
+                started.append(job)
+
+        for job in started:
+            thread = threading.Thread(
+                target=self._run_job, args=(job,), name=f"job-{job.name}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        return started
+
+    def _run_job(self, job: Job) -> None:
+        """Run one job, logging failures instead of stopping the scheduler."""
+        start = time.monotonic()
+        try:
+            self.logger.info("Running job %s", job.name)
+            job.func()
+            self.logger.info(
+                "Job %s finished in %.1f seconds", job.name, time.monotonic() - start
+            )
+        except Exception as e:
+            self.logger.error("Job %s failed: %s", job.name, e, exc_info=True)
+        finally:
+            with self._lock:
+                job.running = False
+
+    def seconds_until_next_run(self) -> Optional[float]:
+        """
+        Get the time until the next job is due.
+
+        Returns:
+            Seconds until the next run, or None if there are no jobs
+        """
+        if not self.jobs:
+            return None
+        return max(0.0, min(job.next_run_at for job in self.jobs) - self._clock())
+
+    def start(self) -> None:
+        """
+        Run jobs until shutdown() is called.
+        Blocks the calling thread.
+        """
+        self.logger.info("Job scheduler started with %d job(s)", len(self.jobs))
+        while not self._stop.is_set():
+            self.run_pending()
+            wait = self.seconds_until_next_run()
+            # Wake at least once a second so shutdown is prompt
+            self._stop.wait(1.0 if wait is None else min(wait, 1.0))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop scheduling new runs.
+
+        Args:
+            wait: Whether to wait for runs in progress to finish
+        """
+        self._stop.set()
+        if wait:
+            self.join()
+        self.logger.info("Job scheduler shut down")
+
+    def join(self) -> None:
+        """Wait for runs in progress to finish."""
+        for thread in list(self._threads):
+            thread.join()
@@ -0,0 +1,118 @@
+"""
+Lambda SnapStart runtime hooks.
+
+With SnapStart, Lambda initializes a published version once, snapshots the
+memory of the initialized environment and resumes new execution environments
+from that snapshot. Anything created during INIT is shared by every restored
+environment: open connections, cached secrets and random number state.
+
+Hooks registered here run before the snapshot is taken and after each restore.
+Under the Lambda runtime they are also registered with snapshot_restore_py;
+elsewhere that module is missing, and run_before_snapshot() and
+run_after_restore() run the hooks so the lifecycle can be exercised locally.
+"""
+
+import importlib
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+try:
+    import snapshot_restore_py
+except ImportError:
+    # Only provided by the Lambda Python runtime
+    snapshot_restore_py = None
+
+logger = logging.getLogger(__name__)
+
+_before_snapshot_hooks: List[Callable[[], None]] = []
+_after_restore_hooks: List[Callable[[], None]] = []
+
+
+def is_snap_start() -> bool:
+    """
+    Check whether this environment is being initialized for a SnapStart snapshot.
+
+    Returns:
+        True if AWS_LAMBDA_INITIALIZATION_TYPE is "snap-start"
+    """
+    return os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "snap-start"
+
+
+def before_snapshot(func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a function to run before the snapshot is taken.
+
+    Args:
+        func: Hook taking no arguments
+
+    Returns:
+        The function, so this can be used as a decorator
+    """
+    _before_snapshot_hooks.append(func)
+    if snapshot_restore_py is not None:
+        snapshot_restore_py.register_before_snapshot(func)
+    return func
+
+
+def after_restore(func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a function to run after an environment is restored from a snapshot.
+
+    Args:
+        func: Hook taking no arguments
+
+    Returns:
+        The function, so this can be used as a decorator
+    """
+    _after_restore_hooks.append(func)
+    if snapshot_restore_py is not None:
+        snapshot_restore_py.register_after_restore(func)
+    return func
+
+
+def run_before_snapshot() -> None:
+    """Run the before-snapshot hooks in registration order, as the runtime would."""
+    for hook in _before_snapshot_hooks:
+        hook()
+
+
+def run_after_restore() -> None:
+    """Run the after-restore hooks in registration order, as the runtime would."""
+    for hook in _after_restore_hooks:
+        hook()
+
+
+def import_modules(root: Path, exclude: Iterable[str] = ()) -> List[str]:
+    """
+    Import the modules under a source directory so the snapshot holds them.
+
+    Modules that fail to import are skipped with a warning, so a broken or
+    optional module never aborts snapshot priming.
+
+    Args:
+        root: Directory on sys.path whose modules are imported
+        exclude: Module names not to import, with their submodules, such as
+            the Discord gateway client used only by the local runner
+
+    Returns:
+        Names of the imported modules
+    """
+    excluded = tuple(exclude)
+    imported = []
+    for path in sorted(root.rglob("*.py")):
+        parts = path.relative_to(root).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if not parts:
+            continue
+        name = ".".join(parts)
+        if any(name == module or name.startswith(module + ".") for module in excluded):
+            continue
+        try:
+            importlib.import_module(name)
+            imported.append(name)
+        except Exception as e:
+            logger.warning("Not importing %s before snapshot: %s", name, e)
+    return imported
@@ -0,0 +1,166 @@
+"""
+Request budget shared by every invocation.
+
+Discord allows a bot 50 requests per second across all routes, however many
+Lambda invocations are sending at once. SharedTokenBucket hands out that
+budget from a counter per one-second window kept in a shared store (the
+DynamoDB table, or LocalTokenStore for tests and local runs), so concurrent
+handlers together stay under the limit instead of discovering it through 429s.
+
+Tokens are reserved in small batches to keep store round trips well below the
+request rate. Each priority may take the window's counter up to its share of
+the rate, so lower priorities stop early and leave headroom for higher ones:
+reminders keep being sent while the newsletter is held back.
+"""
+
+import threading
+import time
+from typing import Dict, Mapping
+
+PRIORITY_HIGH = "high"
+PRIORITY_LOW = "low"
+
+# Fraction of each window's budget a priority may take the counter up to
+DEFAULT_PRIORITY_SHARES = {PRIORITY_HIGH: 1.0, PRIORITY_LOW: 0.6}
+
+# Below Discord's 50 requests per second, leaving room for clock skew between
+# containers and for requests sent outside the budget
+DEFAULT_RATE = 45
+
+# Tokens reserved per store round trip
+DEFAULT_BATCH_SIZE = 5
+
+DEFAULT_BUDGET_NAME = "discord_global"
+
+
+class LocalTokenStore:
+    """
+    In-process stand-in for the DynamoDB token counters.
+
+    Several SharedTokenBucket instances sharing one store behave like
+    invocations sharing the table, so the budget can be exercised without AWS.
+
+    Attributes:
+        reservations: Number of reserve_tokens() calls
+    """
+
+    def __init__(self):
+        self.reservations = 0
+        self._counters: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve_tokens(self, name: str, window: int, count: int, ceiling: int) -> bool:
+        """
+        Reserve tokens from a window's counter if it stays within the ceiling.
+
+        Args:
+            name: Name of the shared budget
+            window: Window start as a whole Unix timestamp
+            count: Number of tokens to reserve
+            ceiling: Tokens the caller may take the counter up to in this window
+
+        Returns:
+            True if the tokens were reserved, False if the window's budget is spent
+        """
+        with self._lock:
+            self.reservations += 1
+            # Earlier windows are never reserved from again
+            for key in [key for key in self._counters if key[1] < window]:
+                del self._counters[key]
+            used = self._counters.get((name, window), 0)
+            if used + count > ceiling:
+                return False
+            self._counters[(name, window)] = used + count
+            return True
+
+
+class SharedTokenBucket:
+    """
+    Thread-safe client of a request budget shared through a token store.
+
+    Attributes:
+        store: Store with reserve_tokens(), e.g. DynamoDBClient or LocalTokenStore
+        name: Name of the budget in the store
+        rate: Requests per second shared by every client of the budget
+        batch_size: Tokens reserved per store round trip
+        shares: Fraction of the rate each priority may use
+    """
+
+    def __init__(
+        self,
+        store,
+        name: str = DEFAULT_BUDGET_NAME,
+        rate: int = DEFAULT_RATE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        shares: Mapping[str, float] = None,
+    ):
+        """
+        Initialize the shared token bucket.
+
+        Args:
+            store: Store with reserve_tokens(), e.g. DynamoDBClient or LocalTokenStore
+            name: Name of the budget in the store
+            rate: Requests per second shared by every client of the budget
+            batch_size: Tokens reserved per store round trip
+            shares: Fraction of the rate each priority may use
+                    (default: DEFAULT_PRIORITY_SHARES)
+        """
+        self.store = store
+        self.name = name
+        self.rate = rate
+        self.batch_size = max(1, batch_size)
+        self.shares = dict(shares or DEFAULT_PRIORITY_SHARES)
+        self._window = None
+        self._tokens: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, priority: str = PRIORITY_HIGH) -> float:
+        """
+        Take one token for a request if the budget allows it now.
+
+        Tokens left over from a reservation are used first; otherwise a batch,
+        or failing that a single token, is reserved from the store.
+
+        Args:
+            priority: Priority of the request, a key of shares
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until the next window
+        """
+        with self._lock:
+            now = time.time()
+            window = int(now)
+            if window != self._window:
+                # Tokens are only valid within the window they were reserved in
+                self._window = window
+                self._tokens = {}
+
+            if self._tokens.get(priority, 0) > 0:
+                self._tokens[priority] -= 1
+                return 0.0
+
+            ceiling = max(1, int(self.rate * self.shares[priority]))
+            for count in sorted({self.batch_size, 1}, reverse=True):
+                if self.store.reserve_tokens(self.name, window, count, ceiling):
+                    self._tokens[priority] = count - 1
+                    return 0.0
+            return window + 1 - now
+
+    def acquire(self, priority: str = PRIORITY_HIGH) -> float:
+        """
+        Block until a token for a request is taken.
+
+        Args:
+            priority: Priority of the request, a key of shares
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            wait = self.try_acquire(priority)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
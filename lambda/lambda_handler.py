@@ -11,7 +11,11 @@ import os
 import sys
 import logging
 import json
+import random
+import threading
+import time
 import traceback
+from pathlib import Path
 from typing import Dict, Any
 
 # Add app directory to Python path for imports
@@ -21,55 +25,79 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
 # Import AWS clients
 from clients.parameter_store import ParameterStoreClient
 from clients.dynamodb import DynamoDBClient
+from clients.lambda_invoker import LambdaInvoker
 
 # Import service handlers
 from services.newsletter import NewsletterService
-from services.discord import DiscordService
+from services.discord import DiscordService, DEFAULT_SHARD_SIZE
+from services.event_index import EventIndex
+from models import FeedsConfig
+from utils.deadline import Deadline, DEFAULT_MARGIN_MS
+from utils.rate_limit import route_key
+from utils.dedup import minhash_signature, strip_tracking_params, title_shingles
+from utils.snapstart import (
+    after_restore,
+    before_snapshot,
+    import_modules,
+    is_snap_start,
+)
+from config.logger import Truncated, JsonFormatter, configure_logging, flush_logging
+import feedparser
+
+# Buffered logs are flushed this long before the Lambda timeout
+LOG_FLUSH_MARGIN_MS = 1000
+
+# Longest time spent warming up at import, in milliseconds
+DEFAULT_WARMUP_BUDGET_MS = 3000
+
+# Secrets read by every handler, prefetched during warmup
+WARMUP_PARAMETERS = ["discord-token", "guild-id"]
+
+# Application modules used only by the local runner and the Discord gateway
+# listener, which are not imported into SnapStart snapshots
+SNAPSHOT_EXCLUDED_MODULES = ["clients.discord", "utils.scheduler", "utils.secrets"]
+
+# Feed parsed before a SnapStart snapshot so the parser's first-use work is in it
+PRIMING_FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Priming</title>
+<item><title>Priming article</title><link>https://example.com/a?utm_source=rss</link>
+<description>&lt;p&gt;Summary&lt;/p&gt;</description>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
 
 
 # Configure structured logging for CloudWatch
-def setup_logging(log_level: str = "INFO") -> logging.Logger:
+def setup_logging(log_level: str = "INFO", logger_levels: str = None) -> logging.Logger:
     """
     Configure structured logging for CloudWatch Logs.
 
     Args:
         log_level: Logging level (INFO, DEBUG, ERROR)
+        logger_levels: Per-logger levels, e.g. "services.discord=DEBUG,botocore=WARNING"
 
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger()
-
-    # Set log level from environment variable or default to INFO
-    level = getattr(logging, log_level.upper(), logging.INFO)
-    logger.setLevel(level)
-
-    # Remove existing handlers to avoid duplicate logs
-    if logger.handlers:
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
-
-    # Create console handler with structured format
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-
-    # Use JSON-like format for structured logging
-    formatter = logging.Formatter(
-        '{"time": "%(asctime)s", "level": "%(levelname)s", "name": "%(name)s", '
-        '"message": "%(message)s"}'
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-    return logger
+    return configure_logging(log_level, logger_levels)
 
 
 # Initialize logger
-logger = setup_logging(os.environ.get("LOG_LEVEL", "INFO"))
+logger = setup_logging(
+    os.environ.get("LOG_LEVEL", "INFO"), os.environ.get("LOG_LEVELS")
+)
 
 # Global clients (cached across Lambda invocations in the same execution context)
 parameter_store_client = None
 dynamodb_client = None
+lambda_invoker = None
+event_index = None
+
+# Global services, keeping HTTP sessions and rate-limit state warm across invocations
+newsletter_service = None
+discord_service = None
+
+# Feed configuration, parsed once per execution context
+feeds_config = None
 
 
 def initialize_clients() -> tuple:
@@ -88,27 +116,229 @@ def initialize_clients() -> tuple:
     if parameter_store_client is None:
         prefix = os.environ.get("PARAMETER_STORE_PREFIX", "/the-herald/prod/")
 
-        logger.info(f"Initializing Parameter Store client with prefix: {prefix}")
+        logger.info("Initializing Parameter Store client with prefix: %s", prefix)
         parameter_store_client = ParameterStoreClient(prefix=prefix)
         logger.info("Parameter Store client initialized successfully")
 
     # Initialize DynamoDB client if not already cached
     if dynamodb_client is None:
         table_name = os.environ.get("DYNAMODB_TABLE_NAME", "the-herald-reminders")
+        # Unset keeps reminder records in the main table (flat layout)
+        reminders_table_name = os.environ.get("REMINDERS_TABLE_NAME") or None
+        legacy_reads = (
+            os.environ.get("REMINDERS_LEGACY_READS", "true").lower() != "false"
+        )
 
-        logger.info(f"Initializing DynamoDB client for table: {table_name}")
-        dynamodb_client = DynamoDBClient(table_name=table_name)
+        logger.info("Initializing DynamoDB client for table: %s", table_name)
+        dynamodb_client = DynamoDBClient(
+            table_name=table_name,
+            reminders_table_name=reminders_table_name,
+            legacy_reads=legacy_reads,
+        )
         logger.info("DynamoDB client initialized successfully")
 
     return parameter_store_client, dynamodb_client
 
 
-def handle_newsletter(ps_client: ParameterStoreClient) -> Dict[str, Any]:
+def get_lambda_invoker() -> LambdaInvoker:
+    """
+    Get the cached invoker used to fan reminder shards out to new invocations.
+
+    Returns:
+        LambdaInvoker for this function, or None when not running in Lambda
+    """
+    global lambda_invoker
+
+    if lambda_invoker is None and os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        logger.info("Initializing Lambda invoker for reminder shards")
+        lambda_invoker = LambdaInvoker()
+
+    return lambda_invoker
+
+
+def get_feeds_config() -> FeedsConfig:
+    """
+    Get the cached feed configuration, loading app/static/config.yaml once.
+
+    Returns:
+        FeedsConfig shipped with the deployment package
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        yaml.YAMLError: If the configuration file is malformed
+    """
+    global feeds_config
+
+    if feeds_config is None:
+        feeds_config = FeedsConfig.from_yaml()
+        logger.info(
+            "Loaded feed configuration with %s feed(s)", len(feeds_config.feeds)
+        )
+
+    return feeds_config
+
+
+def get_newsletter_service(
+    ps_client: ParameterStoreClient, db_client: DynamoDBClient = None
+) -> NewsletterService:
+    """
+    Get the cached newsletter service, creating it for the given clients.
+
+    Args:
+        ps_client: Parameter Store client for retrieving secrets
+        db_client: DynamoDB client for checkpoint storage
+
+    Returns:
+        NewsletterService built with the given clients
+    """
+    global newsletter_service
+
+    service = newsletter_service
+    if (
+        service is None
+        or service.parameter_store_client is not ps_client
+        or service.dynamodb_client is not db_client
+    ):
+        service = NewsletterService(
+            parameter_store_client=ps_client,
+            dynamodb_client=db_client,
+            feeds_config=get_feeds_config(),
+        )
+        newsletter_service = service
+
+    return service
+
+
+def get_discord_service(
+    ps_client: ParameterStoreClient, db_client: DynamoDBClient
+) -> DiscordService:
+    """
+    Get the cached Discord service, creating it for the given clients.
+
+    Args:
+        ps_client: Parameter Store client for retrieving secrets
+        db_client: DynamoDB client for reminder tracking
+
+    Returns:
+        DiscordService built with the given clients
+    """
+    global discord_service
+
+    index = get_event_index(db_client)
+    service = discord_service
+    if (
+        service is None
+        or service.parameter_store_client is not ps_client
+        or service.dynamodb_client is not db_client
+        or service.event_index is not index
+    ):
+        service = DiscordService(
+            parameter_store_client=ps_client,
+            dynamodb_client=db_client,
+            invoker=get_lambda_invoker(),
+            shard_size=get_shard_size(),
+            event_index=index,
+        )
+        discord_service = service
+
+    return service
+
+
+def get_event_index(db_client: DynamoDBClient) -> EventIndex:
+    """
+    Get the cached index of event subscribers written by the gateway listener.
+
+    Args:
+        db_client: DynamoDB client the index is read from and written to
+
+    Returns:
+        EventIndex for the given client, or None unless EVENT_INDEX_ENABLED is
+        "true" or the local runner installed an index
+    """
+    global event_index
+
+    if event_index is not None and event_index.dynamodb_client is db_client:
+        return event_index
+
+    if os.environ.get("EVENT_INDEX_ENABLED", "").lower() == "true":
+        logger.info("Reading event subscribers from the event index")
+        event_index = EventIndex(dynamodb_client=db_client)
+        return event_index
+
+    return None
+
+
+def get_shard_size() -> int:
+    """
+    Get the maximum number of subscribers handled by one reminder shard.
+
+    Returns:
+        Shard size from REMINDER_SHARD_SIZE, or the default
+    """
+    return int(os.environ.get("REMINDER_SHARD_SIZE", DEFAULT_SHARD_SIZE))
+
+
+def newsletter_dynamodb_client(db_client: DynamoDBClient) -> DynamoDBClient:
+    """
+    Get the DynamoDB client the newsletter may keep its state in.
+
+    The reminder handlers fall back to a default table name, but newsletter-only
+    deployments have no table at all, so newsletter checkpoints and shared
+    caches are only used when DYNAMODB_TABLE_NAME is set.
+
+    Args:
+        db_client: DynamoDB client built by initialize_clients()
+
+    Returns:
+        The given client, or None when no table is configured
+    """
+    if os.environ.get("DYNAMODB_TABLE_NAME"):
+        return db_client
+    return None
+
+
+def save_checkpoint(
+    db_client: DynamoDBClient, handler_type: str, pending: list, unsent: list
+) -> None:
+    """
+    Persist or clear a handler's checkpoint after a run.
+
+    Args:
+        db_client: DynamoDB client for checkpoint storage (may be None)
+        handler_type: Handler that owns the checkpoint
+        pending: Work items the run resumed from
+        unsent: Work items the run could not finish before its deadline
+    """
+    if db_client is None:
+        if unsent:
+            logger.warning(
+                "No DynamoDB client - dropping %s unsent %s item(s)",
+                len(unsent),
+                handler_type,
+            )
+        return
+
+    if unsent:
+        db_client.save_checkpoint(handler_type, unsent)
+    elif pending:
+        db_client.clear_checkpoint(handler_type)
+
+
+def handle_newsletter(
+    ps_client: ParameterStoreClient,
+    db_client: DynamoDBClient = None,
+    deadline: Deadline = None,
+) -> Dict[str, Any]:
     """
     Handle newsletter publishing operations.
 
+    Articles left unsent when the deadline is reached are checkpointed to
+    DynamoDB and published first on the next invocation.
+
     Args:
         ps_client: Parameter Store client for retrieving secrets
+        db_client: DynamoDB client for checkpoint storage
+        deadline: Run deadline for the invocation
 
     Returns:
         Response dictionary with status and message
@@ -116,11 +346,19 @@ def handle_newsletter(ps_client: ParameterStoreClient) -> Dict[str, Any]:
     logger.info("Starting newsletter handler")
 
     try:
-        # Initialize newsletter service (which internally uses DiscordService)
-        newsletter_service = NewsletterService()
-
-        # Publish latest articles
-        newsletter_service.publish_latest_articles()
+        # Reuse the newsletter service (which internally uses DiscordService)
+        newsletter_service = get_newsletter_service(ps_client, db_client)
+
+        # Publish latest articles, resuming any checkpointed work
+        pending = db_client.load_checkpoint("newsletter") if db_client else []
+        newsletter_service.discord_service.load_rate_limit_state()
+        try:
+            unsent = newsletter_service.publish_latest_articles(
+                deadline=deadline, pending_articles=pending
+            )
+        finally:
+            newsletter_service.discord_service.save_rate_limit_state()
+        save_checkpoint(db_client, "newsletter", pending, unsent)
 
         logger.info("Newsletter handler completed successfully")
         return {
@@ -129,25 +367,32 @@ def handle_newsletter(ps_client: ParameterStoreClient) -> Dict[str, Any]:
                 {
                     "message": "Newsletter published successfully",
                     "handler": "newsletter",
+                    "checkpointed": len(unsent),
                 }
             ),
         }
 
     except Exception as e:
-        logger.error(f"Newsletter handler failed: {str(e)}")
+        logger.error("Newsletter handler failed: %s", e)
         logger.error(traceback.format_exc())
         raise
 
 
 def handle_event_notification(
-    ps_client: ParameterStoreClient, db_client: DynamoDBClient
+    ps_client: ParameterStoreClient,
+    db_client: DynamoDBClient,
+    deadline: Deadline = None,
 ) -> Dict[str, Any]:
     """
     Handle Discord event notification operations.
 
+    Reminders left unsent when the deadline is reached are checkpointed to
+    DynamoDB and sent first on the next invocation.
+
     Args:
         ps_client: Parameter Store client for retrieving secrets
         db_client: DynamoDB client for reminder tracking
+        deadline: Run deadline for the invocation
 
     Returns:
         Response dictionary with status and message
@@ -155,13 +400,19 @@ def handle_event_notification(
     logger.info("Starting event notification handler")
 
     try:
-        # Initialize Discord service with clients
-        discord_service = DiscordService(
-            parameter_store_client=ps_client, dynamodb_client=db_client
-        )
-
-        # List scheduled events and send notifications
-        discord_service.list_scheduled_events_and_notify()
+        # Reuse the Discord service for these clients
+        discord_service = get_discord_service(ps_client, db_client)
+
+        # List scheduled events and send notifications, resuming any checkpointed work
+        pending = db_client.load_checkpoint("event_notification") if db_client else []
+        discord_service.load_rate_limit_state()
+        try:
+            unsent = discord_service.list_scheduled_events_and_notify(
+                deadline=deadline, pending_reminders=pending
+            )
+        finally:
+            discord_service.save_rate_limit_state()
+        save_checkpoint(db_client, "event_notification", pending, unsent)
 
         logger.info("Event notification handler completed successfully")
         return {
@@ -170,12 +421,99 @@ def handle_event_notification(
                 {
                     "message": "Event notifications processed successfully",
                     "handler": "event_notification",
+                    "checkpointed": len(unsent),
+                }
+            ),
+        }
+
+    except Exception as e:
+        logger.error("Event notification handler failed: %s", e)
+        logger.error(traceback.format_exc())
+        raise
+
+
+def handle_reminder_shard(
+    ps_client: ParameterStoreClient,
+    db_client: DynamoDBClient,
+    event: Dict[str, Any],
+    deadline: Deadline = None,
+) -> Dict[str, Any]:
+    """
+    Handle one shard of an event's reminders, fanned out by the coordinator.
+
+    If the deadline is reached, the remaining users are handed to a new shard
+    invocation so no reminders are dropped.
+
+    Args:
+        ps_client: Parameter Store client for retrieving secrets
+        db_client: DynamoDB client for reminder tracking
+        event: Shard payload with event_id, event_name and user_ids
+        deadline: Run deadline for the invocation
+
+    Returns:
+        Response dictionary with status and message
+    """
+    event_id = event.get("event_id")
+    user_ids = event.get("user_ids")
+
+    if not event_id or not isinstance(user_ids, list):
+        error_msg = "Reminder shard requires 'event_id' and a 'user_ids' list"
+        logger.error(error_msg)
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"error": error_msg, "handler": "reminder_shard"}),
+        }
+
+    logger.info(
+        "Starting reminder shard for event %s (%s users)", event_id, len(user_ids)
+    )
+
+    try:
+        discord_service = get_discord_service(ps_client, db_client)
+
+        event_name = event.get("event_name", "An event")
+        discord_service.load_rate_limit_state()
+        try:
+            unsent = discord_service.notify_event_shard(
+                event_id, event_name, user_ids, deadline=deadline
+            )
+        finally:
+            discord_service.save_rate_limit_state()
+
+        if unsent:
+            invoker = get_lambda_invoker()
+            payload = {
+                "handler_type": "reminder_shard",
+                "event_id": event_id,
+                "event_name": event_name,
+                "user_ids": [item["user_id"] for item in unsent],
+            }
+            if invoker and invoker.invoke_async(payload):
+                logger.info(
+                    "Handed %s unsent reminder(s) to a new shard invocation",
+                    len(unsent),
+                )
+            else:
+                logger.error(
+                    "Could not hand off %s unsent reminder(s) for event %s",
+                    len(unsent),
+                    event_id,
+                )
+
+        logger.info("Reminder shard completed successfully")
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "message": "Reminder shard processed successfully",
+                    "handler": "reminder_shard",
+                    "handed_off": len(unsent),
                 }
             ),
         }
 
     except Exception as e:
-        logger.error(f"Event notification handler failed: {str(e)}")
+        logger.error("Reminder shard failed: %s", e)
         logger.error(traceback.format_exc())
         raise
 
@@ -199,14 +537,34 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "handler_type": "newsletter" | "event_notification",
             "source": "eventbridge.schedule"
         }
+
+    Reminder shard format (sent by the event notification handler):
+        {
+            "handler_type": "reminder_shard",
+            "event_id": "<event id>",
+            "event_name": "<event name>",
+            "user_ids": ["<user id>", ...]
+        }
     """
     # Log invocation details
-    logger.info(f"Lambda function invoked with request ID: {context.aws_request_id}")
-    logger.info(f"Event payload: {json.dumps(event)}")
-    logger.info(f"Memory limit: {context.memory_limit_in_mb} MB")
+    logger.info("Lambda function invoked with request ID: %s", context.aws_request_id)
+    logger.info("Event payload: %s", Truncated(event))
+    logger.info("Memory limit: %s MB", context.memory_limit_in_mb)
 
     start_time = context.get_remaining_time_in_millis()
 
+    # Stop work early enough to checkpoint what is left before the timeout
+    deadline = Deadline(
+        context, int(os.environ.get("DEADLINE_MARGIN_MS", DEFAULT_MARGIN_MS))
+    )
+
+    # Write buffered logs even if the invocation runs into its timeout
+    flush_timer = threading.Timer(
+        max(0, start_time - LOG_FLUSH_MARGIN_MS) / 1000, flush_logging
+    )
+    flush_timer.daemon = True
+    flush_timer.start()
+
     try:
         # Initialize AWS clients (cached across invocations)
         ps_client, db_client = initialize_clients()
@@ -222,14 +580,19 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "body": json.dumps({"error": error_msg, "event": event}),
             }
 
-        logger.info(f"Routing to handler: {handler_type}")
+        logger.info("Routing to handler: %s", handler_type)
 
         # Route to appropriate handler
         if handler_type == "newsletter":
-            response = handle_newsletter(ps_client)
+            response = handle_newsletter(
+                ps_client, newsletter_dynamodb_client(db_client), deadline
+            )
 
         elif handler_type == "event_notification":
-            response = handle_event_notification(ps_client, db_client)
+            response = handle_event_notification(ps_client, db_client, deadline)
+
+        elif handler_type == "reminder_shard":
+            response = handle_reminder_shard(ps_client, db_client, event, deadline)
 
         else:
             error_msg = f"Unknown handler_type: {handler_type}"
@@ -242,16 +605,16 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Log execution metrics
         end_time = context.get_remaining_time_in_millis()
         execution_time = start_time - end_time
-        logger.info(f"Execution completed in {execution_time} ms")
-        logger.info(f"Response: {json.dumps(response)}")
+        logger.info("Execution completed in %s ms", execution_time)
+        logger.info("Response: %s", Truncated(response))
 
         return response
 
     except Exception as e:
         # Log critical error with full context
-        logger.error(f"Lambda execution failed: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Lambda execution failed: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Traceback: %s", traceback.format_exc())
 
         # Return error response to trigger CloudWatch alarms
         return {
@@ -265,3 +628,188 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 }
             ),
         }
+
+    finally:
+        flush_timer.cancel()
+        flush_logging()
+
+
+def warmup_enabled() -> bool:
+    """Check whether WARMUP_ENABLED allows warming up (default: true)."""
+    return os.environ.get("WARMUP_ENABLED", "true").lower() == "true"
+
+
+def warmup_budget_ms() -> int:
+    """Get the warmup budget from WARMUP_BUDGET_MS, or the default."""
+    return int(os.environ.get("WARMUP_BUDGET_MS", DEFAULT_WARMUP_BUDGET_MS))
+
+
+def warm_up(budget_ms: int = DEFAULT_WARMUP_BUDGET_MS) -> list:
+    """
+    Prepare what every invocation needs while the execution environment
+    initializes: AWS clients, secrets, the feed configuration, the cached
+    services and their HTTP sessions, and connections to the AWS endpoints and
+    Discord. Work done here is taken out of the first invocation.
+
+    Steps run in order until the budget is spent; the remaining steps are left
+    to the first invocation, which creates anything missing as before. The
+    budget is checked between steps, and Discord connections wait at most for
+    the time left. Each step needs the ones before it, so a failed step is
+    logged and ends the warmup; it never fails initialization.
+
+    Args:
+        budget_ms: Longest time to spend warming up, in milliseconds
+
+    Returns:
+        Names of the steps that completed
+    """
+    started = time.monotonic()
+
+    def discord_connections(timeout: float) -> None:
+        discord_service.open_connection(timeout)
+        newsletter_service.discord_service.open_connection(timeout)
+
+    steps = [
+        ("clients", lambda timeout: initialize_clients()),
+        (
+            "secrets",
+            lambda timeout: parameter_store_client.prefetch_parameters(
+                WARMUP_PARAMETERS
+            ),
+        ),
+        ("dynamodb", lambda timeout: dynamodb_client.open_connection()),
+        ("feeds config", lambda timeout: get_feeds_config()),
+        (
+            "services",
+            lambda timeout: (
+                get_discord_service(parameter_store_client, dynamodb_client),
+                get_newsletter_service(
+                    parameter_store_client, newsletter_dynamodb_client(dynamodb_client)
+                ),
+            ),
+        ),
+        ("discord", discord_connections),
+    ]
+
+    completed = []
+    for name, step in steps:
+        time_left = budget_ms / 1000 - (time.monotonic() - started)
+        if time_left <= 0:
+            logger.warning(
+                "Warmup budget of %s ms spent - leaving %s to the first invocation",
+                budget_ms,
+                name,
+            )
+            break
+        try:
+            step(time_left)
+            completed.append(name)
+        except Exception as e:
+            logger.warning("Warmup step %s failed: %s", name, e)
+            break
+
+    logger.info(
+        "Warmed up %s in %.0f ms",
+        ", ".join(completed) or "nothing",
+        (time.monotonic() - started) * 1000,
+    )
+    return completed
+
+
+def prime_code_paths() -> None:
+    """
+    Run the handlers' pure code paths once, without reaching the network, so
+    lazy imports, compiled regexes and parser tables are in place.
+    """
+    parsed = feedparser.parse(PRIMING_FEED)
+    for entry in parsed.entries:
+        article = {
+            "title": entry.title,
+            "link": strip_tracking_params(entry.link),
+            "summary": entry.summary,
+            "feed_name": parsed.feed.title,
+        }
+        NewsletterService._build_embed(article)
+        minhash_signature(title_shingles(article["title"]))
+    route_key("POST", "https://discord.com/api/v10/channels/1/messages")
+    record = logging.LogRecord(
+        __name__, logging.INFO, __file__, 0, "Primed: %s", (Truncated(parsed),), None
+    )
+    JsonFormatter().format(record)
+
+
+@before_snapshot
+def prime_snapshot() -> None:
+    """
+    Prepare the environment for a SnapStart snapshot.
+
+    Imports the application modules the handler uses, builds the AWS clients,
+    loads the feed configuration and exercises the handlers' code paths.
+    Nothing that must not be shared between restored environments is left behind: secrets are
+    dropped from the cache and the services, which hold the Discord token and
+    HTTP sessions, are discarded.
+    """
+    global discord_service, newsletter_service
+
+    started = time.monotonic()
+    imported = import_modules(
+        Path(__file__).parent / "app", exclude=SNAPSHOT_EXCLUDED_MODULES
+    )
+    initialize_clients()
+    get_feeds_config()
+    prime_code_paths()
+
+    parameter_store_client.clear_cache()
+    discord_service = None
+    newsletter_service = None
+
+    logger.info(
+        "Primed %s module(s) for the snapshot in %.0f ms",
+        len(imported),
+        (time.monotonic() - started) * 1000,
+    )
+    flush_logging()
+
+
+@after_restore
+def refresh_after_restore() -> None:
+    """
+    Make a restored environment unique and current.
+
+    Reseeds the random module, which every restored environment would otherwise
+    share, closes any pooled HTTP connections restored from the snapshot, then
+    fetches fresh secrets and opens new connections through warm_up().
+    """
+    global discord_service, newsletter_service
+
+    random.seed()
+
+    sessions = []
+    if discord_service is not None:
+        sessions.append(discord_service.session)
+    if newsletter_service is not None:
+        sessions.append(newsletter_service.discord_service.session)
+    for session in sessions:
+        session.close()
+    discord_service = None
+    newsletter_service = None
+
+    if parameter_store_client is not None:
+        parameter_store_client.clear_cache()
+
+    if warmup_enabled():
+        warm_up(warmup_budget_ms())
+    flush_logging()
+
+
+# Warm up during INIT only when running in Lambda, so tests, builds and the
+# local runner can import this module without reaching AWS or Discord. Under
+# SnapStart, INIT runs once for the snapshot; the hooks above prime it and
+# warm up each restored environment instead.
+if (
+    os.environ.get("AWS_LAMBDA_FUNCTION_NAME")
+    and warmup_enabled()
+    and not is_snap_start()
+):
+    warm_up(warmup_budget_ms())
+    flush_logging()
@@ -0,0 +1,162 @@
+"""
+Long-running local runner for The Herald.
+
+Runs the newsletter and event-notification handlers at fixed intervals in one
+process, as an alternative to one Lambda invocation per schedule. The runner
+goes through the same handlers as Lambda, so AWS clients, HTTP sessions,
+rate-limit state and caches stay warm between runs.
+
+With --gateway the runner also connects to the Discord gateway and keeps an
+index of scheduled events and their subscribers, so reminder runs read
+subscriber sets instead of listing them from the Discord API.
+
+Run from the repository root:
+    python lambda/local_runner.py --newsletter-interval 3600 --events-interval 60
+"""
+
+import argparse
+import signal
+import threading
+from typing import Any, Dict
+
+import lambda_handler
+from clients.discord import DiscordClient
+from clients.lambda_invoker import LocalContext
+from services.event_index import EventIndex
+from utils.scheduler import JobScheduler
+
+logger = lambda_handler.logger
+
+DEFAULT_NEWSLETTER_INTERVAL = 3600
+DEFAULT_EVENTS_INTERVAL = 60
+
+
+def run_handler(handler_type: str, interval_seconds: float) -> Dict[str, Any]:
+    """
+    Run one handler through the Lambda entry point.
+
+    The run gets the job interval as its time budget, so unfinished work is
+    checkpointed and resumed by the next run instead of overlapping it.
+
+    Args:
+        handler_type: Handler to run ("newsletter" or "event_notification")
+        interval_seconds: Time until the next run of the job
+
+    Returns:
+        Handler response dictionary
+    """
+    context = LocalContext(remaining_time_ms=int(interval_seconds * 1000))
+    response = lambda_handler.main(
+        {"handler_type": handler_type, "source": "local.runner"}, context
+    )
+    if response.get("statusCode") != 200:
+        logger.error("Local %s run failed: %s", handler_type, response.get("body"))
+    return response
+
+
+def build_scheduler(
+    newsletter_interval: float = DEFAULT_NEWSLETTER_INTERVAL,
+    events_interval: float = DEFAULT_EVENTS_INTERVAL,
+) -> JobScheduler:
+    """
+    Create a scheduler with the newsletter and event-notification jobs.
+
+    Args:
+        newsletter_interval: Seconds between newsletter runs (0 disables the job)
+        events_interval: Seconds between event-notification runs (0 disables the job)
+
+    Returns:
+        JobScheduler ready to start
+    """
+    scheduler = JobScheduler()
+    if newsletter_interval > 0:
+        scheduler.add_job(
+            "newsletter",
+            newsletter_interval,
+            lambda: run_handler("newsletter", newsletter_interval),
+        )
+    if events_interval > 0:
+        scheduler.add_job(
+            "event_notification",
+            events_interval,
+            lambda: run_handler("event_notification", events_interval),
+        )
+    return scheduler
+
+
+def run_with_gateway(scheduler: JobScheduler) -> None:
+    """
+    Run the scheduler alongside a Discord gateway listener.
+    The listener keeps an EventIndex up to date and the reminder runs read it.
+    The bot runs on the main thread and the scheduler stops when it exits.
+
+    Args:
+        scheduler: Scheduler to run on a background thread
+    """
+    ps_client, db_client = lambda_handler.initialize_clients()
+    guild_id = ps_client.get_guild_id()
+    lambda_handler.event_index = EventIndex(
+        guild_id=guild_id, dynamodb_client=db_client
+    )
+
+    client = DiscordClient(
+        token=ps_client.get_discord_token(),
+        guild_id=guild_id,
+        event_index=lambda_handler.event_index,
+    )
+    threading.Thread(target=scheduler.start, name="scheduler", daemon=True).start()
+    try:
+        # Blocks until the bot disconnects or is interrupted with Ctrl+C
+        client.run()
+    finally:
+        scheduler.shutdown()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run The Herald as a local process.")
+    parser.add_argument(
+        "--newsletter-interval",
+        type=float,
+        default=DEFAULT_NEWSLETTER_INTERVAL,
+        help="Seconds between newsletter runs (0 disables)",
+    )
+    parser.add_argument(
+        "--events-interval",
+        type=float,
+        default=DEFAULT_EVENTS_INTERVAL,
+        help="Seconds between event-notification runs (0 disables)",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Run each enabled job once and exit"
+    )
+    parser.add_argument(
+        "--gateway",
+        action="store_true",
+        help="Index event subscribers from the Discord gateway",
+    )
+    args = parser.parse_args(argv)
+
+    scheduler = build_scheduler(args.newsletter_interval, args.events_interval)
+
+    if args.once:
+        for job in scheduler.jobs:
+            job.func()
+        return
+
+    if args.gateway:
+        run_with_gateway(scheduler)
+        return
+
+    def stop(signum, frame):
+        logger.info("Received signal %s - shutting down", signum)
+        scheduler.shutdown(wait=False)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    scheduler.start()
+    scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
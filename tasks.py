@@ -3,12 +3,45 @@ Build tasks for AWS Lambda deployment package and layer.
 Run with: invoke <task_name>
 """
 
+import json
+import os
+import shlex
 import shutil
+import tempfile
 import zipfile
 from pathlib import Path
 
 from invoke import task
 
+# Interpreter of the Lambda runtime; optimized builds compile bytecode with it
+LAMBDA_RUNTIME = "python3.13"
+
+# Distributions kept in optimized layers regardless of the trace, because the
+# handler or its dependencies only import them on code paths that importing
+# the handler does not run. Add any package imported lazily at runtime here.
+RUNTIME_PACKAGES = ["s3transfer"]
+
+# Imports the handler in a clean interpreter, creates the AWS clients it uses
+# and primes its pure code paths, then prints the top-level modules loaded
+# from the given directory along with the time the handler import took
+TRACE_SCRIPT = """
+import json, os, sys, time
+root = os.path.abspath(sys.argv[1])
+start = time.perf_counter()
+import lambda_handler
+seconds = time.perf_counter() - start
+from clients.aws import create_client
+for service in ("ssm", "lambda", "dynamodb"):
+    create_client(service)
+lambda_handler.prime_code_paths()
+modules = {
+    name.split(".")[0]
+    for name, module in list(sys.modules.items())
+    if (getattr(module, "__file__", None) or "").startswith(root)
+}
+print(json.dumps({"modules": sorted(modules), "import_seconds": seconds}))
+"""
+
 
 def clean_pycache(directory: Path) -> None:
     """Remove __pycache__ directories and .pyc files."""
@@ -20,8 +53,141 @@ def clean_pycache(directory: Path) -> None:
         item.unlink(missing_ok=True)
 
 
-@task
-def build_layer(c):
+def directory_size(directory: Path) -> int:
+    """Total size of the files under a directory in bytes."""
+    return sum(f.stat().st_size for f in directory.rglob("*") if f.is_file())
+
+
+def trace_handler(c, python: str, root: Path, paths: list) -> dict:
+    """
+    Import the Lambda handler in a fresh interpreter without site-packages.
+
+    Args:
+        c: Invoke context
+        python: Interpreter to run
+        root: Directory whose loaded top-level modules are reported
+        paths: Directories put on PYTHONPATH, in order
+
+    Returns:
+        Dict with the loaded top-level "modules" and the "import_seconds"
+    """
+    env = {
+        "PYTHONPATH": os.pathsep.join(str(Path(path).resolve()) for path in paths),
+        "AWS_DEFAULT_REGION": os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+        "LOG_BUFFERED": "false",
+        "WARMUP_ENABLED": "false",
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        script = Path(directory) / "trace_handler.py"
+        script.write_text(TRACE_SCRIPT)
+        # -S leaves site-packages off sys.path and -B stops bytecode being
+        # written, so only the build directories are imported from, as they
+        # would be deployed
+        result = c.run(
+            f"{python} -S -B {shlex.quote(str(script))} "
+            f"{shlex.quote(str(root.resolve()))}",
+            env=env,
+            hide=True,
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def top_level_module(entry: Path) -> str:
+    """Name of the top-level module provided by an entry of site-packages."""
+    name = entry.name
+    if name.endswith(".libs"):
+        # Shared libraries vendored by a wheel, e.g. pydantic_core.libs
+        return name[: -len(".libs")]
+    return name.split(".")[0]
+
+
+def prune_unused_packages(python_dir: Path, used: set) -> list:
+    """
+    Remove the top-level packages and modules that the handler does not use.
+
+    Args:
+        python_dir: Layer site-packages directory
+        used: Names of the top-level modules to keep
+
+    Returns:
+        Names of the removed entries
+    """
+    removed = []
+    for entry in sorted(python_dir.iterdir()):
+        if top_level_module(entry) in used:
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+        removed.append(entry.name)
+    return removed
+
+
+def compile_bytecode(c, python: str, directory: Path) -> None:
+    """
+    Precompile every module so that cold starts do not compile sources.
+
+    The .pyc files are written for the given interpreter and use unchecked
+    hashes: the deployed sources never change, so the import system can load
+    them without comparing them to the source timestamps, which zipping does
+    not preserve exactly.
+    """
+    c.run(
+        f"{python} -m compileall -q -j 0 --invalidation-mode unchecked-hash {directory}"
+    )
+
+
+def strip_native_extensions(c, directory: Path) -> int:
+    """
+    Strip debug symbols from native extension modules.
+
+    Returns:
+        Number of extension modules stripped
+    """
+    if not shutil.which("strip"):
+        print("  strip not found - leaving native extensions as they are")
+        return 0
+    stripped = 0
+    for library in directory.rglob("*.so*"):
+        if library.is_file():
+            result = c.run(f"strip --strip-debug {library}", warn=True, hide=True)
+            stripped += result.ok
+    return stripped
+
+
+def report_optimization(
+    before_size: int, after_size: int, before: dict, after: dict
+) -> None:
+    """Print the size and handler import time before and after optimizing."""
+    print(
+        f"  Size:        {before_size / 1024 / 1024:.1f}MB -> {after_size / 1024 / 1024:.1f}MB"
+    )
+    print(
+        f"  Import time: {before['import_seconds'] * 1000:.0f}ms -> "
+        f"{after['import_seconds'] * 1000:.0f}ms"
+    )
+
+
+def write_zip(directory: Path, zip_file: Path, optimize: bool) -> None:
+    """Zip the contents of a directory, compressing harder for optimized builds."""
+    level = 9 if optimize else None
+    with zipfile.ZipFile(
+        zip_file, "w", zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as zf:
+        for file in directory.rglob("*"):
+            if file.is_file():
+                arcname = file.relative_to(directory)
+                zf.write(file, arcname)
+
+
+@task(
+    help={
+        "optimize": "Drop packages the handler never imports, precompile bytecode and strip native extensions",
+        "python": f"Interpreter of the Lambda runtime, used to trace and compile (default: {LAMBDA_RUNTIME})",
+    }
+)
+def build_layer(c, optimize=False, python=LAMBDA_RUNTIME):
     """Build Lambda layer with Python dependencies."""
     print("Building AWS Lambda layer for Python dependencies...")
 
@@ -65,16 +231,38 @@ def build_layer(c):
             if item.is_dir():
                 shutil.rmtree(item, ignore_errors=True)
 
+    if optimize:
+        print("Tracing the modules imported by the Lambda handler...")
+        paths = [python_dir, "lambda", "lambda/app"]
+        before_size = directory_size(layer_dir)
+        before = trace_handler(c, python, python_dir, paths)
+
+        removed = prune_unused_packages(
+            python_dir, set(before["modules"]) | set(RUNTIME_PACKAGES)
+        )
+        print(f"Removed {len(removed)} unused package(s): {', '.join(removed)}")
+
+        print("Stripping debug symbols from native extensions...")
+        stripped = strip_native_extensions(c, python_dir)
+        print(f"Stripped {stripped} native extension(s)")
+
+        print(f"Precompiling bytecode with {python}...")
+        compile_bytecode(c, python, python_dir)
+
+        after = trace_handler(c, python, python_dir, paths)
+        missing = set(before["modules"]) - set(after["modules"])
+        if missing:
+            raise RuntimeError(
+                f"Optimized layer no longer provides: {', '.join(sorted(missing))}"
+            )
+        report_optimization(before_size, directory_size(layer_dir), before, after)
+
     # Create ZIP file
     print("Creating ZIP file for Lambda layer deployment...")
-    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file in python_dir.rglob("*"):
-            if file.is_file():
-                arcname = file.relative_to(layer_dir)
-                zf.write(file, arcname)
+    write_zip(layer_dir, zip_file, optimize)
 
     # Display results
-    layer_size = sum(f.stat().st_size for f in layer_dir.rglob("*") if f.is_file())
+    layer_size = directory_size(layer_dir)
     zip_size = zip_file.stat().st_size
 
     print()
@@ -84,8 +272,13 @@ def build_layer(c):
     print()
 
 
-@task
-def build_package(c):
+@task(
+    help={
+        "optimize": "Precompile the application bytecode",
+        "python": f"Interpreter of the Lambda runtime, used to compile (default: {LAMBDA_RUNTIME})",
+    }
+)
+def build_package(c, optimize=False, python=LAMBDA_RUNTIME):
     """Build Lambda deployment package with application code."""
     print("Building AWS Lambda deployment package...")
 
@@ -135,16 +328,30 @@ def build_package(c):
     for item in package_dir.rglob(".DS_Store"):
         item.unlink(missing_ok=True)
 
+    if optimize:
+        # The handler can only be imported against a built layer
+        layer_python_dir = Path("terraform/lambda_layer/python")
+        paths = [package_dir, package_dir / "app", layer_python_dir]
+        traced = layer_python_dir.exists()
+        if traced:
+            before_size = directory_size(package_dir)
+            before = trace_handler(c, python, package_dir, paths)
+        else:
+            print("Layer not built - skipping the import time report")
+
+        print(f"Precompiling bytecode with {python}...")
+        compile_bytecode(c, python, package_dir)
+
+        if traced:
+            after = trace_handler(c, python, package_dir, paths)
+            report_optimization(before_size, directory_size(package_dir), before, after)
+
     # Create ZIP file
     print("Creating ZIP file for Lambda deployment...")
-    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file in package_dir.rglob("*"):
-            if file.is_file():
-                arcname = file.relative_to(package_dir)
-                zf.write(file, arcname)
+    write_zip(package_dir, zip_file, optimize)
 
     # Display results
-    package_size = sum(f.stat().st_size for f in package_dir.rglob("*") if f.is_file())
+    package_size = directory_size(package_dir)
     zip_size = zip_file.stat().st_size
     zip_size_mb = zip_size / 1024 / 1024
 
@@ -166,10 +373,11 @@ def build_package(c):
     print()
 
 
-@task(pre=[build_layer, build_package])
-def build_all(c):
+@task(help={"optimize": "Build cold-start-optimized artifacts (see build-layer)"})
+def build_all(c, optimize=False):
     """Build both layer and deployment package."""
-    pass
+    build_layer(c, optimize=optimize)
+    build_package(c, optimize=optimize)
 
 
 @task(pre=[build_all])
@@ -205,3 +413,45 @@ def clean(c):
                 print(f"  Removed {artifact}")
 
     print("✓ Clean complete!")
+
+
+@task(
+    help={
+        "feeds": "Number of RSS feeds to serve (default: 100)",
+        "rsvps": "Subscribers of the benchmark event (default: 1000)",
+        "only": "Run a single scenario group: newsletter or reminders",
+        "json_path": "Write results to this JSON file",
+    }
+)
+def benchmark(c, feeds=100, rsvps=1000, only=None, json_path=None):
+    """Run the offline benchmarks against local Discord, RSS and DynamoDB stand-ins."""
+    command = f"python -m benchmarks.run --feeds {feeds} --rsvps {rsvps}"
+    if only:
+        command += f" --only {only}"
+    if json_path:
+        command += f" --json {json_path}"
+    c.run(command)
+
+
+@task(
+    help={
+        "newsletter_interval": "Seconds between newsletter runs (default: 3600, 0 disables)",
+        "events_interval": "Seconds between event-notification runs (default: 60, 0 disables)",
+        "once": "Run each enabled job once and exit",
+        "gateway": "Index event subscribers from the Discord gateway",
+    }
+)
+def run_local(
+    c, newsletter_interval=3600, events_interval=60, once=False, gateway=False
+):
+    """Run the newsletter and event-notification jobs in a long-running local process."""
+    command = (
+        f"python lambda/local_runner.py "
+        f"--newsletter-interval {newsletter_interval} "
+        f"--events-interval {events_interval}"
+    )
+    if once:
+        command += " --once"
+    if gateway:
+        command += " --gateway"
+    c.run(command)
@@ -41,11 +41,22 @@ resource "aws_lambda_function" "the_herald_handler" {
   # Lambda layers
   layers = [aws_lambda_layer_version.the_herald_dependencies.arn]
 
+  # SnapStart applies to published versions only
+  publish = var.enable_snap_start
+
+  dynamic "snap_start" {
+    for_each = var.enable_snap_start ? [1] : []
+    content {
+      apply_on = "PublishedVersions"
+    }
+  }
+
   # Environment variables
   environment {
     variables = {
       PARAMETER_STORE_PREFIX = var.parameter_store_prefix
       # DYNAMODB_TABLE_NAME    = aws_dynamodb_table.the_herald_reminders.name  # Disabled - newsletters only
+      # REMINDERS_TABLE_NAME   = aws_dynamodb_table.the_herald_reminders_by_event.name  # Disabled - newsletters only
       LOG_LEVEL = var.log_level
     }
   }
@@ -68,6 +79,19 @@ resource "aws_lambda_function" "the_herald_handler" {
   ]
 }
 
+# Alias on the latest published version, invoked instead of $LATEST with SnapStart
+resource "aws_lambda_alias" "live" {
+  count            = var.enable_snap_start ? 1 : 0
+  name             = "live"
+  description      = "Latest published version, restored from its SnapStart snapshot"
+  function_name    = aws_lambda_function.the_herald_handler.function_name
+  function_version = aws_lambda_function.the_herald_handler.version
+}
+
+locals {
+  handler_invoke_arn = var.enable_snap_start ? aws_lambda_alias.live[0].arn : aws_lambda_function.the_herald_handler.arn
+}
+
 resource "aws_lambda_layer_version" "the_herald_dependencies" {
   layer_name          = "the-herald-dependencies"
   description         = "Python dependencies for Discord bot Lambda function"
@@ -109,7 +133,7 @@ resource "aws_cloudwatch_event_rule" "newsletter_schedule" {
 resource "aws_cloudwatch_event_target" "newsletter_lambda" {
   rule      = aws_cloudwatch_event_rule.newsletter_schedule.name
   target_id = "the-herald-newsletter-target"
-  arn       = aws_lambda_function.the_herald_handler.arn
+  arn       = local.handler_invoke_arn
 
   input = jsonencode({
     handler_type = "newsletter"
@@ -121,6 +145,7 @@ resource "aws_lambda_permission" "allow_eventbridge_newsletter" {
   statement_id  = "AllowExecutionFromEventBridgeNewsletter"
   action        = "lambda:InvokeFunction"
   function_name = aws_lambda_function.the_herald_handler.function_name
+  qualifier     = var.enable_snap_start ? aws_lambda_alias.live[0].name : null
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.newsletter_schedule.arn
 }
@@ -140,7 +165,7 @@ resource "aws_lambda_permission" "allow_eventbridge_newsletter" {
 # resource "aws_cloudwatch_event_target" "event_notification_lambda" {
 #   rule      = aws_cloudwatch_event_rule.event_notification_schedule.name
 #   target_id = "the-herald-event-notification-target"
-#   arn       = aws_lambda_function.the_herald_handler.arn
+#   arn       = local.handler_invoke_arn
 #
 #   input = jsonencode({
 #     handler_type = "event_notification"
@@ -191,6 +216,45 @@ resource "aws_lambda_permission" "allow_eventbridge_newsletter" {
 #   }
 # }
 
+# Event-partitioned reminder table (enable with REMINDERS_TABLE_NAME)
+# resource "aws_dynamodb_table" "the_herald_reminders_by_event" {
+#   name         = "the-herald-reminders-by-event"
+#   billing_mode = "PAY_PER_REQUEST" # On-demand billing mode
+#
+#   # Partition key: "{event_id}#{reminder_type}", sort key: "{user_id}", so one
+#   # Query returns every user already reminded for an event
+#   hash_key  = "pk"
+#   range_key = "sk"
+#
+#   attribute {
+#     name = "pk"
+#     type = "S" # String
+#   }
+#
+#   attribute {
+#     name = "sk"
+#     type = "S" # String
+#   }
+#
+#   # TTL configuration for automatic expiration (2 hours after timestamp)
+#   ttl {
+#     attribute_name = "ttl"
+#     enabled        = true
+#   }
+#
+#   # Point-in-time recovery for data protection
+#   point_in_time_recovery {
+#     enabled = var.enable_dynamodb_pitr
+#   }
+#
+#   # Tags
+#   tags = {
+#     Name        = "the-herald-reminders-by-event"
+#     Environment = var.environment
+#     Purpose     = "Track sent Discord event reminders per event to prevent duplicates"
+#   }
+# }
+
 # ----------------------------------------------------------------------------
 # Parameter Store for Secrets Management
 # ----------------------------------------------------------------------------
@@ -321,11 +385,33 @@ resource "aws_iam_role_policy" "parameter_store_read_policy" {
 #         Effect = "Allow"
 #         Action = [
 #           "dynamodb:GetItem",
+#           "dynamodb:BatchGetItem",
 #           "dynamodb:PutItem",
+#           "dynamodb:DeleteItem",
 #           "dynamodb:Query",
 #           "dynamodb:UpdateItem"
 #         ]
-#         Resource = aws_dynamodb_table.the_herald_reminders.arn
+#         Resource = [
+#           aws_dynamodb_table.the_herald_reminders.arn,
+#           aws_dynamodb_table.the_herald_reminders_by_event.arn
+#         ]
+#       }
+#     ]
+#   })
+# }
+
+# Self-invocation IAM Policy for reminder shards (DISABLED - newsletters only)
+# resource "aws_iam_role_policy" "self_invoke_policy" {
+#   name = "the-herald-self-invoke-policy"
+#   role = aws_iam_role.lambda_execution_role.id
+#
+#   policy = jsonencode({
+#     Version = "2012-10-17"
+#     Statement = [
+#       {
+#         Effect   = "Allow"
+#         Action   = ["lambda:InvokeFunction"]
+#         Resource = aws_lambda_function.the_herald_handler.arn
 #       }
 #     ]
 #   })
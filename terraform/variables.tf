@@ -34,6 +34,12 @@ variable "log_level" {
   default     = "INFO"
 }
 
+variable "enable_snap_start" {
+  description = "Publish a version with SnapStart and invoke it through the live alias"
+  type        = bool
+  default     = false
+}
+
 variable "log_retention_days" {
   description = "Number of days to retain CloudWatch logs"
   type        = number
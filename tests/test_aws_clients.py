@@ -0,0 +1,88 @@
+"""
+Simple test to validate the shared AWS client factory and the low-level DynamoDB calls.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import time
+from unittest.mock import Mock, patch
+
+from botocore.config import Config
+
+from clients.aws import create_client
+from clients.dynamodb import DynamoDBClient
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_create_client():
+    """Test that clients share one session, are cached and use the tuned config."""
+
+    print("Testing AWS Client Factory...")
+
+    ssm = create_client("ssm", region_name="us-east-1")
+    assert create_client("ssm", region_name="us-east-1") is ssm
+    assert create_client("ssm", region_name="us-west-2") is not ssm
+    print("✓ Clients are cached by service and region")
+
+    config = ssm.meta.config
+    assert config.retries["mode"] == "adaptive"
+    assert config.max_pool_connections == 50
+    assert config.tcp_keepalive
+    assert (config.connect_timeout, config.read_timeout) == (2, 5)
+    print("✓ Clients use adaptive retries, keepalive, timeouts and a larger pool")
+
+    custom = create_client(
+        "ssm", region_name="us-east-1", config=Config(read_timeout=1)
+    )
+    assert custom is not ssm
+    assert custom.meta.config.read_timeout == 1
+    assert custom.meta.config.retries["mode"] == "adaptive"
+    print("✓ A custom config is merged over the defaults")
+
+
+def test_dynamodb_low_level_calls():
+    """Test that DynamoDBClient sends typed attribute values and reads them back."""
+
+    print("\nTesting Low-Level DynamoDB Calls...")
+
+    client = Mock()
+    with patch("clients.dynamodb.create_client", return_value=client):
+        db_client = DynamoDBClient(table_name="reminders")
+
+    assert db_client.record_reminder_sent("42", "7", "1h")
+    kwargs = client.put_item.call_args.kwargs
+    assert kwargs["TableName"] == "reminders"
+    assert kwargs["Item"]["reminder_key"] == {"S": "42:7:1h"}
+    assert "N" in kwargs["Item"]["ttl"]
+    print("✓ Items are written as DynamoDB attribute values")
+
+    client.get_item.return_value = {
+        "Item": {
+            "reminder_key": {"S": "42:7:1h"},
+            "ttl": {"N": str(int(time.time()) + 60)},
+        }
+    }
+    assert db_client.check_reminder_sent("42", "7", "1h")
+    assert client.get_item.call_args.kwargs["Key"] == {"reminder_key": {"S": "42:7:1h"}}
+    print("✓ Items are read back with typed keys")
+
+    client.batch_get_item.return_value = {
+        "Responses": {
+            "reminders": [
+                {
+                    "reminder_key": {"S": "42:8:1h"},
+                    "ttl": {"N": str(int(time.time()) + 60)},
+                }
+            ]
+        },
+        "UnprocessedKeys": {},
+    }
+    assert db_client.batch_check_reminders_sent("42", ["7", "8"], "1h") == {"8"}
+    print("✓ Batch reads are deserialized")
+
+
+if __name__ == "__main__":
+    test_create_client()
+    test_dynamodb_low_level_calls()
@@ -0,0 +1,143 @@
+"""
+Simple test to validate the tiered cache and the services that use it.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import tempfile
+import threading
+import time
+from unittest.mock import Mock
+
+from services.discord import DiscordService
+from utils.cache import DiskTier, DynamoDBTier, MemoryTier, TieredCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_memory_tier():
+    """Test LRU eviction and expiry of the memory tier."""
+
+    print("Testing Memory Tier...")
+
+    cache = TieredCache("test", tiers=[MemoryTier(max_entries=2)])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    print("✓ The least recently used entry was evicted")
+
+    cache.set("d", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("d", "expired") == "expired"
+    print("✓ Expired entries are misses")
+
+    stats = cache.stats()
+    assert stats["hits"] == {"memory": 3}
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 2
+    print(f"✓ Counters: {stats}")
+
+
+def test_lower_tiers():
+    """Test that hits in the disk and DynamoDB tiers are copied into memory."""
+
+    print("\nTesting Disk and DynamoDB Tiers...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        TieredCache("test", tiers=[DiskTier(directory)]).set("channels", ["1", "2"])
+
+        # A new process (or service) finds the entry on disk
+        memory = MemoryTier()
+        cache = TieredCache("test", tiers=[memory, DiskTier(directory)])
+        assert cache.get("channels") == ["1", "2"]
+        assert len(memory) == 1
+        assert cache.get("channels") == ["1", "2"]
+        assert cache.stats()["hits"] == {"memory": 1, "disk": 1}
+        print("✓ A disk hit was promoted to memory")
+
+        cache.delete("channels")
+        assert TieredCache("test", tiers=[DiskTier(directory)]).get("channels") is None
+        assert cache.get("channels") is None
+        print("✓ Deletes remove the entry from every tier")
+
+    dynamodb_client = Mock()
+    dynamodb_client.get_cache_entry.return_value = ("42", time.time() + 60)
+    cache = TieredCache("test", tiers=[MemoryTier(), DynamoDBTier(dynamodb_client)])
+    assert cache.get("dm_channel:7") == "42"
+    assert cache.get("dm_channel:7") == "42"
+    dynamodb_client.get_cache_entry.assert_called_once_with("test:dm_channel:7")
+    print("✓ A shared entry was read from DynamoDB once")
+
+
+def test_stampede_protection():
+    """Test that concurrent misses on one key run a single load."""
+
+    print("\nTesting Stampede Protection...")
+
+    cache = TieredCache("test")
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 8
+    assert len(loads) == 1
+    assert cache.stats()["loads"] == 1
+    print("✓ 8 concurrent callers shared one load")
+
+
+def test_dm_channel_reuse():
+    """Test that a user's DM channel is opened once and again once dropped from the cache."""
+
+    print("\nTesting DM Channel Reuse...")
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+    session = Mock()
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"id": "555"}
+    session.request.return_value = response
+    service = DiscordService(
+        parameter_store_client=ps_client,
+        session=session,
+        rate_limit_proxy=True,
+        cache=TieredCache("discord"),
+    )
+
+    headers = service._auth_headers()
+    service._send_dm("7", "first", headers)
+    service._send_dm("7", "second", headers)
+    urls = [call.args[1] for call in session.request.call_args_list]
+    assert sum(url.endswith("/users/@me/channels") for url in urls) == 1
+    assert sum(url.endswith("/channels/555/messages") for url in urls) == 2
+    print("✓ The second DM reused the cached channel")
+
+    assert service.cache.get("dm_channel:7") == "555"
+    service.cache.delete("dm_channel:7")
+    service._send_dm("7", "third", headers)
+    assert session.request.call_args_list[-2].args[1].endswith("/users/@me/channels")
+    print("✓ A channel missing from the cache is opened again")
+
+
+if __name__ == "__main__":
+    test_memory_tier()
+    test_lower_tiers()
+    test_stampede_protection()
+    test_dm_channel_reuse()
@@ -0,0 +1,92 @@
+"""
+Simple test to validate the incremental mirror of channel links.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import time
+from unittest.mock import Mock, patch
+
+from services.channel_mirror import MESSAGES_PAGE_SIZE, ChannelMirror
+from utils.cache import TieredCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _message(message_id: int) -> dict:
+    return {"id": str(message_id), "content": f"https://example.com/{message_id}"}
+
+
+def _make_mirror(pages: list, **kwargs):
+    request = Mock()
+    request.side_effect = [Mock(json=Mock(return_value=page)) for page in pages]
+    return ChannelMirror(request, TieredCache("discord"), **kwargs), request
+
+
+def test_incremental_sync():
+    """Test that later syncs only fetch the messages after the cursor."""
+
+    print("Testing Incremental Sync...")
+
+    digest = {
+        "id": "3",
+        "content": "",
+        "embeds": [{"url": "https://example.com/digest"}],
+    }
+    mirror, request = _make_mirror(
+        [[digest, _message(2), _message(1)], [], [_message(5), _message(4)]]
+    )
+
+    links = mirror.get_links("777")
+    assert "https://example.com/1" in links and "https://example.com/digest" in links
+    assert request.call_args.args == ("GET", "/channels/777/messages?limit=100")
+    print("✓ The first sync read the latest messages")
+
+    assert mirror.get_links("777") == links
+    assert request.call_args.args[1].endswith("&after=3")
+    print("✓ An unchanged channel cost one small request")
+
+    links = mirror.get_links("777")
+    assert "https://example.com/5" in links and "https://example.com/2" in links
+    assert request.call_args.args[1].endswith("&after=3")
+    assert mirror.cache.get("channel_mirror:777")["cursor"] == "5"
+    print("✓ New messages were added and the cursor advanced")
+
+
+def test_resync():
+    """Test that expired or far-behind mirrors are rebuilt from the channel."""
+
+    print("\nTesting Resync...")
+
+    # Message 1 was deleted by the time the mirror is rebuilt
+    mirror, request = _make_mirror(
+        [[_message(2), _message(1)], [_message(2)]], resync_seconds=0.05
+    )
+    mirror.get_links("777")
+    time.sleep(0.06)
+    assert mirror.get_links("777") == {"https://example.com/2"}
+    assert "after=" not in request.call_args.args[1]
+    print("✓ An expired mirror was rebuilt, dropping a deleted message")
+
+    # Two full pages behind with a limit of two pages: rebuild instead
+    full_page = [_message(i) for i in range(100 + MESSAGES_PAGE_SIZE, 100, -1)]
+    mirror, request = _make_mirror(
+        [[_message(1)], full_page, full_page, [_message(1000)]]
+    )
+    mirror.get_links("777")
+    with patch("services.channel_mirror.MIRROR_MAX_PAGES", 2):
+        assert mirror.get_links("777") == {"https://example.com/1000"}
+    assert request.call_count == 4
+    print("✓ A mirror too far behind was rebuilt instead of paged through")
+
+    mirror, _ = _make_mirror([full_page], max_messages=10)
+    assert len(mirror.get_links("777")) == 10
+    kept = mirror.cache.get("channel_mirror:777")["messages"]
+    assert sorted(kept, key=int) == [str(i) for i in range(191, 201)]
+    print("✓ Only the newest messages are kept")
+
+
+if __name__ == "__main__":
+    test_incremental_sync()
+    test_resync()
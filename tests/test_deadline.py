@@ -0,0 +1,86 @@
+"""
+Simple test to validate deadline-aware reminder processing and resume.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import sys
+import os
+import logging
+from unittest.mock import Mock
+
+# Add app directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+
+from services.discord import DiscordService
+from utils.deadline import Deadline
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _make_service() -> DiscordService:
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+    # Send one reminder at a time so the deadline is checked between each
+    return DiscordService(parameter_store_client=ps_client, concurrency=1)
+
+
+def test_deadline():
+    """Test deadline expiry against a Lambda context."""
+
+    print("Testing Deadline...")
+
+    assert Deadline().expired() is False
+    assert Deadline().remaining_ms() is None
+    print("✓ No context means no deadline")
+
+    context = Mock()
+    context.get_remaining_time_in_millis = Mock(return_value=60000)
+    assert Deadline(context, margin_ms=30000).expired() is False
+    context.get_remaining_time_in_millis = Mock(return_value=10000)
+    assert Deadline(context, margin_ms=30000).expired() is True
+    print("✓ Deadline expires inside the margin")
+
+    print("\n✅ All deadline tests passed!")
+
+
+def test_reminder_checkpoint_and_resume():
+    """Test that reminders stop at the deadline and resume in order."""
+
+    print("\n\nTesting Reminder Checkpoint and Resume...")
+
+    service = _make_service()
+    users = [{"user": {"id": str(i), "username": f"user{i}"}} for i in range(5)]
+    service._make_request_with_retry = Mock(return_value=Mock(json=lambda: users))
+
+    sent = []
+    context = Mock()
+    remaining = iter([60000, 60000, 60000, 60000, 0])
+    context.get_remaining_time_in_millis = lambda: next(remaining, 0)
+    service._send_reminder = lambda reminder, headers, deadline: sent.append(
+        reminder["user_id"]
+    )
+
+    # Test 1: Work stops when the deadline is reached
+    print("\n1. Testing deadline stop...")
+    work = [{"event_id": "42", "event_name": "Event"}]
+    unsent = service._process_reminders(work, {}, Deadline(context, margin_ms=1000))
+    assert sent == ["0", "1", "2"]
+    assert [item["user_id"] for item in unsent] == ["3", "4"]
+    print(f"✓ Sent {len(sent)} reminder(s), checkpointed {len(unsent)}")
+
+    # Test 2: Resumed work finishes without listing users again
+    print("\n2. Testing resume...")
+    service._make_request_with_retry.reset_mock()
+    assert service._process_reminders(unsent, {}, Deadline()) == []
+    assert sent == ["0", "1", "2", "3", "4"]
+    service._make_request_with_retry.assert_not_called()
+    print("✓ Checkpointed reminders sent in order")
+
+    print("\n✅ All checkpoint and resume tests passed!")
+
+
+if __name__ == "__main__":
+    test_deadline()
+    test_reminder_checkpoint_and_resume()
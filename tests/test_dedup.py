@@ -0,0 +1,181 @@
+"""
+Simple test to validate article URL canonicalization and deduplication.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import sys
+import os
+import logging
+import random
+import threading
+import time
+from unittest.mock import Mock, patch
+
+# Add app directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+
+from utils.dedup import (
+    ArticleDeduplicator,
+    TitleIndex,
+    UrlCanonicalizer,
+    jaccard_similarity,
+    strip_tracking_params,
+    title_shingles,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_url_canonicalization():
+    """Test tracking parameter removal and redirect caching."""
+
+    print("Testing URL Canonicalization...")
+
+    # Test 1: utm_* parameters are removed
+    print("\n1. Testing tracking parameter removal...")
+    url = "HTTPS://Example.com:443/story?id=7&utm_source=feed&utm_medium=rss#top"
+    assert strip_tracking_params(url) == "https://example.com/story?id=7"
+    print("✓ Tracking parameters stripped")
+
+    # Test 2: Links without tracking parameters keep their encoding
+    print("\n2. Testing untouched query strings...")
+    url = "https://example.com/search?q=a%20b&page=2"
+    assert strip_tracking_params(url) == url
+    print("✓ Query string preserved")
+
+    # Test 3: FeedBurner origLink is preferred over the redirect
+    print("\n3. Testing FeedBurner origin link...")
+    canonicalizer = UrlCanonicalizer()
+    canonical = canonicalizer.canonicalize(
+        "https://feeds.feedburner.com/~r/Example/~3/abc/",
+        origin_url="https://example.com/story?utm_campaign=x",
+    )
+    assert canonical == "https://example.com/story"
+    print("✓ Origin link used without a network call")
+
+    # Test 4: Redirects are served from the cache
+    print("\n4. Testing redirect cache...")
+    feedburner_url = "https://feeds.feedburner.com/~r/Example/~3/def/"
+    canonicalizer.redirect_cache.set(
+        feedburner_url, "https://example.com/other?utm_source=feedburner"
+    )
+    assert canonicalizer.canonicalize(feedburner_url) == "https://example.com/other"
+    print("✓ Cached redirect resolved")
+
+    # Test 5: Redirects are resolved concurrently within the run's budget
+    print("\n5. Testing concurrent redirect resolution...")
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def head(url, allow_redirects, timeout):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(1.0 if url.endswith("/slow/") else 0.05)
+        with lock:
+            in_flight.remove(url)
+        return Mock(url=url.replace("feeds.feedburner.com/~r", "example.com"))
+
+    canonicalizer = UrlCanonicalizer(budget_seconds=0.5)
+    urls = [f"https://feeds.feedburner.com/~r/Example/{i}/" for i in range(6)]
+    urls.append("https://feeds.feedburner.com/~r/Example/slow/")
+    with patch("utils.dedup.requests.head", side_effect=head):
+        assert canonicalizer.resolve_redirects(urls) == 6
+        assert max(peak) > 1
+        slow = canonicalizer.canonicalize(urls[-1], resolve=False)
+        assert slow == urls[-1]
+        time.sleep(0.8)
+    assert canonicalizer.canonicalize(urls[0], resolve=False) == (
+        "https://example.com/Example/0/"
+    )
+    print("✓ Redirects resolved in parallel; the slow one did not hold up the run")
+
+    print("\n✅ All URL canonicalization tests passed!")
+
+
+def test_article_deduplication():
+    """Test cross-feed duplicate collapsing."""
+
+    print("\n\nTesting Article Deduplication...")
+
+    # Test 1: Title similarity
+    print("\n1. Testing title similarity...")
+    first = title_shingles("Microsoft Patches Zero-Day Exploited in Attacks")
+    second = title_shingles("Microsoft patches zero-day exploited in attacks!")
+    third = title_shingles("New ransomware gang targets hospitals")
+    assert jaccard_similarity(first, second) == 1.0
+    assert jaccard_similarity(first, third) < 0.2
+    print("✓ Similar titles match, different titles do not")
+
+    # Test 2: Duplicates are collapsed per channel
+    print("\n2. Testing duplicate collapsing...")
+    articles = [
+        {
+            "title": "Zero-day exploited in attacks",
+            "link": "https://example.com/story?utm_source=a",
+            "channel_name": "security-news",
+        },
+        {
+            "title": "Completely different headline",
+            "link": "https://example.com/story?utm_source=b",
+            "channel_name": "security-news",
+        },
+        {
+            "title": "Zero-Day Exploited in Attacks",
+            "link": "https://mirror.example.org/zero-day",
+            "channel_name": "security-news",
+        },
+        {
+            "title": "Zero-day exploited in attacks",
+            "link": "https://example.com/story",
+            "channel_name": "tech-news",
+        },
+    ]
+    unique = ArticleDeduplicator().deduplicate(articles)
+    assert len(unique) == 2
+    assert unique[0]["link"] == "https://example.com/story"
+    assert unique[0]["original_link"] == "https://example.com/story?utm_source=a"
+    assert unique[1]["channel_name"] == "tech-news"
+    print("✓ Each story kept once per channel")
+
+    # Test 3: The title index only compares candidates sharing a bucket
+    print("\n3. Testing title index...")
+    words = [
+        "patch",
+        "exploit",
+        "breach",
+        "ransomware",
+        "cloud",
+        "kernel",
+        "phishing",
+        "botnet",
+        "firmware",
+        "browser",
+        "router",
+        "supply",
+        "chain",
+        "zero-day",
+        "malware",
+        "leak",
+        "update",
+        "vendor",
+    ]
+    rng = random.Random(7)
+    titles = [" ".join(rng.sample(words, 6)) + f" {number}" for number in range(500)]
+    index = TitleIndex()
+    for title in titles:
+        index.add(title_shingles(title))
+    assert index.find_similar(title_shingles(titles[123].title() + "!"), 0.8)
+    assert not index.find_similar(
+        title_shingles("New ransomware gang targets hospitals"), 0.8
+    )
+    print("✓ Near-duplicates found among 500 titles without an all-pairs scan")
+
+    print("\n✅ All article deduplication tests passed!")
+
+
+if __name__ == "__main__":
+    test_url_canonicalization()
+    test_article_deduplication()
@@ -0,0 +1,156 @@
+"""
+Simple test to validate AsyncDiscordService and concurrent reminder delivery.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import asyncio
+import logging
+import threading
+from unittest.mock import Mock
+
+from aiohttp import web
+
+from services.discord import DiscordService
+from services.discord_async import AsyncDiscordService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+class FakeDiscord:
+    """Minimal Discord API served by aiohttp on a background thread."""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.messages = []
+        self.rate_limit_once = True
+        self.loop = asyncio.new_event_loop()
+        self.runner = None
+        self.port = None
+
+    async def create_dm(self, request):
+        body = await request.json()
+        return web.json_response({"id": f"9{body['recipient_id']}"})
+
+    async def create_message(self, request):
+        if self.rate_limit_once:
+            self.rate_limit_once = False
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": 0.1},
+                status=429,
+                headers={"Retry-After": "0.1", "X-RateLimit-Scope": "user"},
+            )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        body = await request.json()
+        self.messages.append((request.match_info["channel_id"], body["content"]))
+        return web.json_response({"id": "1", "content": body["content"]})
+
+    def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v10/users/@me/channels", self.create_dm)
+        app.router.add_post(
+            "/api/v10/channels/{channel_id}/messages", self.create_message
+        )
+
+        async def setup():
+            self.runner = web.AppRunner(app)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, "127.0.0.1", 0)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        self.loop.run_until_complete(setup())
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.port}/api/v10"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def test_async_send_dm():
+    """Test that DMs sent through the async service overlap."""
+
+    print("Testing AsyncDiscordService...")
+
+    server = FakeDiscord()
+    base_url = server.start()
+
+    async def send_all():
+        async with AsyncDiscordService(
+            "test-token", "123", base_url=base_url, concurrency=5
+        ) as discord:
+            await asyncio.gather(
+                *(discord.send_dm(str(user_id), "hello") for user_id in range(10))
+            )
+
+    try:
+        asyncio.run(send_all())
+    finally:
+        server.stop()
+
+    assert len(server.messages) == 10
+    print("✓ All DMs delivered, including the one retried after a 429")
+    assert 1 < server.max_in_flight <= 5
+    print(f"✓ Up to {server.max_in_flight} DMs were in flight at once")
+
+
+def test_concurrent_reminders():
+    """Test that the sync service sends reminder batches through the async service."""
+
+    print("\nTesting Concurrent Reminder Delivery...")
+
+    server = FakeDiscord()
+    server.rate_limit_once = False
+    base_url = server.start()
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+    db_client = Mock()
+    db_client.record_reminder_sent.return_value = True
+    db_threads = set()
+    db_client.claim_reminder.side_effect = (
+        lambda **kwargs: db_threads.add(threading.get_ident()) or True
+    )
+
+    service = DiscordService(
+        parameter_store_client=ps_client,
+        dynamodb_client=db_client,
+        base_url=base_url,
+        concurrency=4,
+    )
+    work = [
+        {
+            "event_id": "42",
+            "event_name": "Event",
+            "user_id": str(user_id),
+            "username": f"user{user_id}",
+            "checked": True,
+        }
+        for user_id in range(8)
+    ]
+
+    try:
+        unsent = service._process_reminders(work, service._auth_headers())
+    finally:
+        server.stop()
+
+    assert unsent == []
+    assert len(server.messages) == 8
+    assert db_client.record_reminder_sent.call_count == 8
+    print("✓ Every reminder was sent and recorded")
+    assert db_threads and threading.get_ident() not in db_threads
+    print("✓ Reminders were claimed off the event loop")
+    assert 1 < server.max_in_flight <= 4
+    print(f"✓ Reminders were sent {server.max_in_flight} at a time")
+
+
+if __name__ == "__main__":
+    test_async_send_dm()
+    test_concurrent_reminders()
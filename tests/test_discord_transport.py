@@ -0,0 +1,94 @@
+"""
+Simple test to validate the Discord API base URL and transport injection.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import os
+from unittest.mock import Mock, patch
+
+from services.discord import DiscordService, DISCORD_API_BASE_URL
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _make_service(**kwargs):
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+    return DiscordService(parameter_store_client=ps_client, **kwargs)
+
+
+def _make_session(status_code=200, payload=None, headers=None):
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.json.return_value = payload if payload is not None else []
+    session = Mock()
+    session.request.return_value = response
+    return session
+
+
+def test_default_base_url():
+    """Test that requests go to the Discord API unless configured otherwise."""
+
+    print("Testing Default Base URL...")
+
+    session = _make_session()
+    with patch.dict(os.environ):
+        os.environ.pop("DISCORD_API_BASE_URL", None)
+        service = _make_service(session=session)
+    service.list_scheduled_events()
+
+    url = session.request.call_args[0][1]
+    assert url == f"{DISCORD_API_BASE_URL}/guilds/123456789012345678/scheduled-events"
+    print(f"✓ Request sent to {url}")
+
+
+def test_injected_base_url_and_session():
+    """Test that every call goes through the injected session and base URL."""
+
+    print("\nTesting Injected Base URL And Session...")
+
+    session = _make_session(payload={"id": "555"})
+    with patch.dict(os.environ, {"DISCORD_API_BASE_URL": "http://ignored.local"}):
+        service = _make_service(base_url="http://proxy.local/api/v10/", session=session)
+
+    service._send_dm("42", "hello", service._auth_headers())
+
+    urls = [call[0][1] for call in session.request.call_args_list]
+    assert urls == [
+        "http://proxy.local/api/v10/users/@me/channels",
+        "http://proxy.local/api/v10/channels/555/messages",
+    ]
+    headers = session.request.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bot test-token"
+    print("✓ DM requests used the injected session and base URL")
+
+
+def test_rate_limit_proxy():
+    """Test that proxy mode skips local buckets and still honours 429s."""
+
+    print("\nTesting Rate-Limit Proxy Mode...")
+
+    sleeps = []
+    limited = Mock(status_code=429, headers={"Retry-After": "0.25"})
+    ok = Mock(status_code=200, headers={})
+    ok.json.return_value = []
+    session = Mock()
+    session.request.side_effect = [limited, ok]
+
+    with patch.dict(os.environ, {"DISCORD_RATE_LIMIT_PROXY": "true"}):
+        service = _make_service(session=session)
+    assert service.rate_limiter is None
+    with patch("services.discord.time.sleep", sleeps.append):
+        service.list_scheduled_events()
+
+    assert session.request.call_count == 2
+    assert sleeps == [0.25]
+    print("✓ Proxy mode waited for Retry-After without local buckets")
+
+
+if __name__ == "__main__":
+    test_default_base_url()
+    test_injected_base_url_and_session()
+    test_rate_limit_proxy()
@@ -0,0 +1,194 @@
+"""
+Simple test to validate the gateway-fed event index and its use by reminder runs.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from clients.discord import DiscordClient
+from clients.dynamodb import DynamoDBClient
+from services.discord import DiscordService
+from services.event_index import EventIndex
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+GUILD_ID = "123456789012345678"
+
+
+def test_gateway_updates():
+    """Test that gateway dispatches keep the index up to date and written through."""
+
+    print("Testing Event Index Gateway Updates...")
+
+    db_client = Mock()
+    index = EventIndex(guild_id=GUILD_ID, dynamodb_client=db_client)
+    event = {
+        "id": "42",
+        "guild_id": GUILD_ID,
+        "name": "Office Hours",
+        "scheduled_start_time": "2026-01-01T18:00:00+00:00",
+        "status": 1,
+    }
+
+    index.apply_gateway_event("GUILD_SCHEDULED_EVENT_CREATE", event)
+    index.record_heartbeat()
+    assert index.get_subscribers("42") == set()
+    db_client.replace_event_subscribers.assert_called_once()
+    print("✓ A new event is indexed with an empty subscriber set")
+
+    for user_id in ("1", "2"):
+        index.apply_gateway_event(
+            "GUILD_SCHEDULED_EVENT_USER_ADD",
+            {
+                "guild_scheduled_event_id": "42",
+                "user_id": user_id,
+                "guild_id": GUILD_ID,
+            },
+        )
+    index.apply_gateway_event(
+        "GUILD_SCHEDULED_EVENT_USER_REMOVE",
+        {"guild_scheduled_event_id": "42", "user_id": "1", "guild_id": GUILD_ID},
+    )
+    assert index.get_subscribers("42") == {"2"}
+    assert db_client.add_event_subscriber.call_count == 2
+    db_client.remove_event_subscriber.assert_called_once_with("42", "1")
+    print("✓ Subscriber adds and removes are applied and written through")
+
+    assert not index.apply_gateway_event(
+        "GUILD_SCHEDULED_EVENT_USER_ADD",
+        {"guild_scheduled_event_id": "42", "user_id": "3", "guild_id": "1"},
+    )
+    assert index.get_subscribers("42") == {"2"}
+    print("✓ Dispatches for other guilds are ignored")
+
+    index.apply_gateway_event("GUILD_SCHEDULED_EVENT_UPDATE", dict(event, status=3))
+    db_client.delete_event.assert_called_once_with("42")
+    print("✓ Completed events are removed from the index")
+
+
+def test_reminders_use_index():
+    """Test that reminder runs read indexed subscribers instead of listing users."""
+
+    print("\nTesting Reminders From Event Index...")
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = GUILD_ID
+    db_client = Mock()
+    db_client.batch_check_reminders_sent.return_value = {"2"}
+    db_client.batch_check_undeliverable_users.return_value = set()
+    # Event 7 was never synced, so the index cannot answer for it
+    db_client.load_event_subscribers.return_value = None
+
+    index = EventIndex(guild_id=GUILD_ID, dynamodb_client=db_client)
+    index.sync_event(
+        EventIndex.event_summary({"id": "42", "name": "Event"}), ["1", "2"]
+    )
+    index.record_heartbeat()
+
+    service = DiscordService(
+        parameter_store_client=ps_client, dynamodb_client=db_client, event_index=index
+    )
+
+    with patch.object(
+        DiscordService, "list_scheduled_event_users", return_value=[]
+    ) as list_users:
+        reminders = service._expand_event({"event_id": "42", "event_name": "Event"})
+        assert [reminder["user_id"] for reminder in reminders] == ["1"]
+        list_users.assert_not_called()
+        print("✓ Indexed subscribers are used without listing users")
+
+        service._expand_event({"event_id": "7", "event_name": "Other"})
+        list_users.assert_called_once_with("7", None)
+        print("✓ Events missing from the index fall back to the Discord API")
+
+
+def test_stale_index():
+    """Test that indexed subscribers are only trusted while the listener's heartbeat is fresh."""
+
+    print("\nTesting Event Index Staleness...")
+
+    items = {
+        "event:42": {
+            "reminder_key": {"S": "event:42"},
+            "synced_at": {"N": "1"},
+            "subscribers": {"SS": ["1", "2"]},
+        }
+    }
+    client = Mock()
+    client.get_item.side_effect = lambda TableName, Key: (
+        {"Item": items[Key["reminder_key"]["S"]]}
+        if Key["reminder_key"]["S"] in items
+        else {}
+    )
+    db_client = DynamoDBClient.__new__(DynamoDBClient)
+    db_client.table_name = "test"
+    db_client.client = client
+
+    assert db_client.load_event_subscribers("42") is None
+    print("✓ Without a listener heartbeat the index is not used")
+
+    items["listener:heartbeat"] = {"heartbeat_at": {"N": str(int(time.time()) - 600)}}
+    assert db_client.load_event_subscribers("42") is None
+    print("✓ A stale heartbeat sends readers back to the Discord API")
+
+    items["listener:heartbeat"] = {"heartbeat_at": {"N": str(int(time.time()))}}
+    assert db_client.load_event_subscribers("42") == {"1", "2"}
+    print("✓ A fresh heartbeat lets readers use the index")
+
+    index = EventIndex(guild_id=GUILD_ID)
+    index.sync_event(EventIndex.event_summary({"id": "42", "name": "Event"}), ["1"])
+    assert index.get_subscribers("42") is None
+    index.record_heartbeat()
+    assert index.get_subscribers("42") == {"1"}
+    index.clear_heartbeat()
+    assert index.get_subscribers("42") is None
+    print("✓ The in-memory index follows the listener's heartbeat too")
+
+
+def test_listener_off_event_loop():
+    """Test that the gateway listener applies index updates on its worker thread, in order."""
+
+    print("\nTesting Gateway Listener Worker...")
+
+    applied = []
+    index = Mock()
+    index.apply_gateway_event.side_effect = lambda event_type, data: applied.append(
+        (data["user_id"], threading.current_thread().name)
+    )
+    client = DiscordClient(token="test-token", guild_id=GUILD_ID, event_index=index)
+
+    async def receive_all():
+        loop_thread = threading.current_thread().name
+        await asyncio.gather(
+            *(
+                client.bot.on_socket_raw_receive(
+                    json.dumps(
+                        {
+                            "t": "GUILD_SCHEDULED_EVENT_USER_ADD",
+                            "d": {"user_id": str(user_id)},
+                        }
+                    )
+                )
+                for user_id in range(5)
+            )
+        )
+        return loop_thread
+
+    loop_thread = asyncio.run(receive_all())
+    assert [user_id for user_id, _ in applied] == ["0", "1", "2", "3", "4"]
+    assert all(thread != loop_thread for _, thread in applied)
+    print("✓ Dispatches were applied in order off the event loop")
+
+
+if __name__ == "__main__":
+    test_gateway_updates()
+    test_reminders_use_index()
+    test_stale_index()
+    test_listener_off_event_loop()
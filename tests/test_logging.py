@@ -0,0 +1,150 @@
+"""
+Simple test to validate structured JSON logging, truncation and sampling.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import io
+import json
+import logging
+
+from config.logger import (
+    BufferedLogHandler,
+    JsonFormatter,
+    SampledLogger,
+    Truncated,
+    parse_logger_levels,
+)
+
+
+def _capture(name):
+    """Create a logger writing JSON records to a buffer."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter(max_length=50))
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger, stream
+
+
+def _records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_formatter():
+    """Test that records are valid JSON whatever the message contains."""
+
+    print("Testing JSON Formatter...")
+
+    logger, stream = _capture("test.logging.json")
+    logger.info('Title with "quotes" and \\ backslash', extra={"event_id": "42"})
+    logger.info("Long payload: %s", "x" * 100)
+
+    quoted, long = _records(stream)
+    assert quoted["message"] == 'Title with "quotes" and \\ backslash'
+    assert quoted["event_id"] == "42"
+    print("✓ Quotes are escaped and extra fields are included")
+    assert long["message"].endswith("... (64 more chars)")
+    print("✓ Long messages are truncated")
+
+
+def test_lazy_truncation():
+    """Test that payloads are only serialised when the record is written."""
+
+    print("\nTesting Lazy Payload Truncation...")
+
+    class Payload:
+        dumped = 0
+
+        def __str__(self):
+            Payload.dumped += 1
+            return "payload"
+
+    logger, _ = _capture("test.logging.lazy")
+    logger.debug("Event payload: %s", Truncated(Payload()))
+    assert Payload.dumped == 0
+    print("✓ Disabled records do not serialise their payload")
+
+    assert str(Truncated({"items": list(range(100))}, max_length=20)).startswith(
+        '{"items": [0, 1, 2, '
+    )
+    print("✓ Payloads are serialised as JSON and truncated")
+
+
+def test_sampling():
+    """Test that sampled records are written one in N, and warnings always."""
+
+    print("\nTesting Log Sampling...")
+
+    logger, stream = _capture("test.logging.sampled")
+    sampled = SampledLogger(logger, sample_rate=0.25)
+    for user_id in range(20):
+        sampled.info("DM sent successfully to user ID: %s", user_id)
+    sampled.warning("Could not DM %s", "user")
+
+    records = _records(stream)
+    assert len(records) == 6
+    assert all(record["sample_rate"] == 0.25 for record in records)
+    assert records[-1]["level"] == "WARNING"
+    print("✓ 5 of 20 INFO records and every warning were written")
+
+
+def test_buffered_handler():
+    """Test that buffered records are written in batches by the writer thread."""
+
+    print("\nTesting Buffered Log Handler...")
+
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            CountingStream.writes += 1
+            return super().write(text)
+
+    stream = CountingStream()
+    handler = BufferedLogHandler(stream=stream, batch_size=1000)
+    handler.setFormatter(JsonFormatter())
+    logger = logging.getLogger("test.logging.buffered")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    payload = {"count": 0}
+    for user_id in range(200):
+        payload["count"] = user_id
+        logger.info("DM sent to %s with %s", user_id, payload)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Send failed")
+
+    assert handler.flush()
+    records = _records(stream)
+    assert len(records) == 201
+    print("✓ Every record was written by flush()")
+    assert CountingStream.writes < 201
+    print(f"✓ Records were written in {CountingStream.writes} batched write(s)")
+    assert records[0]["message"] == "DM sent to 0 with {'count': 0}"
+    print("✓ Messages were resolved when logged, not when written")
+    assert "ValueError: boom" in records[-1]["exception"]
+    print("✓ Exception tracebacks are kept")
+    handler.close()
+
+
+def test_logger_levels():
+    """Test parsing of per-logger levels."""
+
+    print("\nTesting Per-Logger Levels...")
+
+    levels = parse_logger_levels("services.discord=DEBUG, botocore=warning,bad")
+    assert levels == {"services.discord": logging.DEBUG, "botocore": logging.WARNING}
+    print("✓ Per-logger levels are parsed and malformed entries skipped")
+
+
+if __name__ == "__main__":
+    test_json_formatter()
+    test_lazy_truncation()
+    test_sampling()
+    test_buffered_handler()
+    test_logger_levels()
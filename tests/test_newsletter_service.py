@@ -0,0 +1,138 @@
+"""
+Simple test to validate newsletter digest batching.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import sys
+import os
+import logging
+from unittest.mock import Mock, patch
+
+# Add app directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+
+from services.newsletter import NewsletterService, MESSAGE_EMBED_CHARS_LIMIT
+from models import FeedsConfig, MAX_EMBEDS_PER_MESSAGE
+import lambda_handler
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _make_articles(count: int, summary: str = "Summary") -> list:
+    return [
+        {
+            "title": f"Article {i}",
+            "link": f"https://example.com/articles/{i}",
+            "published": "Mon, 01 Jan 2024 00:00:00 +0000",
+            "summary": summary,
+            "channel_name": "security-news",
+            "feed_name": "Example Feed",
+        }
+        for i in range(count)
+    ]
+
+
+def test_digest_batching():
+    """Test that digests respect the embed count and size limits."""
+
+    print("Testing Newsletter Digest Batching...")
+
+    # NewsletterService.__init__ needs Discord credentials, which the
+    # digest helpers do not use
+    service = NewsletterService.__new__(NewsletterService)
+
+    # Test 1: Embed count limit
+    print("\n1. Testing embed count limit...")
+    digests = service._build_digest_messages(_make_articles(25), 10)
+    assert [len(digest) for digest in digests] == [10, 10, 5]
+    print("✓ 25 articles packed into 3 messages")
+
+    # Test 2: Order is preserved
+    print("\n2. Testing article order...")
+    links = [embed["url"] for digest in digests for embed in digest]
+    assert links == [f"https://example.com/articles/{i}" for i in range(25)]
+    print("✓ Article order preserved across messages")
+
+    # Test 3: Character limit
+    print("\n3. Testing character limit...")
+    articles = _make_articles(10, summary="x" * 5000)
+    for article in articles:
+        article["feed_name"] = "y" * 1000
+    digests = service._build_digest_messages(articles, MAX_EMBEDS_PER_MESSAGE)
+    for digest in digests:
+        assert sum(service._embed_length(embed) for embed in digest) <= (
+            MESSAGE_EMBED_CHARS_LIMIT
+        )
+    assert len(digests) > 1
+    print(f"✓ Long embeds split into {len(digests)} messages")
+
+    # Test 4: HTML is stripped from summaries
+    print("\n4. Testing summary cleanup...")
+    embed = service._build_embed(
+        _make_articles(1, summary="<p>Breaking &amp; <b>new</b></p>")[0]
+    )
+    assert embed["description"] == "Breaking & new"
+    assert embed["footer"]["text"] == "Example Feed"
+    print("✓ Summary HTML stripped")
+
+    print("\n✅ All digest batching tests passed!")
+
+
+def test_channel_config():
+    """Test per-channel configuration loading."""
+
+    print("\n\nTesting Channel Configuration...")
+
+    config = FeedsConfig.from_yaml()
+    for channel in config.channels:
+        assert 1 <= channel.digest_size <= MAX_EMBEDS_PER_MESSAGE
+    print(f"✓ Loaded {len(config.channels)} channel configuration(s)")
+
+    default = config.get_channel_config("not-a-configured-channel")
+    assert default.digest is False
+    print("✓ Unconfigured channels default to one message per article")
+
+    print("\n✅ Channel configuration tests passed!")
+
+
+def test_failed_channel_checkpointed():
+    """Test that a failed channel's articles are kept for the next run."""
+
+    print("\n\nTesting Failed Channel Checkpoint...")
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+    service = NewsletterService(
+        parameter_store_client=ps_client, feeds_config=FeedsConfig(feeds=[])
+    )
+    service.discord_service = Mock()
+    service.discord_service.get_channel_id.side_effect = lambda name, deadline: {
+        "security-news": "1"
+    }[name]
+    service.discord_service.check_messages_in_discord.side_effect = (
+        lambda links, channel_id, deadline: links
+    )
+
+    pending = _make_articles(2)
+    pending[1]["link"] = "https://example.com/other"
+    pending[1]["channel_name"] = "missing-channel"
+    unsent = service.publish_latest_articles(pending_articles=pending)
+
+    assert [article["link"] for article in unsent] == ["https://example.com/other"]
+    assert service.discord_service.send_message_to_channel.call_count == 1
+    print("✓ Articles of the failed channel were returned as unsent")
+
+    db_client = Mock()
+    with patch.dict(os.environ, {"DYNAMODB_TABLE_NAME": ""}):
+        assert lambda_handler.newsletter_dynamodb_client(db_client) is None
+    with patch.dict(os.environ, {"DYNAMODB_TABLE_NAME": "herald"}):
+        assert lambda_handler.newsletter_dynamodb_client(db_client) is db_client
+    print("✓ Newsletter runs only use DynamoDB when a table is configured")
+
+
+if __name__ == "__main__":
+    test_digest_batching()
+    test_channel_config()
+    test_failed_channel_checkpointed()
@@ -0,0 +1,105 @@
+"""
+Simple test to validate the Bloom filter of links posted to each channel.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+from models import ChannelConfig
+from services.newsletter import NewsletterService
+from utils.bloom import BloomFilter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _article(number: int) -> dict:
+    return {
+        "title": f"Article {number}",
+        "link": f"https://example.com/articles/{number}",
+        "original_link": f"https://example.com/articles/{number}",
+        "channel_name": "security-news",
+    }
+
+
+def _make_service() -> NewsletterService:
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+    service = NewsletterService(
+        parameter_store_client=ps_client, posted_links_filter=True
+    )
+    service.discord_service = Mock()
+    service.discord_service.get_channel_id.return_value = "777"
+    return service
+
+
+def test_bloom_filter():
+    """Test membership, sizing and serialization of the Bloom filter."""
+
+    print("Testing Bloom Filter...")
+
+    posted = BloomFilter.for_capacity(1000, 0.01)
+    links = [f"https://example.com/articles/{i}" for i in range(1000)]
+    posted.update(links)
+    assert all(link in posted for link in links)
+    print("✓ Every added link is found")
+
+    false_positives = sum(
+        f"https://example.com/other/{i}" in posted for i in range(10000)
+    )
+    assert false_positives < 300
+    print(f"✓ {false_positives} false positives in 10000 lookups")
+
+    restored = BloomFilter.from_bytes(posted.to_bytes())
+    assert restored.count == 1000 and all(link in restored for link in links)
+    assert len(posted.to_bytes()) < 1300
+    print(f"✓ Round-tripped through a {len(posted.to_bytes())}-byte blob")
+
+    try:
+        BloomFilter.from_bytes(b"not a filter")
+        assert False, "Expected ValueError"
+    except ValueError:
+        print("✓ Invalid blobs are rejected")
+
+
+def test_history_fetch_skipped():
+    """Test that the channel history is only fetched for links that may be posted."""
+
+    print("\nTesting Posted-Links Filter...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patch.dict(os.environ, {"CACHE_DIR": directory}):
+            service = _make_service()
+        discord = service.discord_service
+        config = ChannelConfig(name="security-news")
+
+        # No filter yet: the history is read and seeds the filter
+        discord.list_channel_links.return_value = {_article(1)["link"]}
+        service._publish_to_channel([_article(1), _article(2)], config)
+        assert discord.list_channel_links.call_count == 1
+        sent = [call.args[1] for call in discord.send_message_to_channel.call_args_list]
+        assert sent == [_article(2)["link"]]
+        print("✓ The first run read the history and sent the new article")
+
+        # Only new links: the filter answers without reading the channel
+        service._publish_to_channel([_article(3), _article(4)], config)
+        assert discord.list_channel_links.call_count == 1
+        assert discord.send_message_to_channel.call_count == 3
+        print("✓ New links were sent without fetching the history")
+
+        # A link that may have been posted is confirmed against the history
+        discord.list_channel_links.return_value = {_article(3)["link"]}
+        service._publish_to_channel([_article(3), _article(5)], config)
+        assert discord.list_channel_links.call_count == 2
+        sent = [call.args[1] for call in discord.send_message_to_channel.call_args_list]
+        assert sent[-1] == _article(5)["link"] and sent.count(_article(3)["link"]) == 1
+        print("✓ A possible positive fell back to the exact history check")
+
+
+if __name__ == "__main__":
+    test_bloom_filter()
+    test_history_fetch_skipped()
@@ -0,0 +1,171 @@
+"""
+Simple test to validate Discord rate-limit bucket tracking.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import sys
+import os
+import logging
+import json
+import tempfile
+import time
+from unittest.mock import Mock
+
+# Add app directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+
+from services.discord import DiscordService
+from utils.cache import DiskTier, TieredCache
+from utils.rate_limit import RateLimiter, route_key
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_route_keys():
+    """Test that routes are keyed by their major parameter."""
+
+    print("Testing Route Keys...")
+
+    base = "https://discord.com/api/v10"
+    channel_a = f"{base}/channels/111111111111111111/messages"
+    channel_b = f"{base}/channels/222222222222222222/messages"
+    assert route_key("POST", channel_a) != route_key("POST", channel_b)
+    print("✓ Each channel has its own route")
+
+    users_a = (
+        f"{base}/guilds/333333333333333333/scheduled-events/444444444444444444/users"
+    )
+    users_b = (
+        f"{base}/guilds/333333333333333333/scheduled-events/555555555555555555/users"
+    )
+    assert route_key("GET", users_a) == route_key("GET", users_b)
+    print("✓ Minor parameters share a route")
+
+    assert route_key("GET", channel_a) == route_key(
+        "GET", "http://127.0.0.1:8080/api/v10/channels/111111111111111111/messages"
+    )
+    print("✓ Route keys do not depend on the base URL")
+
+    print("\n✅ All route key tests passed!")
+
+
+def test_bucket_tracking():
+    """Test that exhausted buckets block only their own route."""
+
+    print("\n\nTesting Bucket Tracking...")
+
+    limiter = RateLimiter()
+    limiter.update(
+        "POST /channels/1/messages",
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "0.2"},
+    )
+
+    start = time.monotonic()
+    assert limiter.acquire("POST /channels/2/messages") == 0.0
+    assert time.monotonic() - start < 0.1
+    limiter.update("POST /channels/2/messages", {})
+    print("✓ Other routes are not delayed")
+
+    waited = limiter.acquire("POST /channels/1/messages")
+    assert waited > 0.0
+    print(f"✓ Exhausted route waited {waited:.2f}s for its reset")
+
+    limiter.update(
+        "GET /gateway",
+        {"Retry-After": "0.2", "X-RateLimit-Global": "true"},
+        status_code=429,
+    )
+    assert limiter.acquire("POST /channels/2/messages") > 0.0
+    print("✓ Global rate limit delays every route")
+
+    print("\n✅ All bucket tracking tests passed!")
+
+
+def test_unknown_bucket_probe():
+    """Test that an unknown bucket lets one request through until it learns its budget."""
+
+    print("\n\nTesting Unknown Bucket Probe...")
+
+    limiter = RateLimiter()
+    route = "POST /users/@me/channels"
+    assert limiter.try_acquire(route) == 0.0
+    assert limiter.try_acquire(route) > 0.0
+    print("✓ Second request waits while the first is in flight")
+
+    limiter.update(
+        route, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "1"}
+    )
+    assert limiter.try_acquire(route) == 0.0
+    assert limiter.try_acquire(route) == 0.0
+    print("✓ Known budget lets requests through concurrently")
+
+    limiter = RateLimiter()
+    limiter.try_acquire(route)
+    limiter.release(route)
+    assert limiter.try_acquire(route) == 0.0
+    print("✓ Released probe frees the bucket")
+
+    print("\n✅ All unknown bucket probe tests passed!")
+
+
+def test_state_persistence():
+    """Test that the limits known at the end of a run seed the next run."""
+
+    print("\n\nTesting Rate-Limit State Persistence...")
+
+    limiter = RateLimiter()
+    limiter.update(
+        "POST /channels/1/messages",
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "5"},
+    )
+    limiter.update(
+        "GET /guilds/1/channels",
+        {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset-After": "0.0"},
+    )
+    state = json.loads(json.dumps(limiter.export_state()))
+    assert list(state["buckets"]) == ["POST /channels/1/messages"]
+    print("✓ Only limits still in effect are exported")
+
+    restored = RateLimiter()
+    assert restored.load_state(state) == 1
+    assert restored.try_acquire("POST /channels/1/messages") > 0.0
+    assert restored.try_acquire("POST /channels/2/messages") == 0.0
+    print("✓ A new limiter waits for the exhausted bucket it loaded")
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        def new_service():
+            cache = TieredCache("discord", tiers=[DiskTier(directory)])
+            return DiscordService(
+                parameter_store_client=ps_client,
+                session=Mock(),
+                cache=cache,
+                rate_limit_state=True,
+            )
+
+        first = new_service()
+        first.rate_limiter.update(
+            "GET /gateway",
+            {"Retry-After": "5", "X-RateLimit-Global": "true"},
+            status_code=429,
+        )
+        first.save_rate_limit_state()
+
+        second = new_service()
+        second.load_rate_limit_state()
+        assert second.rate_limiter.try_acquire("POST /channels/2/messages") > 0.0
+        print("✓ The global cooldown carried over to the next run's service")
+
+    print("\n✅ All rate-limit state tests passed!")
+
+
+if __name__ == "__main__":
+    test_route_keys()
+    test_bucket_tracking()
+    test_unknown_bucket_probe()
+    test_state_persistence()
@@ -0,0 +1,197 @@
+"""
+Simple test to validate claiming reminders with conditional writes before sending.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import requests
+from botocore.exceptions import ClientError
+
+from clients.dynamodb import (
+    REMINDER_CLAIM_LEASE_SECONDS,
+    REMINDER_TTL_SECONDS,
+    DynamoDBClient,
+)
+from services.discord import DiscordService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+class FakeDynamoDB:
+    """Low-level DynamoDB client that honours the claim and release conditions."""
+
+    def __init__(self):
+        self.items = {}
+        self.lock = threading.Lock()
+
+    def put_item(self, TableName, Item, ConditionExpression=None, **kwargs):
+        key = Item["reminder_key"]["S"]
+        with self.lock:
+            existing = self.items.get(key)
+            if ConditionExpression and existing:
+                now = int(kwargs["ExpressionAttributeValues"][":now"]["N"])
+                if int(existing["ttl"]["N"]) >= now:
+                    raise self._check_failed("PutItem")
+            self.items[key] = dict(Item)
+
+    def delete_item(self, TableName, Key, ConditionExpression=None, **kwargs):
+        key = Key["reminder_key"]["S"]
+        with self.lock:
+            existing = self.items.get(key)
+            if not existing or existing["status"]["S"] != "claimed":
+                raise self._check_failed("DeleteItem")
+            del self.items[key]
+
+    def batch_get_item(self, RequestItems):
+        return {"Responses": {"test": []}, "UnprocessedKeys": {}}
+
+    @staticmethod
+    def _check_failed(operation):
+        return ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, operation
+        )
+
+
+def _make_db_client(client):
+    db_client = DynamoDBClient.__new__(DynamoDBClient)
+    db_client.table_name = "test"
+    db_client.client = client
+    return db_client
+
+
+def _make_service(db_client, session):
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+    return DiscordService(
+        parameter_store_client=ps_client,
+        dynamodb_client=db_client,
+        session=session,
+        rate_limit_proxy=True,
+        concurrency=1,
+    )
+
+
+def _response(status_code):
+    response = Mock(status_code=status_code, headers={})
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    response.json.return_value = {"id": "555"}
+    return response
+
+
+def test_claim_reminder():
+    """Test that a reminder can be claimed once, released, and not released once delivered."""
+
+    print("Testing Reminder Claims...")
+
+    db_client = _make_db_client(FakeDynamoDB())
+    assert db_client.claim_reminder("42", "7", "1h")
+    assert not db_client.claim_reminder("42", "7", "1h")
+    print("✓ A second claim of the same reminder fails")
+
+    assert db_client.release_reminder_claim("42", "7", "1h")
+    assert db_client.claim_reminder("42", "7", "1h")
+    print("✓ A released claim can be claimed again")
+
+    assert db_client.record_reminder_sent("42", "7", "1h")
+    assert not db_client.release_reminder_claim("42", "7", "1h")
+    assert not db_client.claim_reminder("42", "7", "1h")
+    print("✓ A delivered reminder is neither released nor claimed again")
+
+
+def test_claim_lease():
+    """Test that an abandoned claim expires long before a delivered reminder."""
+
+    print("\nTesting Reminder Claim Lease...")
+
+    db_client = _make_db_client(FakeDynamoDB())
+    now = time.time()
+    assert db_client.claim_reminder("42", "7", "1h")
+
+    # The run that claimed the reminder crashed before sending it
+    with patch(
+        "clients.dynamodb.time.time",
+        return_value=now + REMINDER_CLAIM_LEASE_SECONDS + 1,
+    ):
+        assert db_client.claim_reminder("42", "7", "1h")
+        print("✓ An abandoned claim can be taken over once its lease ends")
+
+        assert db_client.record_reminder_sent("42", "7", "1h")
+
+    with patch(
+        "clients.dynamodb.time.time", return_value=now + REMINDER_TTL_SECONDS - 60
+    ):
+        assert not db_client.claim_reminder("42", "7", "1h")
+    print("✓ Delivery extended the record to the full duplicate window")
+
+
+def test_concurrent_shards_send_once():
+    """Test that two services racing over the same subscribers send each DM once."""
+
+    print("\nTesting Concurrent Shards...")
+
+    db_client = _make_db_client(FakeDynamoDB())
+    sessions = [Mock(), Mock()]
+    for session in sessions:
+        session.request.return_value = _response(200)
+    users = [{"id": str(user_id), "username": str(user_id)} for user_id in range(20)]
+
+    # Both services pass the batched pre-check before either has sent anything
+    services = [_make_service(db_client, session) for session in sessions]
+    work = [
+        service._filter_unsent_reminders("42", "Office Hours", users)
+        for service in services
+    ]
+    threads = [
+        threading.Thread(
+            target=service._process_reminders, args=(items, service._auth_headers())
+        )
+        for service, items in zip(services, work)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Each DM is one request to open the channel and one to send the message
+    sent = sum(session.request.call_count for session in sessions) // 2
+    assert sent == len(users)
+    print(f"✓ {sent} DMs sent for {len(users)} subscribers")
+
+
+def test_failed_send_releases_claim():
+    """Test that a DM that fails is released so the next run retries it."""
+
+    print("\nTesting Failed Sends Release Their Claim...")
+
+    client = FakeDynamoDB()
+    db_client = _make_db_client(client)
+    session = Mock()
+    session.request.side_effect = [_response(200), _response(404)]
+    service = _make_service(db_client, session)
+
+    reminder = {
+        "event_id": "42",
+        "event_name": "Office Hours",
+        "user_id": "7",
+        "username": "seven",
+    }
+    service._send_reminder(reminder, service._auth_headers())
+    assert client.items == {}
+    assert db_client.claim_reminder("42", "7", "1h")
+    print("✓ The claim was released after the DM failed")
+
+
+if __name__ == "__main__":
+    test_claim_reminder()
+    test_claim_lease()
+    test_concurrent_shards_send_once()
+    test_failed_send_releases_claim()
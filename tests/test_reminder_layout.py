@@ -0,0 +1,130 @@
+"""
+Simple test to validate the event-partitioned reminder table layout.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import time
+from unittest.mock import Mock, patch
+
+from clients.dynamodb import DynamoDBClient
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _make_db_client(client, legacy_reads=True):
+    with patch("clients.dynamodb.create_client", return_value=client):
+        return DynamoDBClient(
+            table_name="reminders",
+            reminders_table_name="reminders-by-event",
+            legacy_reads=legacy_reads,
+        )
+
+
+def _item(user_id, ttl_offset=60):
+    return {"sk": {"S": user_id}, "ttl": {"N": str(int(time.time()) + ttl_offset)}}
+
+
+def test_partitioned_writes():
+    """Test that reminder records are keyed by event partition and user."""
+
+    print("Testing Partitioned Reminder Writes...")
+
+    client = Mock()
+    db_client = _make_db_client(client)
+
+    assert db_client.claim_reminder("42", "7", "1h")
+    kwargs = client.put_item.call_args.kwargs
+    assert kwargs["TableName"] == "reminders-by-event"
+    assert kwargs["Item"]["pk"] == {"S": "42#1h"}
+    assert kwargs["Item"]["sk"] == {"S": "7"}
+    assert "reminder_key" not in kwargs["Item"]
+    print("✓ Claims are written to the partitioned table")
+
+    assert db_client.record_reminder_sent("42", "7", "1h")
+    assert client.put_item.call_args.kwargs["Item"]["status"] == {"S": "delivered"}
+    assert db_client.release_reminder_claim("42", "7", "1h")
+    assert client.delete_item.call_args.kwargs["Key"] == {
+        "pk": {"S": "42#1h"},
+        "sk": {"S": "7"},
+    }
+    print("✓ Deliveries and releases use the same key")
+
+    assert db_client.save_checkpoint("newsletter", [])
+    assert client.put_item.call_args.kwargs["TableName"] == "reminders"
+    print("✓ Checkpoints stay in the main table")
+
+
+def test_query_lookup():
+    """Test that one paginated Query finds every user already reminded."""
+
+    print("\nTesting Query Lookup...")
+
+    client = Mock()
+    client.query.side_effect = [
+        {
+            "Items": [_item("1"), _item("2")],
+            "LastEvaluatedKey": {"pk": {"S": "42#1h"}, "sk": {"S": "2"}},
+        },
+        # Expired records and users who are no longer subscribed are ignored
+        {"Items": [_item("3", ttl_offset=-60), _item("9")]},
+    ]
+    db_client = _make_db_client(client, legacy_reads=False)
+
+    sent = db_client.batch_check_reminders_sent("42", ["1", "2", "3", "4"], "1h")
+    assert sent == {"1", "2"}
+    print("✓ Sent users are the subscribers found in the event's partition")
+
+    first, second = client.query.call_args_list
+    assert first.kwargs["TableName"] == "reminders-by-event"
+    assert first.kwargs["ExpressionAttributeValues"] == {":pk": {"S": "42#1h"}}
+    assert "ExclusiveStartKey" not in first.kwargs
+    assert second.kwargs["ExclusiveStartKey"] == {
+        "pk": {"S": "42#1h"},
+        "sk": {"S": "2"},
+    }
+    client.batch_get_item.assert_not_called()
+    print("✓ Pages were followed and no point reads were made")
+
+
+def test_legacy_reads():
+    """Test that users missing from the partition are checked in the main table."""
+
+    print("\nTesting Legacy Reads...")
+
+    client = Mock()
+    client.query.return_value = {"Items": [_item("1")]}
+    client.batch_get_item.return_value = {
+        "Responses": {
+            "reminders": [
+                {
+                    "reminder_key": {"S": "42:3:1h"},
+                    "ttl": {"N": str(int(time.time()) + 60)},
+                }
+            ]
+        },
+        "UnprocessedKeys": {},
+    }
+    db_client = _make_db_client(client)
+
+    sent = db_client.batch_check_reminders_sent("42", ["1", "2", "3"], "1h")
+    assert sent == {"1", "3"}
+    keys = client.batch_get_item.call_args.kwargs["RequestItems"]["reminders"]["Keys"]
+    assert keys == [
+        {"reminder_key": {"S": "42:2:1h"}},
+        {"reminder_key": {"S": "42:3:1h"}},
+    ]
+    print("✓ Only users missing from the partition were read from the main table")
+
+    client.get_item.side_effect = [{}, {"Item": _item("2")}]
+    assert db_client.check_reminder_sent("42", "2", "1h")
+    tables = [call.kwargs["TableName"] for call in client.get_item.call_args_list]
+    assert tables == ["reminders-by-event", "reminders"]
+    print("✓ Single checks fall back to the main table")
+
+
+if __name__ == "__main__":
+    test_partitioned_writes()
+    test_query_lookup()
+    test_legacy_reads()
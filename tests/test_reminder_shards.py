@@ -0,0 +1,117 @@
+"""
+Simple test to validate reminder sharding through a local invoke stand-in.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import json
+import logging
+from unittest.mock import Mock, patch
+
+import lambda_handler
+from clients.lambda_invoker import LocalInvoker
+from services.discord import DiscordService
+from services.discord_async import AsyncDiscordService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+USER_COUNT = 250
+
+
+def _fake_discord_request(self, method, url, headers, deadline=None, **kwargs):
+    """Serve paginated scheduled-event users like the Discord API."""
+    after = int(url.split("after=")[1]) if "after=" in url else -1
+    ids = [i for i in range(USER_COUNT) if i > after][:100]
+    page = [{"user": {"id": str(i), "username": f"user{i}"}} for i in ids]
+    return Mock(json=Mock(return_value=page))
+
+
+def _fake_async_send_dm(sent):
+    """Record DMs sent through the async service."""
+
+    async def send_dm(self, user_id, message):
+        sent.append(user_id)
+
+    return send_dm
+
+
+def test_reminder_sharding():
+    """Test that a large subscriber list is split into shard invocations."""
+
+    print("Testing Reminder Sharding...")
+
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+
+    # Users 0-9 were already reminded by an earlier run
+    db_client = Mock()
+    db_client.batch_check_reminders_sent.side_effect = (
+        lambda event_id, user_ids, reminder_type: {
+            user_id for user_id in user_ids if int(user_id) < 10
+        }
+    )
+    db_client.record_reminder_sent.return_value = True
+    db_client.batch_check_undeliverable_users.return_value = set()
+
+    sent = []
+    invoker = LocalInvoker(lambda_handler.main)
+
+    with (
+        patch.object(DiscordService, "_make_request_with_retry", _fake_discord_request),
+        patch.object(
+            DiscordService,
+            "_send_dm",
+            lambda self, user_id, message, headers, deadline=None: sent.append(user_id),
+        ),
+        patch.object(AsyncDiscordService, "send_dm", _fake_async_send_dm(sent)),
+        patch.object(
+            lambda_handler, "initialize_clients", return_value=(ps_client, db_client)
+        ),
+    ):
+        coordinator = DiscordService(
+            parameter_store_client=ps_client,
+            dynamodb_client=db_client,
+            invoker=invoker,
+            shard_size=100,
+        )
+
+        # Test 1: Users are listed across pages and split into shards
+        print("\n1. Testing shard fan-out...")
+        coordinator._expand_event({"event_id": "42", "event_name": "Event"})
+        shard_sizes = [len(payload["user_ids"]) for payload, _ in invoker.invocations]
+        assert shard_sizes == [100, 100, 50]
+        print(f"✓ {USER_COUNT} users split into shards of {shard_sizes}")
+
+        # Test 2: Each shard ran through the Lambda handler
+        print("\n2. Testing shard handler...")
+        for payload, response in invoker.invocations:
+            assert payload["handler_type"] == "reminder_shard"
+            assert response["statusCode"] == 200
+            assert json.loads(response["body"])["handed_off"] == 0
+        print("✓ All shards handled by reminder_shard")
+
+        # Test 3: Each shard deduplicated its own users in one batch
+        print("\n3. Testing batched deduplication...")
+        assert db_client.batch_check_reminders_sent.call_count == 3
+        assert sorted(sent, key=int) == [str(i) for i in range(10, USER_COUNT)]
+        print(f"✓ {len(sent)} reminders sent, already-reminded users skipped")
+
+        # Test 4: Invalid shard payloads are rejected
+        print("\n4. Testing invalid shard payload...")
+        response = lambda_handler.main(
+            {"handler_type": "reminder_shard", "event_id": "42"},
+            Mock(
+                aws_request_id="test",
+                memory_limit_in_mb=512,
+                get_remaining_time_in_millis=Mock(return_value=300000),
+            ),
+        )
+        assert response["statusCode"] == 400
+        print("✓ Missing user_ids rejected")
+
+    print("\n✅ All reminder sharding tests passed!")
+
+
+if __name__ == "__main__":
+    test_reminder_sharding()
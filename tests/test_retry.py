@@ -0,0 +1,186 @@
+"""
+Simple test to validate the retry policy, circuit breaker and their use for Discord requests.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import random
+from unittest.mock import Mock, patch
+
+import requests
+
+from services.discord import DiscordService
+from utils.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _make_service(session, **kwargs):
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+    return DiscordService(
+        parameter_store_client=ps_client,
+        session=session,
+        rate_limit_proxy=True,
+        **kwargs,
+    )
+
+
+def _response(status_code):
+    response = Mock(status_code=status_code, headers={})
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    response.json.return_value = {"id": "555"}
+    return response
+
+
+def test_retry_policy():
+    """Test error classification, jittered backoff and the deadline budget."""
+
+    print("Testing Retry Policy...")
+
+    policy = RetryPolicy(max_attempts=5, base_delay=0.5, rng=random.Random(1))
+    assert policy.retry_delay(0, 403) is None
+    assert policy.retry_delay(0, 404) is None
+    print("✓ Client errors are not retried")
+    assert policy.retry_delay(0, 503) is not None
+    assert policy.retry_delay(0, None) is not None
+    assert policy.retry_delay(4, 503) is None
+    print("✓ Server and transport errors are retried up to max_attempts")
+
+    delay = None
+    for _ in range(20):
+        previous = delay
+        delay = policy.backoff(previous)
+        assert 0.5 <= delay <= min(16.0, max(0.5, (previous or 0.5) * 3))
+    print("✓ Backoff stays within the decorrelated jitter bounds")
+
+    assert policy.retry_delay(0, 429, retry_after=2.0) == 2.0
+    deadline = Mock()
+    deadline.time_left.return_value = 1.0
+    assert policy.retry_delay(0, 429, deadline=deadline, retry_after=2.0) is None
+    print("✓ Retries that would wait past the deadline are skipped")
+
+
+def test_circuit_breaker():
+    """Test that a route's circuit opens, allows a trial and closes again."""
+
+    print("\nTesting Circuit Breaker...")
+
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=3, reset_timeout=10, clock=lambda: now[0]
+    )
+    for _ in range(3):
+        assert breaker.allow("GET /a")
+        breaker.record_failure("GET /a")
+    assert not breaker.allow("GET /a")
+    assert breaker.allow("GET /b")
+    print("✓ The circuit opens after 3 failures, for that route only")
+
+    now[0] = 10.0
+    assert breaker.allow("GET /a")
+    assert not breaker.allow("GET /a")
+    breaker.record_success("GET /a")
+    assert breaker.allow("GET /a")
+    print("✓ One trial is let through after the reset timeout and closes the circuit")
+
+
+def test_closed_dm_fails_fast():
+    """Test that a 403 for a user with closed DMs is not retried."""
+
+    print("\nTesting Closed DM Fails Fast...")
+
+    session = Mock()
+    session.request.side_effect = [_response(200), _response(403)]
+    service = _make_service(session)
+    sleeps = []
+
+    with patch("services.discord.time.sleep", sleeps.append):
+        try:
+            service._send_dm("42", "hello", service._auth_headers())
+            assert False, "Expected HTTPError"
+        except requests.HTTPError:
+            pass
+
+    assert session.request.call_count == 2
+    assert sleeps == []
+    print("✓ The DM failed after one attempt without sleeping")
+
+
+def test_server_errors_open_circuit():
+    """Test that repeated server errors are retried, then fail fast."""
+
+    print("\nTesting Server Errors Open The Circuit...")
+
+    session = Mock()
+    session.request.return_value = _response(502)
+    service = _make_service(
+        session,
+        retry_policy=RetryPolicy(max_attempts=3, rng=random.Random(1)),
+        circuit_breaker=CircuitBreaker(failure_threshold=3),
+    )
+
+    with patch("services.discord.time.sleep") as sleep:
+        try:
+            service.list_scheduled_events()
+            assert False, "Expected HTTPError"
+        except requests.HTTPError:
+            pass
+        assert session.request.call_count == 3
+        assert sleep.call_count == 2
+        print("✓ The 502 was retried until max_attempts")
+
+        try:
+            service.list_scheduled_events()
+            assert False, "Expected CircuitOpenError"
+        except CircuitOpenError:
+            pass
+        assert session.request.call_count == 3
+        print("✓ The next request failed fast without reaching Discord")
+
+
+def test_deadline_per_call():
+    """Test that each request's retries are bounded by the deadline it was given."""
+
+    print("\nTesting Deadline Per Call...")
+
+    session = Mock()
+    session.request.return_value = _response(502)
+    service = _make_service(
+        session,
+        retry_policy=RetryPolicy(max_attempts=3, rng=random.Random(1)),
+        circuit_breaker=CircuitBreaker(failure_threshold=10),
+    )
+    deadline = Mock()
+    deadline.time_left.return_value = 0.0
+
+    with patch("services.discord.time.sleep") as sleep:
+        try:
+            service.send_message_to_channel("1", "hello", deadline)
+            assert False, "Expected HTTPError"
+        except requests.HTTPError:
+            pass
+        assert session.request.call_count == 1
+        print("✓ A send past its deadline was not retried")
+
+        try:
+            service.send_message_to_channel("2", "hello")
+            assert False, "Expected HTTPError"
+        except requests.HTTPError:
+            pass
+        assert session.request.call_count == 4
+        assert sleep.call_count == 2
+        print("✓ The deadline did not carry over to the next call")
+
+
+if __name__ == "__main__":
+    test_retry_policy()
+    test_circuit_breaker()
+    test_closed_dm_fails_fast()
+    test_server_errors_open_circuit()
+    test_deadline_per_call()
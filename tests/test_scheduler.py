@@ -0,0 +1,96 @@
+"""
+Simple test to validate the interval job scheduler used by the local runner.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import threading
+
+from utils.scheduler import JobScheduler
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_job_intervals():
+    """Test that jobs run immediately and then once per interval."""
+
+    print("Testing Job Intervals...")
+
+    clock = FakeClock()
+    scheduler = JobScheduler(clock=clock)
+    runs = []
+    scheduler.add_job("fast", 60, lambda: runs.append("fast"))
+    scheduler.add_job("slow", 3600, lambda: runs.append("slow"))
+
+    # Test 1: Every job runs on the first pass
+    print("\n1. Testing first run...")
+    started = scheduler.run_pending()
+    scheduler.join()
+    assert sorted(job.name for job in started) == ["fast", "slow"]
+    print("✓ All jobs started immediately")
+
+    # Test 2: Only jobs whose interval elapsed run again
+    print("\n2. Testing intervals...")
+    clock.now += 30
+    assert scheduler.run_pending() == []
+    clock.now += 30
+    assert [job.name for job in scheduler.run_pending()] == ["fast"]
+    scheduler.join()
+    assert sorted(runs) == ["fast", "fast", "slow"]
+    print("✓ Jobs ran at their own intervals")
+
+    # Test 3: A job that fell behind is not run repeatedly to catch up
+    print("\n3. Testing catch-up...")
+    clock.now += 600
+    assert [job.name for job in scheduler.run_pending()] == ["fast"]
+    scheduler.join()
+    assert scheduler.run_pending() == []
+    print("✓ Missed runs collapsed into one")
+
+    print("\n✅ All job interval tests passed!")
+
+
+def test_overlapping_runs_skipped():
+    """Test that a job is not started again while its previous run is in progress."""
+
+    print("\n\nTesting Overlapping Runs...")
+
+    clock = FakeClock()
+    scheduler = JobScheduler(clock=clock)
+    release = threading.Event()
+    runs = []
+
+    def slow_job():
+        runs.append(1)
+        release.wait(5)
+
+    scheduler.add_job("slow", 60, slow_job)
+    scheduler.run_pending()
+    clock.now += 60
+    assert scheduler.run_pending() == []
+    release.set()
+    scheduler.join()
+    assert runs == [1]
+    print("✓ Overlapping run skipped")
+
+    clock.now += 60
+    assert len(scheduler.run_pending()) == 1
+    scheduler.join()
+    assert runs == [1, 1]
+    print("✓ Job runs again once the previous run finished")
+
+    print("\n✅ All overlapping run tests passed!")
+
+
+if __name__ == "__main__":
+    test_job_intervals()
+    test_overlapping_runs_skipped()
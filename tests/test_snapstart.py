@@ -0,0 +1,114 @@
+"""
+Simple test to validate the SnapStart before-snapshot and after-restore hooks.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import random
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import lambda_handler
+from utils import snapstart
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_snapstart_hooks():
+    """Test that the snapshot is primed without secrets and restores are refreshed."""
+
+    print("Testing SnapStart Hooks...")
+
+    ps_client, db_client = Mock(), Mock()
+
+    def initialize_clients():
+        lambda_handler.parameter_store_client = ps_client
+        lambda_handler.dynamodb_client = db_client
+        return ps_client, db_client
+
+    # Test 1: The snapshot holds modules, clients and config, but no secrets
+    print("\n1. Testing before-snapshot hook...")
+    lambda_handler.discord_service = Mock()
+    imported = []
+    with (
+        patch.object(lambda_handler, "initialize_clients", initialize_clients),
+        patch.object(
+            lambda_handler,
+            "import_modules",
+            lambda root, exclude: imported.extend(
+                snapstart.import_modules(root, exclude)
+            )
+            or imported,
+        ),
+    ):
+        snapstart.run_before_snapshot()
+
+    assert "services.newsletter" in imported
+    assert lambda_handler.feeds_config is not None
+    print("✓ Application modules and the feed config were loaded")
+    assert not set(imported) & set(lambda_handler.SNAPSHOT_EXCLUDED_MODULES)
+    print("✓ Gateway and local runner modules were not imported")
+    ps_client.clear_cache.assert_called_once()
+    assert lambda_handler.discord_service is None
+    assert lambda_handler.newsletter_service is None
+    print("✓ Cached secrets and services were left out of the snapshot")
+
+    # Test 2: A restore reseeds, drops restored connections and warms up again
+    print("\n2. Testing after-restore hook...")
+    random.seed(0)
+    restored = random.random()
+    discord_service = Mock()
+    lambda_handler.discord_service = discord_service
+    with patch.object(lambda_handler, "warm_up") as warm_up:
+        random.seed(0)
+        snapstart.run_after_restore()
+    assert random.random() != restored
+    print("✓ The random module was reseeded")
+    discord_service.session.close.assert_called_once()
+    assert lambda_handler.discord_service is None
+    assert ps_client.clear_cache.call_count == 2
+    warm_up.assert_called_once_with(lambda_handler.DEFAULT_WARMUP_BUDGET_MS)
+    print("✓ Restored connections were closed and secrets refetched by warm_up()")
+
+    lambda_handler.parameter_store_client = None
+    lambda_handler.dynamodb_client = None
+
+
+def test_import_modules_failure():
+    """Test that a module failing to import is skipped instead of aborting."""
+
+    print("\nTesting Import Modules Failure...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        (root / "snapshot_ok.py").write_text("")
+        (root / "snapshot_broken.py").write_text("raise RuntimeError('no token')\n")
+        (root / "snapshot_gateway.py").write_text("raise ImportError('no discord')\n")
+
+        with patch.object(sys, "path", [directory, *sys.path]):
+            imported = snapstart.import_modules(root, exclude=["snapshot_gateway"])
+
+    assert imported == ["snapshot_ok"]
+    assert "snapshot_gateway" not in sys.modules
+    print("✓ The failing module was skipped and the excluded one never imported")
+
+
+def test_snap_start_detection():
+    """Test that SnapStart INIT is detected from the environment."""
+
+    print("\nTesting SnapStart Detection...")
+
+    with patch.dict("os.environ", {"AWS_LAMBDA_INITIALIZATION_TYPE": "snap-start"}):
+        assert snapstart.is_snap_start()
+    with patch.dict("os.environ", {"AWS_LAMBDA_INITIALIZATION_TYPE": "on-demand"}):
+        assert not snapstart.is_snap_start()
+    print("✓ Only snap-start initialization is detected")
+
+
+if __name__ == "__main__":
+    test_snapstart_hooks()
+    test_import_modules_failure()
+    test_snap_start_detection()
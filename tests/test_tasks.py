@@ -0,0 +1,90 @@
+"""
+Simple test to validate the layer pruning used by optimized builds.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from invoke import Config, Context
+
+# Add the repository root to Python path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import tasks
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def test_top_level_module():
+    """Test that site-packages entries map to the module they provide."""
+
+    print("Testing Top-Level Module...")
+
+    assert tasks.top_level_module(Path("requests")) == "requests"
+    assert tasks.top_level_module(Path("six.py")) == "six"
+    assert (
+        tasks.top_level_module(Path("_cffi_backend.cpython-313-x86_64-linux-gnu.so"))
+        == "_cffi_backend"
+    )
+    print("✓ Packages, modules and extension modules are named by their import name")
+
+    assert tasks.top_level_module(Path("pydantic_core.libs")) == "pydantic_core"
+    print("✓ Vendored shared libraries belong to their package")
+
+
+def test_prune_unused_packages():
+    """Test that only entries of unused top-level modules are removed."""
+
+    print("\nTesting Prune Unused Packages...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        python_dir = Path(directory)
+        for package in ("requests", "unused", "pydantic_core", "pydantic_core.libs"):
+            (python_dir / package).mkdir()
+            (python_dir / package / "__init__.py").write_text("")
+        (python_dir / "typing_extensions.py").write_text("")
+        (python_dir / "old_module.py").write_text("")
+
+        removed = tasks.prune_unused_packages(
+            python_dir, {"requests", "pydantic_core", "typing_extensions"}
+        )
+
+        assert removed == ["old_module.py", "unused"]
+        assert sorted(entry.name for entry in python_dir.iterdir()) == [
+            "pydantic_core",
+            "pydantic_core.libs",
+            "requests",
+            "typing_extensions.py",
+        ]
+        print(f"✓ Removed {removed}, kept the used packages and their libraries")
+
+
+def test_trace_handler():
+    """Test that the handler trace reports the packages the handler imports."""
+
+    print("\nTesting Handler Trace...")
+
+    import aiohttp
+
+    site_packages = Path(aiohttp.__file__).parent.parent
+    paths = [site_packages, ROOT / "lambda", ROOT / "lambda" / "app"]
+    # pytest captures stdin, so the traced interpreter is not given one
+    context = Context(Config(overrides={"run": {"in_stream": False}}))
+    trace = tasks.trace_handler(context, sys.executable, site_packages, paths)
+
+    for module in ("aiohttp", "boto3", "feedparser", "requests", "yaml"):
+        assert module in trace["modules"], module
+    assert "invoke" not in trace["modules"]
+    assert trace["import_seconds"] > 0
+    print(f"✓ The trace loaded {len(trace['modules'])} top-level module(s)")
+
+
+if __name__ == "__main__":
+    test_top_level_module()
+    test_prune_unused_packages()
+    test_trace_handler()
@@ -0,0 +1,101 @@
+"""
+Simple test to validate the request budget shared by concurrent invocations.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+from botocore.exceptions import ClientError
+
+from clients.dynamodb import DynamoDBClient
+from utils.rate_limit import RateLimiter
+from utils.token_bucket import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    LocalTokenStore,
+    SharedTokenBucket,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _take_all(budget: SharedTokenBucket, priority: str) -> int:
+    taken = 0
+    while budget.try_acquire(priority) == 0.0:
+        taken += 1
+    return taken
+
+
+def test_shared_budget():
+    """Test that invocations sharing a store stay within one budget, by priority."""
+
+    print("Testing Shared Budget...")
+
+    store = LocalTokenStore()
+    newsletter = SharedTokenBucket(store, rate=20, batch_size=5)
+    reminders = SharedTokenBucket(store, rate=20, batch_size=5)
+
+    with patch("utils.token_bucket.time.time", return_value=1000.25):
+        assert _take_all(newsletter, PRIORITY_LOW) == 12
+        print("✓ Low priority stopped at its share of the window")
+
+        assert _take_all(reminders, PRIORITY_HIGH) == 8
+        assert newsletter.try_acquire(PRIORITY_LOW) == 0.75
+        print("✓ High priority used the headroom, then both waited for the next window")
+
+    assert store.reservations < 20
+    print(f"✓ 20 tokens took {store.reservations} store round trips")
+
+    with patch("utils.token_bucket.time.time", return_value=1001.0):
+        assert newsletter.try_acquire(PRIORITY_LOW) == 0.0
+        print("✓ The budget refilled in the next window")
+
+
+def test_rate_limiter_uses_budget():
+    """Test that the rate limiter takes a shared token for every request."""
+
+    print("\nTesting Rate Limiter With Shared Budget...")
+
+    budget = SharedTokenBucket(LocalTokenStore(), rate=2, batch_size=1)
+    limiter = RateLimiter(shared_budget=budget, priority=PRIORITY_HIGH)
+    with patch("utils.token_bucket.time.time", return_value=1000.5):
+        assert limiter.try_acquire("POST /channels/1/messages") == 0.0
+        assert limiter.try_acquire("POST /channels/2/messages") == 0.0
+        assert limiter.try_acquire("POST /channels/3/messages") == 0.5
+    print("✓ Requests on different routes share the global budget")
+
+
+def test_dynamodb_reservation():
+    """Test the conditional counter update and its fail-open handling."""
+
+    print("\nTesting DynamoDB Reservation...")
+
+    db_client = DynamoDBClient.__new__(DynamoDBClient)
+    db_client.table_name = "test"
+    db_client.client = Mock()
+
+    assert db_client.reserve_tokens("discord_global", 1000, 5, 45)
+    kwargs = db_client.client.update_item.call_args.kwargs
+    assert kwargs["Key"] == {"reminder_key": {"S": "rate_budget:discord_global:1000"}}
+    assert kwargs["ExpressionAttributeValues"][":limit"] == {"N": "40"}
+    print("✓ Tokens are added only while the counter stays within the ceiling")
+
+    db_client.client.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+    )
+    assert not db_client.reserve_tokens("discord_global", 1000, 5, 45)
+    print("✓ A spent budget is reported")
+
+    db_client.client.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "UpdateItem"
+    )
+    assert db_client.reserve_tokens("discord_global", 1000, 5, 45)
+    print("✓ Errors do not block requests")
+
+
+if __name__ == "__main__":
+    test_shared_budget()
+    test_rate_limiter_uses_budget()
+    test_dynamodb_reservation()
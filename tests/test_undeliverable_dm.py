@@ -0,0 +1,200 @@
+"""
+Simple test to validate skipping and mentioning users who do not accept DMs.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import json
+import logging
+import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from clients.dynamodb import UNDELIVERABLE_TTL_SECONDS
+from services.discord import (
+    UNDELIVERABLE_RECHECK_SECONDS,
+    DiscordService,
+    is_undeliverable_dm_error,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+CLOSED_DM_USER = "200000000000000001"
+OPEN_DM_USER = "200000000000000002"
+
+
+class FakeSession:
+    """Serve the Discord routes used by reminders; one user rejects DMs."""
+
+    def __init__(self):
+        self.requests = []
+        self.channel_messages = []
+
+    def request(self, method, url, headers=None, timeout=None, **kwargs):
+        self.requests.append((method, url))
+        if url.endswith("/users/@me/channels"):
+            return self._response(200, {"id": f"9{kwargs['json']['recipient_id']}"})
+        if url.endswith("/guilds/1/channels"):
+            return self._response(200, [{"id": "777", "name": "reminders"}])
+        if "/channels/777/" in url:
+            self.channel_messages.append(json.loads(kwargs["data"])["content"])
+            return self._response(200, {"id": "1"})
+        if f"/channels/9{CLOSED_DM_USER}/" in url:
+            return self._response(
+                403, {"message": "Cannot send messages to this user", "code": 50007}
+            )
+        return self._response(200, {"id": "2"})
+
+    @staticmethod
+    def _response(status_code, payload):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(payload).encode()
+        return response
+
+
+def _make_service(session, db_client, fallback_channel="reminders"):
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "1"
+    return DiscordService(
+        parameter_store_client=ps_client,
+        dynamodb_client=db_client,
+        session=session,
+        rate_limit_proxy=True,
+        concurrency=1,
+        fallback_channel=fallback_channel,
+    )
+
+
+def test_undeliverable_dm():
+    """Test that a 50007 is cached, mentioned in the fallback channel and skipped later."""
+
+    print("Testing Undeliverable DM Recipients...")
+
+    session = FakeSession()
+    db_client = Mock()
+    db_client.batch_check_reminders_sent.return_value = set()
+    db_client.batch_check_undeliverable_users.return_value = set()
+    service = _make_service(session, db_client)
+    users = [
+        {"id": CLOSED_DM_USER, "username": "closed"},
+        {"id": OPEN_DM_USER, "username": "open"},
+    ]
+
+    work = service._filter_unsent_reminders("42", "Office Hours", users)
+    assert service._process_reminders(work, service._auth_headers()) == []
+
+    db_client.record_undeliverable_user.assert_called_once_with(CLOSED_DM_USER)
+    print("✓ The rejected recipient was recorded in DynamoDB")
+    dm_attempts = [url for _, url in session.requests if f"9{CLOSED_DM_USER}" in url]
+    assert len(dm_attempts) == 1
+    print("✓ The rejected DM was not retried")
+    assert len(session.channel_messages) == 1
+    assert f"<@{CLOSED_DM_USER}>" in session.channel_messages[0]
+    print("✓ The user was mentioned in the fallback channel instead")
+    assert db_client.record_reminder_sent.call_count == 2
+    print("✓ Both users were recorded as reminded")
+
+    # A later run, e.g. in a new container, finds the user in DynamoDB
+    session = FakeSession()
+    db_client.batch_check_undeliverable_users.return_value = {CLOSED_DM_USER}
+    service = _make_service(session, db_client)
+    work = service._filter_unsent_reminders("43", "Workshop", users)
+    assert [reminder["user_id"] for reminder in work] == [OPEN_DM_USER]
+    assert not any(f"9{CLOSED_DM_USER}" in url for _, url in session.requests)
+    assert len(session.channel_messages) == 1
+    print("✓ Known undeliverable users are skipped up front and mentioned instead")
+
+
+def test_undeliverable_cache_expiry():
+    """Test that users who re-enable DMs are not skipped by a long-running process."""
+
+    print("\nTesting Undeliverable Cache Expiry...")
+
+    db_client = Mock()
+    db_client.batch_check_undeliverable_users.return_value = {CLOSED_DM_USER}
+    service = _make_service(FakeSession(), db_client)
+    now = time.time()
+
+    assert service._find_undeliverable_users([CLOSED_DM_USER]) == {CLOSED_DM_USER}
+    assert service._find_undeliverable_users([CLOSED_DM_USER]) == {CLOSED_DM_USER}
+    assert db_client.batch_check_undeliverable_users.call_count == 1
+    print("✓ A user read from DynamoDB is served from memory")
+
+    # The DynamoDB record expired once the user re-enabled DMs
+    db_client.batch_check_undeliverable_users.return_value = set()
+    later = now + UNDELIVERABLE_RECHECK_SECONDS + 1
+    with patch("utils.cache.time.time", return_value=later):
+        assert service._find_undeliverable_users([CLOSED_DM_USER]) == set()
+    print("✓ The user was checked in DynamoDB again after the recheck interval")
+
+    service._mark_undeliverable(
+        [
+            {
+                "event_id": "42",
+                "event_name": "Office Hours",
+                "user_id": OPEN_DM_USER,
+                "username": "open",
+            }
+        ]
+    )
+    later = now + UNDELIVERABLE_TTL_SECONDS + 1
+    with patch("utils.cache.time.time", return_value=later):
+        assert service._find_undeliverable_users([OPEN_DM_USER]) == set()
+    print("✓ A user marked by this process expires with their DynamoDB record")
+
+
+def test_no_fallback_channel():
+    """Test that undeliverable users are neither claimed nor left claimed without a fallback channel."""
+
+    print("\nTesting Undeliverable Users Without a Fallback Channel...")
+
+    session = FakeSession()
+    db_client = Mock()
+    db_client.batch_check_reminders_sent.return_value = set()
+    db_client.batch_check_undeliverable_users.return_value = {CLOSED_DM_USER}
+    db_client.claim_reminder.return_value = True
+    service = _make_service(session, db_client, fallback_channel=None)
+    users = [
+        {"id": CLOSED_DM_USER, "username": "closed"},
+        {"id": OPEN_DM_USER, "username": "open"},
+    ]
+
+    work = service._filter_unsent_reminders("42", "Office Hours", users)
+    assert [reminder["user_id"] for reminder in work] == [OPEN_DM_USER]
+    db_client.claim_reminder.assert_not_called()
+    assert session.requests == []
+    print("✓ Known undeliverable users were skipped without a claim")
+
+    # A DM rejected during the run releases its claim instead of leaving it
+    db_client.batch_check_undeliverable_users.return_value = set()
+    service = _make_service(session, db_client, fallback_channel=None)
+    work = service._filter_unsent_reminders("43", "Workshop", users)
+    assert service._process_reminders(work, service._auth_headers()) == []
+    db_client.release_reminder_claim.assert_called_once_with(
+        event_id="43", user_id=CLOSED_DM_USER, reminder_type="1h"
+    )
+    assert session.channel_messages == []
+    print("✓ The claim of a newly rejected DM was released")
+
+
+def test_error_classification():
+    """Test that only Discord error 50007 marks a user as undeliverable."""
+
+    print("\nTesting Undeliverable Error Classification...")
+
+    closed = FakeSession._response(403, {"code": 50007})
+    missing = FakeSession._response(403, {"code": 50001})
+    assert is_undeliverable_dm_error(requests.HTTPError(response=closed))
+    assert not is_undeliverable_dm_error(requests.HTTPError(response=missing))
+    assert not is_undeliverable_dm_error(ValueError("boom"))
+    print("✓ Only 50007 errors are treated as closed DMs")
+
+
+if __name__ == "__main__":
+    test_undeliverable_dm()
+    test_undeliverable_cache_expiry()
+    test_no_fallback_channel()
+    test_error_classification()
@@ -0,0 +1,128 @@
+"""
+Simple test to validate the INIT-phase warmup of the Lambda handler.
+This is a basic validation script, not a full unit test suite.
+"""
+
+import logging
+import time
+from unittest.mock import Mock, patch
+
+import lambda_handler
+from clients.parameter_store import ParameterStoreClient
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+
+def _clients():
+    ps_client = Mock()
+    ps_client.get_discord_token.return_value = "test-token"
+    ps_client.get_guild_id.return_value = "123456789012345678"
+    return ps_client, Mock()
+
+
+def _reset_globals():
+    for name in (
+        "parameter_store_client",
+        "dynamodb_client",
+        "discord_service",
+        "newsletter_service",
+        "feeds_config",
+    ):
+        setattr(lambda_handler, name, None)
+
+
+def test_warm_up():
+    """Test that warmup prepares clients, secrets, config, services and connections."""
+
+    print("Testing Warmup...")
+
+    _reset_globals()
+    ps_client, db_client = _clients()
+
+    def initialize_clients():
+        lambda_handler.parameter_store_client = ps_client
+        lambda_handler.dynamodb_client = db_client
+        return ps_client, db_client
+
+    with (
+        patch.object(lambda_handler, "initialize_clients", initialize_clients),
+        patch("services.discord.requests.Session") as session,
+    ):
+        completed = lambda_handler.warm_up(budget_ms=5000)
+
+    assert completed == [
+        "clients",
+        "secrets",
+        "dynamodb",
+        "feeds config",
+        "services",
+        "discord",
+    ]
+    print("✓ Every step completed within the budget")
+    ps_client.prefetch_parameters.assert_called_once_with(
+        lambda_handler.WARMUP_PARAMETERS
+    )
+    db_client.open_connection.assert_called_once()
+    print("✓ Secrets were prefetched and DynamoDB was connected")
+    assert lambda_handler.newsletter_service.feeds_config is lambda_handler.feeds_config
+    assert lambda_handler.feeds_config.feeds
+    print("✓ The newsletter service uses the feed config loaded at INIT")
+    assert session.return_value.head.call_count == 2
+    print("✓ Connections were opened for both Discord sessions")
+    _reset_globals()
+
+
+def test_warm_up_budget():
+    """Test that warmup stops once its budget is spent and never raises."""
+
+    print("\nTesting Warmup Budget...")
+
+    _reset_globals()
+    ps_client, db_client = _clients()
+    ps_client.prefetch_parameters.side_effect = lambda names: time.sleep(0.05)
+
+    def initialize_clients():
+        lambda_handler.parameter_store_client = ps_client
+        lambda_handler.dynamodb_client = db_client
+        return ps_client, db_client
+
+    with patch.object(lambda_handler, "initialize_clients", initialize_clients):
+        completed = lambda_handler.warm_up(budget_ms=20)
+    assert completed == ["clients", "secrets"]
+    db_client.open_connection.assert_not_called()
+    print("✓ Steps after the budget was spent were left to the first invocation")
+
+    with patch.object(
+        lambda_handler, "initialize_clients", side_effect=ValueError("no region")
+    ):
+        assert lambda_handler.warm_up() == []
+    print("✓ A failed step ends the warmup without raising")
+    _reset_globals()
+
+
+def test_prefetch_parameters():
+    """Test that prefetched parameters are served from the cache."""
+
+    print("\nTesting Parameter Prefetch...")
+
+    with patch("clients.parameter_store.create_client") as client:
+        client.return_value.get_parameters.return_value = {
+            "Parameters": [
+                {"Name": "/test/discord-token", "Value": "token"},
+                {"Name": "/test/guild-id", "Value": "42"},
+            ],
+            "InvalidParameters": [],
+        }
+        ps_client = ParameterStoreClient(prefix="/test/")
+        assert ps_client.prefetch_parameters(["discord-token", "guild-id"]) == 2
+        assert ps_client.get_discord_token() == "token"
+        assert ps_client.get_guild_id() == "42"
+        client.return_value.get_parameter.assert_not_called()
+    print("✓ Both parameters were fetched in one request and cached")
+
+
+if __name__ == "__main__":
+    test_warm_up()
+    test_warm_up_budget()
+    test_prefetch_parameters()